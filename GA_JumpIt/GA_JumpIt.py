@@ -8,483 +8,3110 @@
 #                   in a game of JumpIt.
 #--------------------------------------------------------------------------------------
 
-#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
 
 # IMPORTS------------------------------------------------------------------------------
 import sys
 import random as rng
-import copy
+import heapq
+import bisect
+import itertools
+import operator
+import concurrent.futures
+import multiprocessing
+import time
+import math
+import collections
+import functools
+import os
+import mmap
+import array
+import json
+import csv
+import hashlib
+import sqlite3
+
+# NumPy is optional. It is only required by the "numpy" population backend, so the
+# program still runs with the original list-of-lists engine when it is missing.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Numba is optional too. When it is installed, the kernels of the "numpy" backend and
+# of DP_JumpIt are compiled with it, see compiledKernels. Setting the environment
+# variable GA_JUMPIT_KERNELS to "python" keeps the pure-Python paths without even
+# importing it
+numba = None
+if os.environ.get("GA_JUMPIT_KERNELS") != "python":
+    try:
+        import numba
+    except ImportError:
+        numba = None
 #--------------------------------------------------------------------------------------
 
-#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
 
 # GLOBALS------------------------------------------------------------------------------
 rng.seed(999)           # Seed the random number generator to produce reliable results
 
-GA_cost = dict()        # A dictionary to be defined as (chromosomeID, costOfChromome)
-                        # key-value pairs
-
 GA_path = []            # Represents the indices of the tiles occupied by the
                         # calculated solution output by the GA
 
-population = [[]]       # A set of chromosomes, where each chromosome is defined as a
-                        # set of genes, which are represented by a 0 or a 1, which
-                        # represents the boolean decision to occupy or jump a tile
-                        # in the game board (occupy = 1, jump = 0)
-                        # EX: [c1=[1,0,1], c2=[1,1,1]]
+GA_min_cost = int()     # The minimum calculated cost determined by the last GA run
+
+GA_minCostID = int()    # The chromosomeID of the chromosome associated with the
+                        # minimum calculated cost of the last GA run
+
+generationCount = int() # The number of iterations of the last GA run
+
+populationBackend = "list"  # The storage used for the population. "list" keeps the
+                            # original list of lists of 0/1 ints, while "numpy"
+                            # stores the whole population as one 2-D uint8 array of
+                            # shape (populationSize, numOfGenes) so that costs,
+                            # mutations and double 0 checks can be vectorized.
+                            # "packed" stores each chromosome as one Python int
+                            # whose bit i is gene i, which is about 64 times
+                            # smaller than a list and turns the double 0 checks
+                            # and crossovers into a few bitwise operations
+
+checkpointMagic = b"GAJUMPIT"   # Starts every checkpoint of GASolver.saveCheckpoint.
+                                # It is followed by the length of a JSON header as 8
+                                # little-endian bytes, the header, and the board,
+                                # cost and changedIDs as int64s, the state of the
+                                # random number generator as uint32s and the genes,
+                                # each of them starting on a multiple of 8 bytes.
+                                # The genes are one row of ceil(numOfGenes / 8) bytes
+                                # per chromosome, gene i in bit i % 8 of byte i // 8,
+                                # so the file can be mapped and any chromosome read
+                                # in place
+
+resultFormatVersion = 2 # Part of every key of resultKey, so that raising it when the
+                        # results of solveBoard change retires the results cached on
+                        # disk by older versions
+#--------------------------------------------------------------------------------------
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# CLASS DESCRIPTION--------------------------------------------------------------------
+# Class Name:       GASolver
+# Description:      Owns all of the state of one GA run on one game board, including
+#                   its own random number generator, so that several boards can be
+#                   solved side by side in threads or worker processes. The methods
+#                   are the steps of the GA and keep the names of the original
+#                   module-level functions they replace
+#--------------------------------------------------------------------------------------
+class GASolver:
+    __slots__ = (
+        "board",                    # The game board being solved
+        "maxJump",                  # The most tiles a single move may advance. A
+                                    # genome is valid when it has no run of maxJump
+                                    # 0s, so the original game is maxJump = 2
+        "boardArray",               # The game board as a 1-D int64 array, used by
+                                    # the "numpy" backend to compute the cost of many
+                                    # chromosomes at once
+        "backend",                  # See populationBackend
+        "encoding",                 # How a chromosome encodes its path: "binary"
+                                    # (one gene per tile, see population) or
+                                    # "steps" (the lengths of its moves, which is
+                                    # always a valid path, see mutateSteps and
+                                    # crossSteps)
+        "rng",                      # The random number generator owned by the run
+        "populationSize",           # The desired size of the populations to be
+                                    # tested. Based upon the length of the board
+        "mutationRate",             # The liklihood of a mutation occurring in the
+                                    # genome of an entity in the population
+        "mutationMode",             # How the mutated genes are picked, see
+                                    # findMutationLoci: "perGene" or "skip"
+        "crossRate",                # The liklihood of 2 entities successfully
+                                    # crossing their genomes to create a new entity
+        "maxStagnantGenerations",   # Generations without improvement after which
+                                    # the GA stops
+        "maxGenerations",           # Generations after which the GA always stops
+        "selectionStrategy",        # How parents are chosen: "roulette" (fitness
+                                    # proportionate), "tournament" or "universal"
+                                    # (stochastic universal sampling)
+        "tournamentSize",           # Entities competing in each tournament
+        "eliteSize",                # The number of the cheapest chromosomes that
+                                    # findLeastFit never picks for replacement, on
+                                    # top of the one at minCostID, which it never
+                                    # picks whatever this is
+        "warmStartStrategies",      # The functions that build the seeded part of
+                                    # the initial population, see warmStart
+        "warmStartFraction",        # The fraction of the initial population built
+                                    # by warmStartStrategies instead of at random
+        "crossoverMode",            # "direct" picks the crossover point among the
+                                    # points that keep the children valid, "retry"
+                                    # tries random points until one is valid. The
+                                    # "steps" encoding always uses crossSteps
+        "crossoverCounters",        # Running totals of the crossover outcomes, see
+                                    # resetCrossoverCounters
+        "population",               # A set of chromosomes, where each chromosome is
+                                    # a set of genes represented by a 0 or a 1, the
+                                    # boolean decision to occupy or jump a tile in
+                                    # the game board (occupy = 1, jump = 0)
+                                    # EX: [c1=[1,0,1], c2=[1,1,1]]
+                                    # With the "steps" encoding a chromosome is the
+                                    # list of the tiles advanced by each move
+                                    # EX: [c1=[2], c2=[1,1]]
+        "parentPopulation",         # The buffer holding the previous generation
+                                    # while populate writes the next one into
+                                    # population. The 2 buffers are swapped every
+                                    # generation, so no chromosome is allocated
+                                    # after the first generation
+        "parentCost",               # The costs of parentPopulation
+        "parentPrefixCost",         # The prefix costs of parentPopulation
+        "parentPrefixKnown",        # Which of parentPrefixCost are up to date
+        "cost",                     # cost[chromosomeID] is the cost of the chromosome
+        "prefixCost",               # prefixCost[chromosomeID][i] is the cost of the
+                                    # first i genes of the chromosome. They are only
+                                    # calculated when needed by a crossover (see
+                                    # findPrefixCost). The array backend keeps them
+                                    # in one preallocated 2-D int64 array, and the
+                                    # list backend in one preallocated array("q")
+                                    # per chromosome, see allocateBuffers
+        "prefixKnown",              # prefixKnown[chromosomeID] is True when
+                                    # prefixCost[chromosomeID] is up to date
+        "chanceOfMating",           # The list backends' number line of
+                                    # findChanceOfMating, refilled in place every
+                                    # generation
+        "crossPoints",              # The list backend's valid crossover points of
+                                    # findValidCrossPoints, refilled in place
+        "lastOnes",                 # The list backend's nearest 1s at or below each
+                                    # gene of the 2 parents, used by
+                                    # findValidCrossPoints for maxJump > 2
+        "verifyCosts",              # Debug mode. When True, every incrementally
+                                    # updated cost is checked against a full
+                                    # recalculation
+        "fitness",                  # fitness[chromosomeID] is 1 / cost[chromosomeID]
+        "minCost",                  # The minimum calculated cost
+        "minCostID",                # The chromosomeID of the chromosome associated
+                                    # with the minimum calculated cost
+        "generationCount",          # The number of iterations of the GA
+        "numOfEvaluations",         # The number of fitness evaluations of the GA
+        "numOfMutations",           # The number of genes flipped by mutate
+        "recorder",                 # An optional GenerationRecorder, or None
+        "stoppingPolicy",           # An optional StoppingPolicy checked after every
+                                    # generation on top of the 2 limits above
+        "stopReason",               # Why the last run stopped: "maxGenerations",
+                                    # "stagnation" or the reason given by
+                                    # stoppingPolicy. None while it is running
+        "previousMin",              # The minimum cost when it last improved
+        "numTimesSameMin",          # Generations since the minimum cost improved
+        "changedIDs",               # The list of IDs that have changed since the
+                                    # last iteration
+        "genomeCacheSize",          # The number of genomes genomeCache holds, 0 to
+                                    # disable it
+        "genomeCache",              # The prefix costs of the most recently costed
+                                    # genomes by their content, from least to most
+                                    # recently used, see findCachedPrefixCost.
+                                    # None when disabled
+        "genomeCacheHits",          # Lookups in genomeCache that found the genome
+        "genomeCacheMisses",        # Lookups in genomeCache that did not
+        "checkpointFileName",       # Where evolve saves a checkpoint of the run, or
+                                    # None
+        "checkpointInterval",       # The generations between 2 checkpoints
+        "checkpointSeconds",        # The time taken by each checkpoint saved by
+                                    # the run, so the cost of checkpointing can be
+                                    # watched
+    )
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      __init__
+    # Parameters:       board(list(int))
+    #                       Use:    The game board to be solved
+    #                   populationSize(int)
+    #                       Use:    Defaults to 3 times the length of the board
+    #                   mutationRate(float), crossRate(float), mutationMode(string)
+    #                       Use:    See the slot descriptions above
+    #                   maxStagnantGenerations(float), maxGenerations(float)
+    #                       Use:    The stopping rules. Default to 7.5 and 15 times
+    #                               the population size
+    #                   backend(string)
+    #                       Use:    "list", "numpy" or "packed", see
+    #                               populationBackend
+    #                   encoding(string)
+    #                       Use:    See the slot descriptions above. "steps" needs
+    #                               the "list" backend
+    #                   selectionStrategy(string), tournamentSize(int)
+    #                       Use:    See the slot descriptions above
+    #                   eliteSize(int), genomeCacheSize(int)
+    #                       Use:    See the slot descriptions above
+    #                   crossoverMode(string), verifyCosts(bool)
+    #                       Use:    See the slot descriptions above
+    #                   warmStartStrategies(list), warmStartFraction(float)
+    #                       Use:    See the slot descriptions above. The strategies
+    #                               are functions like warmStartGreedy or the names
+    #                               of the built-in ones in warmStarts
+    #                   seed(int)
+    #                       Use:    Seeds a new random.Random owned by the solver
+    #                   randomGenerator(random.Random)
+    #                       Use:    Used instead of a new generator when given, e.g.
+    #                               to share the random module with legacy code
+    #                   recorder(GenerationRecorder)
+    #                       Use:    Receives the timings and statistics of every
+    #                               generation. None disables the instrumentation
+    #                   stoppingPolicy(StoppingPolicy)
+    #                       Use:    See the slot descriptions above
+    #                   checkpointFileName(string), checkpointInterval(int)
+    #                       Use:    See the slot descriptions above. A run resumes from
+    #                               its checkpoint with loadCheckpoint
+    #                   maxJump(int)
+    #                       Use:    See the slot descriptions above
+    #----------------------------------------------------------------------------------
+    def __init__(self, board, populationSize=None, mutationRate=0.01, crossRate=0.85,
+                 maxStagnantGenerations=None, maxGenerations=None, backend="list",
+                 selectionStrategy="roulette", tournamentSize=2, crossoverMode="direct",
+                 verifyCosts=False, seed=None, randomGenerator=None, recorder=None,
+                 warmStartStrategies=(), warmStartFraction=0.0, stoppingPolicy=None,
+                 checkpointFileName=None, checkpointInterval=100, eliteSize=1,
+                 genomeCacheSize=0, mutationMode="perGene", maxJump=2, encoding="binary"):
+        if backend not in ("list", "numpy", "packed"):
+            raise ValueError("unknown population backend: " + repr(backend))
+        if selectionStrategy not in ("roulette", "tournament", "universal"):
+            raise ValueError("unknown selection strategy: " + repr(selectionStrategy))
+        if crossoverMode not in ("direct", "retry"):
+            raise ValueError("unknown crossover mode: " + repr(crossoverMode))
+        if mutationMode not in ("perGene", "skip"):
+            raise ValueError("unknown mutation mode: " + repr(mutationMode))
+        if encoding not in ("binary", "steps"):
+            raise ValueError("unknown encoding: " + repr(encoding))
+        if encoding == "steps" and backend != "list":
+            raise ValueError("the \"steps\" encoding requires the \"list\" population backend")
+        if maxJump < 1:
+            raise ValueError("maxJump must be at least 1: " + repr(maxJump))
+        if eliteSize < 0:
+            raise ValueError("eliteSize cannot be negative: " + repr(eliteSize))
+        if backend == "numpy" and np is None:
+            raise ImportError("the \"numpy\" population backend requires numpy")
+        for strategy in warmStartStrategies:
+            if not callable(strategy) and strategy not in warmStarts:
+                raise ValueError("unknown warm start strategy: " + repr(strategy))
+
+        self.board = board.tolist() if hasattr(board, "tolist") else list(board)
+        self.boardArray = np.asarray(self.board, dtype=np.int64) if backend == "numpy" else None
+        self.maxJump = maxJump
+        self.backend = backend
+        self.encoding = encoding
+        self.rng = randomGenerator if randomGenerator is not None else rng.Random(seed)
+        self.populationSize = populationSize if populationSize is not None else 3 * len(self.board)
+        self.mutationRate = mutationRate
+        self.mutationMode = mutationMode
+        self.crossRate = crossRate
+        self.maxStagnantGenerations = maxStagnantGenerations if maxStagnantGenerations is not None else 7.5 * self.populationSize
+        self.maxGenerations = maxGenerations if maxGenerations is not None else 15 * self.populationSize
+        self.selectionStrategy = selectionStrategy
+        self.tournamentSize = tournamentSize
+        self.eliteSize = eliteSize
+        self.genomeCacheSize = genomeCacheSize
+        self.genomeCache = None
+        self.genomeCacheHits = 0
+        self.genomeCacheMisses = 0
+        self.warmStartStrategies = [warmStarts[strategy] if not callable(strategy) else strategy for strategy in warmStartStrategies]
+        self.warmStartFraction = warmStartFraction
+        self.crossoverMode = crossoverMode
+        self.recorder = recorder
+        self.stoppingPolicy = stoppingPolicy
+        self.stopReason = None
+        self.previousMin = sys.maxsize
+        self.numTimesSameMin = 0
+        self.resetCrossoverCounters()
+        self.population = []
+        self.parentPopulation = None
+        self.parentCost = None
+        self.parentPrefixCost = None
+        self.parentPrefixKnown = None
+        self.cost = []
+        self.prefixCost = []
+        self.prefixKnown = []
+        self.chanceOfMating = None
+        self.crossPoints = None
+        self.lastOnes = None
+        self.verifyCosts = verifyCosts
+        self.fitness = []
+        self.minCost = sys.maxsize
+        self.minCostID = int()
+        self.generationCount = 1
+        self.numOfEvaluations = 0
+        self.numOfMutations = 0
+        self.changedIDs = []
+        self.checkpointFileName = checkpointFileName
+        self.checkpointInterval = checkpointInterval
+        self.checkpointSeconds = []
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      checkForZeroRun
+    # Parameters:       chromosomeID(int)
+    #                       Use:    Used to grab the target chromosome from the
+    #                               population for manipulation
+    #                   geneID(int)
+    #                       Use:    The gene of reference, one of the inner genes
+    # Returns:          True if the gene, taken as a 0, would be part of a run of
+    #                   maxJump or more 0s,
+    #                   False otherwise
+    # Description:      A helper method that checks for runs of 0s too long to jump
+    #                   in a genome, given the chromosomeID and point of reference
+    #                   geneID. With maxJump = 2 this is the original check for
+    #                   repeating 0s on both sides of the gene. The first and last
+    #                   genes are 1, so the walks along the run always stop
+    #----------------------------------------------------------------------------------
+    def checkForZeroRun(self, chromosomeID, geneID):
+        genome = self.population[chromosomeID]
+        if self.backend == "packed":
+            return findZeroRunPacked(genome, geneID, self.maxJump) >= self.maxJump
+        first = geneID
+        while genome[first - 1] == 0:
+            first -= 1
+        last = geneID
+        while genome[last + 1] == 0:
+            last += 1
+        return last - first + 1 >= self.maxJump
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      allocateBuffers
+    # Parameters:       N/A
+    # Returns:          N/A
+    # Description:      Allocates the prefix costs of population and the scratch
+    #                   buffers of a generation up front, so that a generation of the
+    #                   "list" backend fills them in place instead of allocating
+    #                   anything the size of a genome or of the population. The
+    #                   prefix costs of parentPopulation are allocated with it by the
+    #                   first populate
+    #----------------------------------------------------------------------------------
+    def allocateBuffers(self):
+        numOfGenes = len(self.board)
+        if self.backend == "numpy":
+            self.prefixCost = np.zeros((self.populationSize, numOfGenes + 1), dtype=np.int64)
+        elif self.backend == "list" and self.encoding == "binary":
+            self.prefixCost = [array.array("q", bytes(8 * (numOfGenes + 1))) for chromosomeID in range(0, self.populationSize)]
+            self.crossPoints = array.array("q", bytes(8 * numOfGenes))
+            self.lastOnes = (array.array("q", bytes(8 * numOfGenes)), array.array("q", bytes(8 * numOfGenes)))
+        else:
+            self.prefixCost = [None] * self.populationSize
+        self.prefixKnown = [False] * self.populationSize
+        if self.backend != "numpy":
+            self.chanceOfMating = array.array("d", bytes(8 * self.populationSize))
+        return
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      initialize
+    # Parameters:       N/A
+    # Returns:          N/A
+    # Description:      Resets the state of the run and creates the initial population
+    #                   using random values of 0 and 1 for all genes except for the
+    #                   first and last, which must be initialized to 1 for the JumpIt
+    #                   game logic to be upheld
+    #----------------------------------------------------------------------------------
+    def initialize(self):
+        numOfGenes = len(self.board)
+        self.cost = [0] * self.populationSize
+        self.allocateBuffers()
+        self.parentPopulation = None    # Allocated by the first populate
+        self.parentCost = None
+        self.parentPrefixCost = None
+        self.parentPrefixKnown = None
+        self.fitness = [0.0] * self.populationSize
+        self.minCost = sys.maxsize
+        self.minCostID = int()
+        self.generationCount = 1
+        self.numOfEvaluations = 0
+        self.numOfMutations = 0
+        self.changedIDs = []
+        self.resetCrossoverCounters()
+        self.genomeCache = collections.OrderedDict() if self.genomeCacheSize > 0 else None
+        self.genomeCacheHits = 0
+        self.genomeCacheMisses = 0
+
+        # The array backend builds the whole population at once
+        if self.backend == "numpy":
+            self.initializeArray()
+            self.warmStart()
+            return
+        if self.encoding == "steps":
+            self.initializeSteps()
+            self.warmStart()
+            return
+
+        # Itratively generate the population
+        self.population = []
+        for i in range(0, self.populationSize):
+            self.population.append([])  # Add an entity to the population
+            numOfZeros = 0              # The length of the run of 0s being built
+            # Iteratively generate the genes of the current entity
+            for ii in range(0, numOfGenes):
+                # Check for first and last gene
+                if ii == 0 or ii == numOfGenes - 1:
+                    self.population[i].append(1)
+                # Otherwise
+                else:
+                    self.population[i].append(self.rng.randint(0, 1))
+                # Ensure no run of maxJump 0s (checked on the list being built, which
+                # is only packed afterwards by the packed backend)
+                if self.population[i][ii] == 0:
+                    numOfZeros += 1
+                    if numOfZeros == self.maxJump:
+                        self.population[i][ii] = 1
+                        numOfZeros = 0
+                else:
+                    numOfZeros = 0
+
+        # The packed backend draws exactly the same genes and then packs them
+        if self.backend == "packed":
+            self.population = [packGenes(genome) for genome in self.population]
+        self.warmStart()
+        return
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      warmStart
+    # Parameters:       N/A
+    # Returns:          N/A
+    # Description:      Replaces the first warmStartFraction of the random initial
+    #                   population with genomes built by warmStartStrategies, which
+    #                   share them as evenly as possible. A strategy is called as
+    #                   strategy(solver, numOfGenomes) and returns that many valid
+    #                   genomes as lists of 0s and 1s. The random population is drawn
+    #                   in full beforehand, so the random draws of a run without
+    #                   strategies are unchanged
+    #----------------------------------------------------------------------------------
+    def warmStart(self):
+        numOfSeeds = min(self.populationSize, int(round(self.warmStartFraction * self.populationSize)))
+        if numOfSeeds == 0 or not self.warmStartStrategies:
+            return
+
+        chromosomeID = 0
+        numOfStrategies = len(self.warmStartStrategies)
+        for strategyID, strategy in enumerate(self.warmStartStrategies):
+            numOfGenomes = numOfSeeds // numOfStrategies + (1 if strategyID < numOfSeeds % numOfStrategies else 0)
+            for genes in strategy(self, numOfGenomes):
+                if self.backend == "numpy":
+                    self.population[chromosomeID] = genes
+                elif self.backend == "packed":
+                    self.population[chromosomeID] = packGenes(genes)
+                elif self.encoding == "steps":
+                    self.population[chromosomeID] = genesToSteps(genes)
+                else:
+                    self.population[chromosomeID] = list(genes)
+                chromosomeID += 1
+        return
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      getBestGenomes
+    # Parameters:       numOfGenomes(int)
+    #                       Use:    How many genomes to return
+    # Returns:          The genomes of the numOfGenomes cheapest chromosomes, cheapest
+    #                   first, as lists of 0s and 1s
+    # Description:      Used to keep the best of a run, e.g. as JSON, and feed them to
+    #                   a later run through warmStartFromGenomes
+    #----------------------------------------------------------------------------------
+    def getBestGenomes(self, numOfGenomes):
+        bestIDs = heapq.nsmallest(numOfGenomes, range(0, self.populationSize), key=self.cost.__getitem__)
+        return [[int(gene) for gene in self.getGenes(chromosomeID)] for chromosomeID in bestIDs]
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      findEntropy
+    # Parameters:       N/A
+    # Returns:          The mean Shannon entropy, in bits, of the genes of the
+    #                   population. 1 when every gene is 0 in half of the chromosomes
+    #                   and 0 once all of the chromosomes are identical
+    # Description:      Measures the diversity left in the population. The first and
+    #                   last genes are always 1 and are left out. Costs a pass over
+    #                   every gene of the population
+    #----------------------------------------------------------------------------------
+    def findEntropy(self):
+        numOfGenes = len(self.board)
+        if numOfGenes <= 2:
+            return 0.0
+        if self.backend == "numpy":
+            ones = self.population[:, 1:-1].sum(axis=0).tolist()
+        elif self.backend == "packed":
+            ones = [sum(column) for column in zip(*(unpackGenes(genome, numOfGenes) for genome in self.population))][1:-1]
+        else:
+            ones = [sum(column) for column in zip(*map(self.getGenes, range(0, self.populationSize)))][1:-1]
+
+        entropy = 0.0
+        for numOfOnes in ones:
+            p = numOfOnes / self.populationSize
+            if 0.0 < p < 1.0:
+                entropy -= p * math.log2(p) + (1.0 - p) * math.log2(1.0 - p)
+        return entropy / len(ones)
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      initializeArray
+    # Parameters:       N/A
+    # Returns:          N/A
+    # Description:      The "numpy" backend version of the population generation done
+    #                   in initialize. The random genes are drawn in the same order as
+    #                   the list backend so a fixed seed produces the same population.
+    #                   The repair of runs of 0s is then done for every chromosome
+    #                   at once: within a run of 0s, every maxJump-th 0 (counted from
+    #                   the last 1) is turned into a 1, which is exactly what the
+    #                   gene-by-gene repair in initialize produces
+    #----------------------------------------------------------------------------------
+    def initializeArray(self):
+        numOfGenes = len(self.board)
+        population = np.ones((self.populationSize, numOfGenes), dtype=np.uint8)
+        if numOfGenes > 2:
+            draws = [self.rng.randint(0, 1) for _ in range(self.populationSize * (numOfGenes - 2))]
+            population[:, 1:-1] = np.array(draws, dtype=np.uint8).reshape(self.populationSize, numOfGenes - 2)
+
+        # Distance of each gene from the closest preceding 1 in its chromosome
+        geneIndex = np.arange(numOfGenes)
+        lastOne = np.maximum.accumulate(np.where(population == 1, geneIndex, 0), axis=1)
+        distance = geneIndex - lastOne
+        population[(distance > 0) & (distance % self.maxJump == 0)] = 1
+        self.population = population
+        return
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      initializeSteps
+    # Parameters:       N/A
+    # Returns:          N/A
+    # Description:      The "steps" encoding version of the population generation done
+    #                   in initialize. Each chromosome walks from the first tile to the
+    #                   last with moves drawn between 1 and maxJump tiles, shortened to
+    #                   land on the last tile, so nothing has to be repaired
+    #----------------------------------------------------------------------------------
+    def initializeSteps(self):
+        lastCell = len(self.board) - 1
+        self.population = []
+        for i in range(0, self.populationSize):
+            steps = []
+            cell = 0
+            while cell < lastCell:
+                reach = min(self.maxJump, lastCell - cell)
+                step = self.rng.randint(1, reach) if reach > 1 else 1
+                steps.append(step)
+                cell += step
+            self.population.append(steps)
+        return
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      mutate
+    # Parameters:       chromosomeID(int)
+    #                       Use:    Used to grab the target chromosome from the
+    #                               population for manipulation
+    # Returns:          N/A
+    # Description:      Used to simulate biological mutation in the biological
+    #                   reproductive cycle. Attempts to mutate the genes of a selected
+    #                   chromosomal genome picked by findMutationLoci
+    #----------------------------------------------------------------------------------
+    def mutate(self, chromosomeID):
+        # The array backend flips all of the selected genes with one masked XOR
+        if self.backend == "numpy":
+            self.mutateArray(chromosomeID)
+            return
+        if self.backend == "packed":
+            self.mutatePacked(chromosomeID)
+            return
+        if self.encoding == "steps":
+            self.mutateSteps(chromosomeID)
+            return
+
+        genome = self.population[chromosomeID]
+        board = self.board
+        delta = 0           # The change in cost caused by the mutations
+        numOfMutations = 0  # The number of genes flipped
+        # Attempt to mutate the genes picked by probability, in order, ignoring the
+        # first and last genes
+        for i in self.findMutationLoci(len(genome)):
+            if genome[i] == 0:
+                genome[i] = 1
+                delta += board[i]
+                numOfMutations += 1
+            else:
+                genome[i] = 0
+                # Check the run of 0s around the gene to ensure it can be jumped
+                if self.checkForZeroRun(chromosomeID, i):
+                    genome[i] = 1
+                else:
+                    delta -= board[i]
+                    numOfMutations += 1
+        self.numOfMutations += numOfMutations
+        self.addCostDelta(chromosomeID, delta, numOfMutations)
+        return
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      findMutationLoci
+    # Parameters:       numOfGenes(int)
+    #                       Use:    The length of the genome being mutated
+    # Returns:          The increasing list of the genes to attempt to mutate, each of
+    #                   the genes but the first and last being picked with a chance of
+    #                   mutationRate
+    # Description:      "perGene" draws one random number per gene, which is the
+    #                   original random stream of the GA. "skip" draws the gaps
+    #                   between the picked genes from the geometric distribution
+    #                   instead, so a genome costs about numOfGenes * mutationRate + 1
+    #                   draws rather than numOfGenes - 2
+    #----------------------------------------------------------------------------------
+    def findMutationLoci(self, numOfGenes):
+        lastLocus = numOfGenes - 2
+        if self.mutationMode == "perGene" or lastLocus < 1:
+            return [i for i in range(1, lastLocus + 1) if self.rng.random() <= self.mutationRate]
+        if self.mutationRate <= 0.0:
+            return []
+        if self.mutationRate >= 1.0:
+            return list(range(1, lastLocus + 1))
+
+        logOfMiss = math.log1p(-self.mutationRate)  # The log of the chance that a
+                                                    # gene is not picked
+        loci = []
+        i = 1 + int(math.log(1.0 - self.rng.random()) / logOfMiss)
+        while i <= lastLocus:
+            loci.append(i)
+            i += 1 + int(math.log(1.0 - self.rng.random()) / logOfMiss)
+        return loci
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      mutateArray
+    # Parameters:       chromosomeID(int)
+    #                       Use:    Used to grab the target row from the population
+    #                               array for manipulation
+    # Returns:          N/A
+    # Description:      The "numpy" backend version of mutate. The same genes are
+    #                   picked, then every selected gene with no other selected gene
+    #                   within maxJump - 1 genes is handled by one masked XOR: a 0
+    #                   always becomes a 1, and a 1 only becomes a 0 when the run of 0s
+    #                   it would join stays shorter than maxJump (when both of its
+    #                   neighbours are 1 for maxJump = 2). Selected genes closer to
+    #                   each other than that may share a run of 0s, so those (rare)
+    #                   genes are processed in order exactly like mutate does. When
+    #                   mutateKernel is compiled, it processes all of them in order
+    #----------------------------------------------------------------------------------
+    def mutateArray(self, chromosomeID):
+        genome = self.population[chromosomeID]
+        loci = self.findMutationLoci(len(genome))
+        if not loci:
+            return
+        loci = np.array(loci, dtype=np.intp)
+        if compiledKernels:
+            delta, numOfMutations = compiledKernels["mutate"](genome, loci, self.boardArray, self.maxJump)
+            self.numOfMutations += int(numOfMutations)
+            self.addCostDelta(chromosomeID, int(delta), int(numOfMutations))
+            return
+
+        # Split the selected genes into isolated ones and ones that touch another
+        isClose = np.diff(loci) < self.maxJump
+        touching = np.zeros(len(loci), dtype=bool)
+        touching[:-1] |= isClose
+        touching[1:] |= isClose
+        isolated = loci[~touching]
+
+        # Masked XOR for the isolated genes
+        if self.maxJump == 2:
+            canClear = (genome[isolated - 1] & genome[isolated + 1]) == 1
+        else:
+            canClear = findZeroRunsArray(genome, isolated, self.maxJump) < self.maxJump
+        flip = (genome[isolated] == 0) | canClear
+        flipped = isolated[flip]
+        genome[flipped] ^= 1
+        # A gene that is now 1 adds its tile to the cost, one that is now 0 removes it
+        delta = int(self.boardArray[flipped] @ (2 * genome[flipped].astype(np.int64) - 1))
+        numOfMutations = len(flipped)
+
+        # In-order processing for the rest, identical to mutate
+        for i in loci[touching]:
+            if genome[i] == 0:
+                genome[i] = 1
+                delta += self.board[i]
+                numOfMutations += 1
+            elif not self.checkForZeroRun(chromosomeID, i):
+                genome[i] = 0
+                delta -= self.board[i]
+                numOfMutations += 1
+        self.numOfMutations += numOfMutations
+        self.addCostDelta(chromosomeID, delta, numOfMutations)
+        return
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      mutatePacked
+    # Parameters:       chromosomeID(int)
+    #                       Use:    Used to grab the target chromosome from the
+    #                               population for manipulation
+    # Returns:          N/A
+    # Description:      The "packed" backend version of mutate, picking the same
+    #                   genes. A 0 always becomes a 1, and a 1 only becomes a 0 when
+    #                   findZeroRunPacked finds the run of 0s it would join shorter
+    #                   than maxJump (when the 3 bits centred on it are all 1 for
+    #                   maxJump = 2)
+    #----------------------------------------------------------------------------------
+    def mutatePacked(self, chromosomeID):
+        genome = self.population[chromosomeID]
+        board = self.board
+        delta = 0           # The change in cost caused by the mutations
+        numOfMutations = 0  # The number of genes flipped
+        for i in self.findMutationLoci(len(board)):
+            if not (genome >> i) & 1:
+                genome |= 1 << i
+                delta += board[i]
+                numOfMutations += 1
+            elif findZeroRunPacked(genome, i, self.maxJump) < self.maxJump:
+                genome ^= 1 << i
+                delta -= board[i]
+                numOfMutations += 1
+        self.population[chromosomeID] = genome
+        self.numOfMutations += numOfMutations
+        self.addCostDelta(chromosomeID, delta, numOfMutations)
+        return
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      mutateSteps
+    # Parameters:       chromosomeID(int)
+    #                       Use:    Used to grab the target chromosome from the
+    #                               population for manipulation
+    # Returns:          N/A
+    # Description:      The "steps" encoding version of mutate. Each move is picked
+    #                   with a chance of mutationRate and either split in 2 at a random
+    #                   tile, landing on one more tile, or merged with the next move
+    #                   when the two add up to at most maxJump, skipping the tile
+    #                   between them. Both keep every move between 1 and maxJump and
+    #                   the path ending on the last tile, so no mutation is ever
+    #                   undone. The picked moves are handled from the last one back, so
+    #                   the moves before them keep their tiles
+    #----------------------------------------------------------------------------------
+    def mutateSteps(self, chromosomeID):
+        steps = self.population[chromosomeID]
+        board = self.board
+        delta = 0           # The change in cost caused by the mutations
+        numOfMutations = 0  # The number of tiles added to or removed from the path
+        cells = list(itertools.accumulate(steps))   # The tile each move lands on
+        for locus in reversed(self.findMutationLoci(len(steps) + 2)):
+            stepID = locus - 1
+            step = steps[stepID]
+            canMerge = stepID + 1 < len(steps) and step + steps[stepID + 1] <= self.maxJump
+            if step > 1 and (not canMerge or self.rng.random() < 0.5):
+                firstStep = self.rng.randint(1, step - 1) if step > 2 else 1
+                steps[stepID:stepID + 1] = (firstStep, step - firstStep)
+                delta += board[cells[stepID] - step + firstStep]
+                numOfMutations += 1
+            elif canMerge:
+                steps[stepID:stepID + 2] = (step + steps[stepID + 1],)
+                delta -= board[cells[stepID]]
+                numOfMutations += 1
+        self.numOfMutations += numOfMutations
+        self.addCostDelta(chromosomeID, delta, numOfMutations)
+        return
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      testCanCross
+    # Parameters:       attemptedCrossPoint(int)
+    #                       Use:    Used as the locus of the genetic crossover event
+    #                   parent1ChromosomeID(int), parent2ChromosomeID(int)
+    #                       Use:    Used to grab the target chromosomes of the parents
+    #                               from parentPopulation
+    #                   targetChromosomeIDs((int, int))
+    #                       Use:    The tuples of chromosomalIDs of the 2 entities
+    #                               targeted for replacement
+    # Returns:          True if successfully crossed the genomes of the parents,
+    #                   False otherwise
+    # Description:      Serves as the biological cross-over equivalent. Returns
+    #                   boolean representations of the results to ensure that it can
+    #                   be used in a loop until a successful child is created.
+    #----------------------------------------------------------------------------------
+    def testCanCross(self, attemptedCrossPoint, parent1ChromosomeID, parent2ChromosomeID, targetChromosomeIDs):
+        # The array backend builds the children with slices instead of appends
+        if self.backend == "numpy":
+            return self.testCanCrossArray(attemptedCrossPoint, parent1ChromosomeID, parent2ChromosomeID, targetChromosomeIDs)
+        # The packed backend builds the children with 2 masks
+        if self.backend == "packed":
+            parent1 = self.parentPopulation[parent1ChromosomeID]
+            parent2 = self.parentPopulation[parent2ChromosomeID]
+            lowMask = (1 << attemptedCrossPoint) - 1
+            child1 = (parent1 & lowMask) | (parent2 & ~lowMask)
+            child2 = (parent2 & lowMask) | (parent1 & ~lowMask)
+            numOfGenes = len(self.board)
+            if hasZeroRunPacked(child1, numOfGenes, self.maxJump) or hasZeroRunPacked(child2, numOfGenes, self.maxJump):
+                return False
+            self.crossCost(attemptedCrossPoint, parent1ChromosomeID, parent2ChromosomeID, targetChromosomeIDs)
+            self.population[targetChromosomeIDs[0]] = child1
+            self.population[targetChromosomeIDs[1]] = child2
+            return True
+
+        parent1 = self.parentPopulation[parent1ChromosomeID]
+        parent2 = self.parentPopulation[parent2ChromosomeID]
+
+        # Initialize local children variables used to test the success of the
+        # crossover without losing the valid data in the existing population.
+        child1 = []
+        child2 = []
+
+        # Iteratively create the children based upon the parents genomes and the
+        # selected crossover point
+        for i in range(0, len(parent1)):
+            if i < attemptedCrossPoint:
+                child1.append(parent1[i])
+                child2.append(parent2[i])
+            else:
+                child1.append(parent2[i])
+                child2.append(parent1[i])
+
+        # Check the genomes of the children for runs of maxJump 0s
+        numOfZeros1 = 0
+        numOfZeros2 = 0
+        for i in range(0, len(child1)):
+            numOfZeros1 = numOfZeros1 + 1 if child1[i] == 0 else 0
+            numOfZeros2 = numOfZeros2 + 1 if child2[i] == 0 else 0
+            # If such a run is found, the crossover failed, so return False
+            if numOfZeros1 == self.maxJump or numOfZeros2 == self.maxJump:
+                return False
+        # If no such run was found, the cross succeeded, so change the
+        # genomes of the targeted chromosomes to represent the cross and return True
+        self.crossCost(attemptedCrossPoint, parent1ChromosomeID, parent2ChromosomeID, targetChromosomeIDs)
+        self.population[targetChromosomeIDs[0]][:] = child1
+        self.population[targetChromosomeIDs[1]][:] = child2
+        return True
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      testCanCrossArray
+    # Parameters:       See testCanCross
+    # Returns:          True if successfully crossed the genomes of the parents,
+    #                   False otherwise
+    # Description:      The "numpy" backend version of testCanCross. The children are
+    #                   built from 2 slices of the parents and checked for runs of
+    #                   0s with hasZeroRunArray (or zeroRunKernel when it is compiled)
+    #                   instead of gene by gene
+    #----------------------------------------------------------------------------------
+    def testCanCrossArray(self, attemptedCrossPoint, parent1ChromosomeID, parent2ChromosomeID, targetChromosomeIDs):
+        parent1 = self.parentPopulation[parent1ChromosomeID]
+        parent2 = self.parentPopulation[parent2ChromosomeID]
+        children = np.empty((2, len(parent1)), dtype=np.uint8)
+        children[0, :attemptedCrossPoint] = parent1[:attemptedCrossPoint]
+        children[0, attemptedCrossPoint:] = parent2[attemptedCrossPoint:]
+        children[1, :attemptedCrossPoint] = parent2[:attemptedCrossPoint]
+        children[1, attemptedCrossPoint:] = parent1[attemptedCrossPoint:]
+
+        if compiledKernels:
+            hasZeroRun = compiledKernels["zeroRun"](children, self.maxJump)
+        else:
+            hasZeroRun = hasZeroRunArray(children, self.maxJump).any()
+        if hasZeroRun:
+            return False
+        self.crossCost(attemptedCrossPoint, parent1ChromosomeID, parent2ChromosomeID, targetChromosomeIDs)
+        self.population[targetChromosomeIDs[0]] = children[0]
+        self.population[targetChromosomeIDs[1]] = children[1]
+        return True
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      resetCrossoverCounters
+    # Parameters:       N/A
+    # Returns:          N/A
+    # Description:      Zeroes crossoverCounters, a dictionary with the keys
+    #                   "crossovers"        the number of successful crossovers
+    #                   "clones"            the number of crossovers that found no
+    #                                       valid point, leaving the children as
+    #                                       clones of the parents
+    #                   "wastedAttempts"    "retry" mode: the number of rejected
+    #                                       crossover points
+    #                   "expectedWasted"    "direct" mode: the number of rejected
+    #                                       points the "retry" mode would have been
+    #                                       expected to try for the same parents
+    #----------------------------------------------------------------------------------
+    def resetCrossoverCounters(self):
+        self.crossoverCounters = {"crossovers": 0, "clones": 0, "wastedAttempts": 0, "expectedWasted": 0.0}
+        return
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      findValidCrossPoints
+    # Parameters:       genome1, genome2
+    #                       Use:    The genomes of the parents
+    # Returns:          The increasing crossover points in 1 to numOfGenes - 2 at
+    #                   which crossing the 2 genomes creates no run of maxJump 0s. The
+    #                   list backend returns them as a view of crossPoints, valid until
+    #                   the next call, and the packed backend as an int whose bit p is
+    #                   set for each valid point p
+    # Description:      Both parents are valid, so a cut at point p can only create a
+    #                   run of maxJump 0s across the cut itself: the 0s ending one
+    #                   parent before gene p followed by the 0s starting the other at
+    #                   gene p. For maxJump = 2 those are gene p - 1 of one parent and
+    #                   gene p of the other. Otherwise the list and numpy backends
+    #                   compare the nearest 1s of the parents on both sides of each
+    #                   point, and the packed backend ANDs shifted copies of the 0s,
+    #                   which only takes as many steps as the longest run of 0s. All
+    #                   points are checked in a single pass, by crossPointsKernel for
+    #                   the numpy backend when it is compiled
+    #----------------------------------------------------------------------------------
+    def findValidCrossPoints(self, genome1, genome2):
+        lastPoint = len(self.board) - 2
+        maxJump = self.maxJump
+
+        if self.backend == "packed":
+            allGenes = (1 << len(self.board)) - 1
+            zeros1 = ~genome1 & allGenes
+            zeros2 = ~genome2 & allGenes
+            invalid = 0
+            for zerosBelow, zerosAbove in ((zeros1, zeros2), (zeros2, zeros1)):
+                # Bit x of runEnds[t - 1] is set when genes x - t + 1 to x are all 0s
+                # of zerosBelow, and bit x of runStarts[t - 1] when genes x to
+                # x + t - 1 are all 0s of zerosAbove
+                runEnds = [zerosBelow]
+                while len(runEnds) < maxJump - 1 and runEnds[-1]:
+                    runEnds.append(runEnds[-1] & (zerosBelow << len(runEnds)))
+                runStarts = [zerosAbove]
+                while len(runStarts) < maxJump - 1 and runStarts[-1]:
+                    runStarts.append(runStarts[-1] & (zerosAbove >> len(runStarts)))
+                # Point p is invalid when t 0s end below it and maxJump - t start at it
+                for t in range(max(1, maxJump - len(runStarts)), min(len(runEnds), maxJump - 1) + 1):
+                    invalid |= (runEnds[t - 1] << 1) & runStarts[maxJump - t - 1]
+            allPoints = ((1 << (lastPoint + 1)) - 1) & ~1
+            return allPoints & ~invalid
+
+        if self.backend == "numpy":
+            if compiledKernels:
+                return compiledKernels["crossPoints"](genome1, genome2, maxJump).tolist()
+            if maxJump != 2:
+                lastOne1, nextOne1 = findNearestOnes(genome1)
+                lastOne2, nextOne2 = findNearestOnes(genome2)
+                moves = np.maximum(nextOne2[1:lastPoint + 1] - lastOne1[:lastPoint], nextOne1[1:lastPoint + 1] - lastOne2[:lastPoint])
+                return (np.flatnonzero(moves <= maxJump) + 1).tolist()
+            zeros1 = genome1 == 0
+            zeros2 = genome2 == 0
+            invalid = (zeros1[:lastPoint] & zeros2[1:lastPoint + 1]) | (zeros2[:lastPoint] & zeros1[1:lastPoint + 1])
+            return (np.flatnonzero(~invalid) + 1).tolist()
+
+        # The list backend writes the points into crossPoints and returns a view of
+        # them, so no list of points is allocated
+        crossPoints = self.crossPoints
+        numOfValidPoints = 0
+        if maxJump != 2:
+            # The nearest 1s below each point are found going up, and the nearest 1s
+            # at or above it going down, so the points are written from the end
+            lastOne1, lastOne2 = self.lastOnes
+            one1 = one2 = 0
+            for geneID in range(0, lastPoint):
+                if genome1[geneID] == 1:
+                    one1 = geneID
+                if genome2[geneID] == 1:
+                    one2 = geneID
+                lastOne1[geneID] = one1
+                lastOne2[geneID] = one2
+            nextOne1 = nextOne2 = lastPoint + 1     # The last gene is always 1
+            end = len(crossPoints)
+            for point in range(lastPoint, 0, -1):
+                if genome1[point] == 1:
+                    nextOne1 = point
+                if genome2[point] == 1:
+                    nextOne2 = point
+                if nextOne2 - lastOne1[point - 1] <= maxJump and nextOne1 - lastOne2[point - 1] <= maxJump:
+                    numOfValidPoints += 1
+                    crossPoints[end - numOfValidPoints] = point
+            return memoryview(crossPoints)[end - numOfValidPoints:]
+        for point in range(1, lastPoint + 1):
+            if (genome1[point - 1] == 0 and genome2[point] == 0) or (genome2[point - 1] == 0 and genome1[point] == 0):
+                continue
+            crossPoints[numOfValidPoints] = point
+            numOfValidPoints += 1
+        return memoryview(crossPoints)[:numOfValidPoints]
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      crossDirect
+    # Parameters:       parent1ChromosomeID(int), parent2ChromosomeID(int)
+    #                       Use:    Used to grab the genomes of the parents from
+    #                               parentPopulation
+    #                   targetChromosomeIDs((int, int))
+    #                       Use:    The 2 entities that currently hold clones of the
+    #                               parents and receive the children
+    # Returns:          True if the genomes were crossed,
+    #                   False if no valid point exists and the clones are kept
+    # Description:      The "direct" crossover. A point is drawn from the valid points
+    #                   only, so no attempt is ever rejected, and the children are
+    #                   created by overwriting the tails of the 2 clones in place
+    #                   with the tails of the other parent
+    #----------------------------------------------------------------------------------
+    def crossDirect(self, parent1ChromosomeID, parent2ChromosomeID, targetChromosomeIDs):
+        parent1 = self.parentPopulation[parent1ChromosomeID]
+        parent2 = self.parentPopulation[parent2ChromosomeID]
+        validPoints = self.findValidCrossPoints(parent1, parent2)
+        if self.backend == "packed":
+            numOfValidPoints = validPoints.bit_count()
+        else:
+            numOfValidPoints = len(validPoints)
+
+        # Record what the "retry" mode would have wasted on the same parents: the
+        # number of rejections before a success, capped at populationSize attempts
+        numOfPoints = len(self.board) - 2
+        if numOfPoints > 0:
+            failureRate = 1.0 - numOfValidPoints / numOfPoints
+            if failureRate >= 1.0:
+                self.crossoverCounters["expectedWasted"] += self.populationSize
+            else:
+                self.crossoverCounters["expectedWasted"] += failureRate * (1.0 - failureRate ** self.populationSize) / (1.0 - failureRate)
+
+        if numOfValidPoints == 0:
+            self.crossoverCounters["clones"] += 1
+            return False
+
+        choice = self.rng.randrange(numOfValidPoints)
+        if self.backend == "packed":
+            point = findSetBit(validPoints, choice)
+        else:
+            point = validPoints[choice]
+        self.crossCost(point, parent1ChromosomeID, parent2ChromosomeID, targetChromosomeIDs)
+        if self.backend == "packed":
+            lowMask = (1 << point) - 1
+            self.population[targetChromosomeIDs[0]] = (parent1 & lowMask) | (parent2 & ~lowMask)
+            self.population[targetChromosomeIDs[1]] = (parent2 & lowMask) | (parent1 & ~lowMask)
+        elif self.backend == "numpy":
+            self.population[targetChromosomeIDs[0]][point:] = parent2[point:]
+            self.population[targetChromosomeIDs[1]][point:] = parent1[point:]
+        else:
+            # Gene by gene, as a slice of the tail would be a copy of it, see
+            # copyChromosome
+            child1 = self.population[targetChromosomeIDs[0]]
+            child2 = self.population[targetChromosomeIDs[1]]
+            for geneID in range(point, len(parent1)):
+                child1[geneID] = parent2[geneID]
+                child2[geneID] = parent1[geneID]
+        self.crossoverCounters["crossovers"] += 1
+        return True
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      crossSteps
+    # Parameters:       parent1ChromosomeID(int), parent2ChromosomeID(int)
+    #                       Use:    Used to grab the genomes of the parents from
+    #                               parentPopulation
+    #                   targetChromosomeIDs((int, int))
+    #                       Use:    The 2 entities that currently hold clones of the
+    #                               parents and receive the children
+    # Returns:          True if the genomes were crossed,
+    #                   False if the parents share no inner tile and the clones are
+    #                   kept
+    # Description:      The "steps" encoding crossover, used whatever crossoverMode is.
+    #                   The paths of the parents are walked together to find the
+    #                   inner tiles both of them land on, with the cost of each parent
+    #                   up to that tile. The children swap the moves after one of
+    #                   these tiles drawn at random, so both are valid paths and cost
+    #                   one parent's prefix plus the other parent's suffix
+    #----------------------------------------------------------------------------------
+    def crossSteps(self, parent1ChromosomeID, parent2ChromosomeID, targetChromosomeIDs):
+        parent1 = self.parentPopulation[parent1ChromosomeID]
+        parent2 = self.parentPopulation[parent2ChromosomeID]
+        board = self.board
+        lastCell = len(board) - 1
+
+        crossings = []      # The moves taken by each parent and their costs up to
+                            # each shared inner tile
+        stepID1 = stepID2 = 0
+        cell1 = cell2 = 0
+        prefix1 = prefix2 = board[0]
+        while True:
+            if cell1 < cell2:
+                cell1 += parent1[stepID1]
+                stepID1 += 1
+                prefix1 += board[cell1]
+            elif cell2 < cell1:
+                cell2 += parent2[stepID2]
+                stepID2 += 1
+                prefix2 += board[cell2]
+            elif cell1 == lastCell:
+                break
+            else:
+                if cell1 > 0:
+                    crossings.append((stepID1, stepID2, prefix1, prefix2))
+                cell1 += parent1[stepID1]
+                stepID1 += 1
+                prefix1 += board[cell1]
+
+        if not crossings:
+            self.crossoverCounters["clones"] += 1
+            return False
+
+        stepID1, stepID2, prefix1, prefix2 = crossings[self.rng.randrange(len(crossings))]
+        cost1 = self.parentCost[parent1ChromosomeID]
+        cost2 = self.parentCost[parent2ChromosomeID]
+        self.cost[targetChromosomeIDs[0]] = prefix1 + cost2 - prefix2
+        self.cost[targetChromosomeIDs[1]] = prefix2 + cost1 - prefix1
+        self.prefixKnown[targetChromosomeIDs[0]] = False
+        self.prefixKnown[targetChromosomeIDs[1]] = False
+        self.population[targetChromosomeIDs[0]][stepID1:] = parent2[stepID2:]
+        self.population[targetChromosomeIDs[1]][stepID2:] = parent1[stepID1:]
+        self.crossoverCounters["crossovers"] += 1
+        return True
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      copyChromosome
+    # Parameters:       sourceID(int)
+    #                       Use:    The chromosome of parentPopulation to copy
+    #                   targetID(int)
+    #                       Use:    The chromosome of population to overwrite
+    # Returns:          N/A
+    # Description:      Copies a genome from the parent buffer into the existing
+    #                   chromosome of the other buffer in place (a row assignment for
+    #                   the array backend) instead of a deep copy. The
+    #                   cost and known prefix costs are copied too, into the prefix
+    #                   cost buffer of the target
+    #----------------------------------------------------------------------------------
+    def copyChromosome(self, sourceID, targetID):
+        if self.backend != "list":
+            # Rows are copied by assignment and packed ints are immutable
+            self.population[targetID] = self.parentPopulation[sourceID]
+        elif self.encoding == "steps":
+            self.population[targetID][:] = self.parentPopulation[sourceID]
+        else:
+            # Gene by gene, as a slice assignment allocates a buffer of the genes it
+            # replaces
+            source = self.parentPopulation[sourceID]
+            target = self.population[targetID]
+            for geneID in range(0, len(source)):
+                target[geneID] = source[geneID]
+        self.cost[targetID] = self.parentCost[sourceID]
+        self.prefixKnown[targetID] = self.parentPrefixKnown[sourceID]
+        if self.prefixKnown[targetID]:
+            self.prefixCost[targetID][:] = self.parentPrefixCost[sourceID]
+        return
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      swapPopulations
+    # Parameters:       staleIDs(iterable(int))
+    #                       Use:    The chromosomes that were changed by the last
+    #                               generation and survive into the next one
+    # Returns:          N/A
+    # Description:      Makes the current generation the parent generation and reuses
+    #                   the other buffer for the next one. Only the chromosomes
+    #                   changed by the last generation differ between the 2 buffers,
+    #                   so only those survivors are copied and a generation costs
+    #                   O(changes) instead of a copy of the whole population. The
+    #                   buffers are allocated the first time this is called
+    #----------------------------------------------------------------------------------
+    def swapPopulations(self, staleIDs):
+        if self.parentPopulation is None:
+            if self.backend == "numpy":
+                self.parentPopulation = self.population.copy()
+            elif self.backend == "packed":
+                self.parentPopulation = self.population[:]
+            else:
+                self.parentPopulation = [genome[:] for genome in self.population]
+            self.parentCost = self.cost[:]
+            if self.backend == "numpy":
+                self.parentPrefixCost = self.prefixCost.copy()
+            else:
+                self.parentPrefixCost = [prefixCost if prefixCost is None else prefixCost[:] for prefixCost in self.prefixCost]
+            self.parentPrefixKnown = self.prefixKnown[:]
+            staleIDs = ()
+
+        self.population, self.parentPopulation = self.parentPopulation, self.population
+        self.cost, self.parentCost = self.parentCost, self.cost
+        self.prefixCost, self.parentPrefixCost = self.parentPrefixCost, self.prefixCost
+        self.prefixKnown, self.parentPrefixKnown = self.parentPrefixKnown, self.prefixKnown
+
+        for chromosomeID in staleIDs:
+            self.copyChromosome(chromosomeID, chromosomeID)
+        return
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      mate
+    # Parameters:       parent1ChromosomeID(int), parent2ChromosomeID(int)
+    #                       Use:    Used to grab the chromosomes of the parents from
+    #                               parentPopulation
+    #                   targetChromosomeIDs((int, int))
+    #                       Use:    The tuples of chromosomalIDs of the 2 entities
+    #                               targeted for replacement in population
+    # Returns:          N/A
+    # Description:      Mates the 2 parent chromosomes and replaces the chromosomes of
+    #                   the selected less-fit entites with the result of the mating
+    #                   process. The children are written in place into the existing
+    #                   chromosomes of population
+    #----------------------------------------------------------------------------------
+    def mate(self, parent1ChromosomeID, parent2ChromosomeID, targetChromosomeIDs):
+        # Reassign the values of the targeted, less-fit genomes to the values of the
+        # more-fit parents. These values will be used if probability decides not to
+        # cross the genomes of the parents
+        for parentID, targetID in ((parent1ChromosomeID, targetChromosomeIDs[0]), (parent2ChromosomeID, targetChromosomeIDs[1])):
+            self.copyChromosome(parentID, targetID)
+        if self.recorder is not None:
+            self.recorder.lap("copyChromosome")
+
+        # Generate a random float value between 0 and 1 and use it to decide whether
+        # or not to cross the genomes of the parents
+        if self.rng.random() <= self.crossRate:
+            if self.encoding == "steps":
+                self.crossSteps(parent1ChromosomeID, parent2ChromosomeID, targetChromosomeIDs)
+            elif self.crossoverMode == "direct":
+                self.crossDirect(parent1ChromosomeID, parent2ChromosomeID, targetChromosomeIDs)
+            else:
+                canCross = False    # Assume you cannot cross until proven otherwise
+                crossAttempts = 0   # Attempts to cross
+                # Until the genomes are successfully crossed or the maximum number of
+                # attempts have been made, try to cross them
+                while not canCross and crossAttempts < self.populationSize:
+                    # Randomly select a locus for the crossover point
+                    selectedCrossPoint = self.rng.randint(1, len(self.board) - 2)
+                    # Attempt the crossover
+                    canCross = self.testCanCross(selectedCrossPoint, parent1ChromosomeID, parent2ChromosomeID, targetChromosomeIDs)
+                    crossAttempts += 1
+                    if not canCross:
+                        self.crossoverCounters["wastedAttempts"] += 1
+                if canCross:
+                    self.crossoverCounters["crossovers"] += 1
+                else:
+                    self.crossoverCounters["clones"] += 1
+        if self.recorder is not None:
+            self.recorder.lap("crossover")
+
+        # Attempt to mutate the new entities
+        self.mutate(targetChromosomeIDs[0])
+        self.mutate(targetChromosomeIDs[1])
+        if self.recorder is not None:
+            self.recorder.lap("mutate")
+        return
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      calcFitness
+    # Parameters:       chromosomeID(int)
+    #                       Use:    Used to grab the target chromosome's cost
+    # Returns:          N/A
+    # Description:      Calculates the fitness of the entity as 1 / cost and stores it
+    #                   in the fitness list
+    #----------------------------------------------------------------------------------
+    def calcFitness(self, chromosomeID):
+        self.fitness[chromosomeID] = 1.0 / self.cost[chromosomeID]
+        return
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      calcCost
+    # Parameters:       chromosomeID(int)
+    #                       Use:    Used to grab the target chromosome from the
+    #                               population for manipulation
+    # Returns:          N/A
+    # Description:      Determines the cost associated with the genome of the entity
+    #                   identified by the chromosomeID and stores it in the cost list
+    #----------------------------------------------------------------------------------
+    def calcCost(self, chromosomeID):
+        genome = self.getGenes(chromosomeID)
+        board = self.board
+        cost = 0
+
+        # Iterate through the genes of the selected entity and calculate the cost
+        # based upon the cost of each visited tile
+        for geneID in range(0, len(genome)):
+            # If the tile is to be visited, add the cost of the tile to the genome cost
+            if genome[geneID] == 1:
+                cost += board[geneID]
+        self.cost[chromosomeID] = cost
+        self.prefixKnown[chromosomeID] = False
+        return
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      findPrefixCost
+    # Parameters:       chromosomeID(int)
+    #                       Use:    The chromosome of parentPopulation whose prefix
+    #                               costs are needed
+    # Returns:          A sequence of numOfGenes + 1 values where entry i is the cost
+    #                   of the first i genes of the chromosome
+    # Description:      Builds the prefix costs of a chromosome the first time they
+    #                   are needed after its genome changed, and reuses them for every
+    #                   later crossover of the same genome (and of its clones), and
+    #                   of any other chromosome with the same genes through
+    #                   genomeCache. The prefix costs are written into the buffer of
+    #                   the chromosome, so only genomeCache allocates. Not used by the
+    #                   packed backend, see crossCost
+    #----------------------------------------------------------------------------------
+    def findPrefixCost(self, chromosomeID):
+        if not self.parentPrefixKnown[chromosomeID]:
+            genome = self.parentPopulation[chromosomeID]
+            key, prefixCost = self.findCachedPrefixCost(genome) if self.genomeCache is not None else (None, None)
+            if self.backend == "numpy":
+                if prefixCost is not None:
+                    self.parentPrefixCost[chromosomeID] = prefixCost
+                else:
+                    # Filled in place, entry 0 is always 0
+                    prefixCost = self.parentPrefixCost[chromosomeID, 1:]
+                    np.multiply(genome, self.boardArray, out=prefixCost)
+                    np.cumsum(prefixCost, out=prefixCost)
+                    if key is not None:
+                        self.cachePrefixCost(key, self.parentPrefixCost[chromosomeID].copy())
+            elif prefixCost is not None:
+                self.parentPrefixCost[chromosomeID][:] = prefixCost
+            else:
+                # Filled in place, entry 0 is always 0
+                prefixCost = self.parentPrefixCost[chromosomeID]
+                board = self.board
+                total = 0
+                for geneID in range(0, len(genome)):
+                    if genome[geneID] == 1:
+                        total += board[geneID]
+                    prefixCost[geneID + 1] = total
+                if key is not None:
+                    self.cachePrefixCost(key, prefixCost[:])
+            self.parentPrefixKnown[chromosomeID] = True
+        return self.parentPrefixCost[chromosomeID]
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      findCachedPrefixCost
+    # Parameters:       genome(list(int), numpy.ndarray or int)
+    #                       Use:    A genome in the format of the backend
+    # Returns:          A tuple of the key of the genome in genomeCache and its cached
+    #                   prefix costs, or None if they are not cached
+    # Description:      After convergence most of the children are copies of genomes
+    #                   that were costed before, so their prefix costs, and with them
+    #                   their cost, are looked up by content before being built again.
+    #                   The key is the genes as bytes, or the packed int itself
+    #----------------------------------------------------------------------------------
+    def findCachedPrefixCost(self, genome):
+        if self.backend == "numpy":
+            key = genome.tobytes()
+        elif self.backend == "packed":
+            key = genome
+        else:
+            key = bytes(genome)
+        prefixCost = self.genomeCache.get(key)
+        if prefixCost is None:
+            self.genomeCacheMisses += 1
+        else:
+            self.genomeCache.move_to_end(key)
+            self.genomeCacheHits += 1
+        return key, prefixCost
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      cachePrefixCost
+    # Parameters:       key(bytes or int)
+    #                       Use:    The key returned by findCachedPrefixCost
+    #                   prefixCost(sequence(int))
+    #                       Use:    The prefix costs of the genome, never changed in
+    #                               place afterwards
+    # Returns:          N/A
+    # Description:      Stores the prefix costs as the most recently used ones,
+    #                   evicting the least recently used ones beyond genomeCacheSize
+    #----------------------------------------------------------------------------------
+    def cachePrefixCost(self, key, prefixCost):
+        self.genomeCache[key] = prefixCost
+        if len(self.genomeCache) > self.genomeCacheSize:
+            self.genomeCache.popitem(last=False)
+        return
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      findPackedPrefixCost
+    # Parameters:       genome(int)
+    #                       Use:    A packed genome
+    # Returns:          The prefix costs of the genome as an array, built on a miss
+    #                   of genomeCache
+    #----------------------------------------------------------------------------------
+    def findPackedPrefixCost(self, genome):
+        key, prefixCost = self.findCachedPrefixCost(genome)
+        if prefixCost is None:
+            genes = unpackGenes(genome, len(self.board))
+            prefixCost = array.array("q", itertools.accumulate(map(operator.mul, genes, self.board), initial=0))
+            self.cachePrefixCost(key, prefixCost)
+        return prefixCost
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      crossCost
+    # Parameters:       crossPoint(int)
+    #                       Use:    The locus of the crossover
+    #                   parent1ChromosomeID(int), parent2ChromosomeID(int)
+    #                       Use:    The chromosomes holding the parents' genomes
+    #                   targetChromosomeIDs((int, int))
+    #                       Use:    The 2 entities that receive the children
+    # Returns:          N/A
+    # Description:      Sets the costs of the children of a crossover in O(1) from the
+    #                   prefix costs of the parents: a child costs the prefix of one
+    #                   parent plus the suffix (total minus prefix) of the other. Must
+    #                   be called before the children are written
+    #----------------------------------------------------------------------------------
+    def crossCost(self, crossPoint, parent1ChromosomeID, parent2ChromosomeID, targetChromosomeIDs):
+        if self.backend == "packed" and self.genomeCache is not None:
+            prefix1 = self.findPackedPrefixCost(self.parentPopulation[parent1ChromosomeID])[crossPoint]
+            prefix2 = self.findPackedPrefixCost(self.parentPopulation[parent2ChromosomeID])[crossPoint]
+        elif self.backend == "packed":
+            # Keeping the prefix costs of every chromosome would take more memory than
+            # the packed genomes themselves, so without genomeCache the 2 prefixes are
+            # summed from the genomes instead
+            prefix1 = sumPackedTiles(self.parentPopulation[parent1ChromosomeID], self.board, crossPoint)
+            prefix2 = sumPackedTiles(self.parentPopulation[parent2ChromosomeID], self.board, crossPoint)
+        else:
+            prefix1 = int(self.findPrefixCost(parent1ChromosomeID)[crossPoint])
+            prefix2 = int(self.findPrefixCost(parent2ChromosomeID)[crossPoint])
+        cost1 = self.parentCost[parent1ChromosomeID]
+        cost2 = self.parentCost[parent2ChromosomeID]
+        self.cost[targetChromosomeIDs[0]] = prefix1 + cost2 - prefix2
+        self.cost[targetChromosomeIDs[1]] = prefix2 + cost1 - prefix1
+        self.prefixKnown[targetChromosomeIDs[0]] = False
+        self.prefixKnown[targetChromosomeIDs[1]] = False
+        return
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      addCostDelta
+    # Parameters:       chromosomeID(int)
+    #                       Use:    The chromosome whose genes were flipped
+    #                   delta(int)
+    #                       Use:    The sum of the tiles flipped to 1 minus the sum of
+    #                               the tiles flipped to 0
+    #                   numOfMutations(int)
+    #                       Use:    The number of genes flipped
+    # Returns:          N/A
+    # Description:      Updates the cost of a mutated chromosome in O(1) per flipped
+    #                   gene instead of recalculating it. The prefix costs are out of
+    #                   date once any gene is flipped, even when flips of tiles of
+    #                   equal cost leave the cost itself unchanged
+    #----------------------------------------------------------------------------------
+    def addCostDelta(self, chromosomeID, delta, numOfMutations):
+        if numOfMutations > 0:
+            self.cost[chromosomeID] += delta
+            self.prefixKnown[chromosomeID] = False
+        return
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      checkCosts
+    # Parameters:       chromosomeIDs(iterable(int))
+    #                       Use:    The chromosomes whose costs were updated
+    # Returns:          N/A
+    # Description:      The verifyCosts debug check. Recalculates the selected costs
+    #                   in full and raises a RuntimeError if any incrementally updated
+    #                   cost differs
+    #----------------------------------------------------------------------------------
+    def checkCosts(self, chromosomeIDs):
+        for chromosomeID in chromosomeIDs:
+            expectedCost = 0
+            for gene, tile in zip(self.getGenes(chromosomeID), self.board):
+                if gene == 1:
+                    expectedCost += tile
+            if expectedCost != self.cost[chromosomeID]:
+                raise RuntimeError("incremental cost of chromosome %d is %d, expected %d" % (chromosomeID, self.cost[chromosomeID], expectedCost))
+        return
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      calcCostArray
+    # Parameters:       chromosomeIDs(iterable(int))
+    #                       Use:    The IDs of the rows of the population array whose
+    #                               cost needs to be (re)calculated
+    # Returns:          N/A
+    # Description:      The "numpy" backend version of calcCost. The costs of all of
+    #                   the selected chromosomes are calculated with one matrix-vector
+    #                   product of their genes against the game board, or by
+    #                   costKernel when it is compiled
+    #----------------------------------------------------------------------------------
+    def calcCostArray(self, chromosomeIDs):
+        chromosomeIDs = np.fromiter(chromosomeIDs, dtype=np.intp)
+        if chromosomeIDs.size == 0:
+            return
+        if compiledKernels:
+            costs = compiledKernels["cost"](self.population, chromosomeIDs, self.boardArray)
+        else:
+            costs = self.population[chromosomeIDs] @ self.boardArray
+        for chromosomeID, cost in zip(chromosomeIDs.tolist(), costs.tolist()):
+            self.cost[chromosomeID] = cost
+            self.prefixKnown[chromosomeID] = False
+        return
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      findEliteIDs
+    # Parameters:       N/A
+    # Returns:          A set of the chromosomalIDs that may not be replaced
+    # Description:      The chromosome at minCostID and the eliteSize cheapest
+    #                   chromosomes, ties broken by the lowest ID. Used by
+    #                   findLeastFit and immigrate so neither replaces the elite
+    #----------------------------------------------------------------------------------
+    def findEliteIDs(self):
+        eliteIDs = {self.minCostID}
+        if self.eliteSize > 0:
+            eliteIDs.update(heapq.nsmallest(self.eliteSize, range(0, self.populationSize), key=self.cost.__getitem__))
+        return eliteIDs
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      findLeastFit
+    # Parameters:       numToReplace(int)
+    #                       Use:    How many of the least fit entities are wanted, at
+    #                               most half of the population
+    # Returns:          leastFitIDs where leastFitIDs is defined as a sorted list of
+    #                   unique chromosomalIDs representing the least fit entities of
+    #                   the current population in consideration
+    # Description:      Determines the chromosomalIDs of the numToReplace least fit
+    #                   entities of the population, rounded down to an even number.
+    #                   The IDs are the highest costs, ties broken by the lowest ID,
+    #                   and are selected with heaps of numToReplace and eliteSize
+    #                   entries, so a generation costs O(n log numToReplace) rather
+    #                   than a sort of the population. The chromosome at minCostID
+    #                   and the elite (see eliteSize) are left out, as otherwise a
+    #                   population of equal costs could overwrite the chromosome
+    #                   holding minCost and leave getPath describing a genome that no
+    #                   longer exists
+    #----------------------------------------------------------------------------------
+    def findLeastFit(self, numToReplace):
+        numOfLosers = int(self.populationSize / 2)  # How many entities to keep
+
+        # Make sure the number of entities to be kept is even for easier logic
+        if numOfLosers % 2 != 0:
+            numOfLosers += 1
+
+        eliteIDs = self.findEliteIDs()
+
+        # The rest may be replaced, in pairs
+        numToReplace = min(numToReplace, self.populationSize - numOfLosers, self.populationSize - len(eliteIDs))
+        numToReplace -= numToReplace % 2
+
+        candidateIDs = (chromosomeID for chromosomeID in range(0, self.populationSize) if chromosomeID not in eliteIDs)
+        leastFitIDs = heapq.nlargest(numToReplace, candidateIDs, key=self.cost.__getitem__)
+
+        # Sort the determined list for easier logic and return the newly sorted list
+        leastFitIDs.sort()
+        return leastFitIDs
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      findChanceOfMating
+    # Parameters:       N/A
+    # Returns:          chanceOfMating where chanceOfMating[chromosomeID] is the end
+    #                   point of the entity's range on the roulette wheel, i.e. the
+    #                   cumulative fitness of the entities 0 to chromosomeID
+    # Description:      Calculates the number line used by the roulette wheel approach
+    #                   to reproduction. It is built once per generation so that each
+    #                   parent can then be found with a binary search. The list
+    #                   backends refill the same array every generation
+    #----------------------------------------------------------------------------------
+    def findChanceOfMating(self):
+        if self.backend == "numpy":
+            return np.cumsum(self.fitness)
+        chanceOfMating = self.chanceOfMating
+        total = 0.0
+        for chromosomeID in range(0, self.populationSize):
+            total += self.fitness[chromosomeID]
+            chanceOfMating[chromosomeID] = total
+        return chanceOfMating
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      selectParents
+    # Parameters:       numOfParents(int)
+    #                       Use:    How many parents to draw for the generation
+    # Returns:          A list of numOfParents chromosomeIDs, where consecutive pairs
+    #                   are mated together
+    # Description:      Draws all of the parents of a generation in one batch using
+    #                   the solver's selectionStrategy
+    #----------------------------------------------------------------------------------
+    def selectParents(self, numOfParents):
+        if numOfParents == 0:
+            return []
+        if self.selectionStrategy == "tournament":
+            return self.selectTournament(numOfParents)
+        if self.selectionStrategy == "universal":
+            return self.selectUniversal(numOfParents)
+        return self.selectRoulette(numOfParents)
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      selectRoulette
+    # Parameters:       numOfParents(int)
+    #                       Use:    How many parents to draw
+    # Returns:          See selectParents
+    # Description:      Fitness proportionate selection. Each random point on the
+    #                   number line from findChanceOfMating is located with a binary
+    #                   search, so a generation costs O(n + numOfParents * log n)
+    #                   instead of a scan of the whole population per parent
+    #----------------------------------------------------------------------------------
+    def selectRoulette(self, numOfParents):
+        chanceOfMating = self.findChanceOfMating()
+        if self.recorder is not None:
+            self.recorder.lap("findChanceOfMating")
+        lastID = self.populationSize - 1
+        totalFitness = chanceOfMating[lastID]
+        draws = [self.rng.random() * totalFitness for _ in range(numOfParents)]
+
+        if self.backend == "numpy":
+            parents = np.searchsorted(chanceOfMating, draws, side="left")
+            return np.minimum(parents, lastID).tolist()
+        # Rounding can put a point just past the end of the number line
+        return [min(bisect.bisect_left(chanceOfMating, rand), lastID) for rand in draws]
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      selectUniversal
+    # Parameters:       numOfParents(int)
+    #                       Use:    How many parents to draw
+    # Returns:          See selectParents
+    # Description:      Stochastic universal sampling. A single random draw places
+    #                   numOfParents evenly spaced pointers on the number line, which
+    #                   are all resolved in one pass over it. The parents are shuffled
+    #                   afterwards so that mates are not simply neighbouring IDs
+    #----------------------------------------------------------------------------------
+    def selectUniversal(self, numOfParents):
+        chanceOfMating = self.findChanceOfMating()
+        if self.recorder is not None:
+            self.recorder.lap("findChanceOfMating")
+        lastID = self.populationSize - 1
+        spacing = chanceOfMating[lastID] / numOfParents
+        start = self.rng.random() * spacing
+
+        if self.backend == "numpy":
+            pointers = start + spacing * np.arange(numOfParents)
+            parents = np.minimum(np.searchsorted(chanceOfMating, pointers, side="left"), lastID).tolist()
+        else:
+            parents = []
+            chromosomeID = 0
+            for i in range(0, numOfParents):
+                pointer = start + i * spacing
+                while chromosomeID < lastID and chanceOfMating[chromosomeID] < pointer:
+                    chromosomeID += 1
+                parents.append(chromosomeID)
+        self.rng.shuffle(parents)
+        return parents
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      selectTournament
+    # Parameters:       numOfParents(int)
+    #                       Use:    How many parents to draw
+    # Returns:          See selectParents
+    # Description:      Tournament selection. Each parent is the cheapest of
+    #                   tournamentSize randomly chosen entities, which needs neither
+    #                   the fitness totals nor the number line
+    #----------------------------------------------------------------------------------
+    def selectTournament(self, numOfParents):
+        cost = self.cost
+        parents = []
+        for i in range(0, numOfParents):
+            winner = self.rng.randrange(self.populationSize)
+            for ii in range(1, self.tournamentSize):
+                challenger = self.rng.randrange(self.populationSize)
+                if cost[challenger] < cost[winner]:
+                    winner = challenger
+            parents.append(winner)
+        return parents
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      populate
+    # Parameters:       N/A
+    # Returns:          N/A
+    # Description:      Generates the next population of entities. Like the original
+    #                   GA, a generation replaces a single pair: the 2 least fit
+    #                   entities, by the children of 2 parents drawn by
+    #                   selectParents. These become the changedIDs
+    #----------------------------------------------------------------------------------
+    def populate(self):
+        # If you need to create a new population, then you need to increment the
+        # generation
+        self.generationCount += 1
+
+        # Initialize local variables
+        staleIDs = self.changedIDs                          # The IDs changed by the
+                                                            # last generation
+
+        targetIDs = self.findLeastFit(2)                    # The pair of least fit
+                                                            # entities to be replaced
+        if self.recorder is not None:
+            self.recorder.lap("findLeastFit")
+
+        parents = self.selectParents(len(targetIDs))        # The list of parents whose
+                                                            # genomes will be passed on
+                                                            # to the new entities
+        if self.recorder is not None:
+            self.recorder.lap("selectParents")
+
+        # The current generation becomes the parent generation, which is read while
+        # the children are written over the targeted entities of the other buffer
+        self.changedIDs = targetIDs
+        self.swapPopulations([chromosomeID for chromosomeID in staleIDs if chromosomeID not in targetIDs])
+        if self.recorder is not None:
+            self.recorder.lap("swapPopulations")
+
+        # Modify the targeted entities to match the newly generated genomes
+        if targetIDs:
+            self.mate(parents[0], parents[1], (targetIDs[0], targetIDs[1]))
+        return
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      solve
+    # Parameters:       N/A
+    # Returns:          The minimum cost found by the GA
+    # Description:      Performs the GA to determine the most optimal solution to the
+    #                   JumpIt game for the solver's game board
+    #----------------------------------------------------------------------------------
+    def solve(self):
+        self.begin()
+        return self.resume()
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      resume
+    # Parameters:       N/A
+    # Returns:          The minimum cost found by the GA
+    # Description:      Evolves the population until the run stops. Continues a run
+    #                   started with begin or restored with loadCheckpoint
+    #----------------------------------------------------------------------------------
+    def resume(self):
+        while self.stopReason is None:
+            self.evolve()
+        return self.minCost
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      begin
+    # Parameters:       N/A
+    # Returns:          N/A
+    # Description:      Starts a run: creates and costs the initial population, which
+    #                   is the first generation. Together with evolve, this lets a
+    #                   caller such as the island model run the GA a few generations
+    #                   at a time
+    #----------------------------------------------------------------------------------
+    def begin(self):
+        recorder = self.recorder
+        if recorder is not None:
+            recorder.startGeneration(self)
+        self.initialize()
+        if recorder is not None:
+            recorder.lap("initialize")
+
+        self.previousMin = self.minCost
+        self.numTimesSameMin = 0
+        self.stopReason = None
+        if self.stoppingPolicy is not None:
+            self.stoppingPolicy.start(self)
+        self.evaluate(True)
+        return
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      evolve
+    # Parameters:       N/A
+    # Returns:          N/A
+    # Description:      Creates and costs the next generation, and saves a checkpoint
+    #                   every checkpointInterval generations when checkpointFileName
+    #                   is set. Only to be called while stopReason is None
+    #----------------------------------------------------------------------------------
+    def evolve(self):
+        if self.recorder is not None:
+            self.recorder.startGeneration(self)
+        self.populate()
+        self.evaluate(False)
+        if self.checkpointFileName is not None and self.generationCount % self.checkpointInterval == 0:
+            self.checkpointSeconds.append(self.saveCheckpoint(self.checkpointFileName))
+        return
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      evaluate
+    # Parameters:       isFirstGeneration(bool)
+    #                       Use:    True for the initial population, which is costed in
+    #                               full
+    # Returns:          N/A
+    # Description:      Finishes a generation: costs it, tracks the minimum cost and
+    #                   the stagnation, and sets stopReason once the run is over
+    #----------------------------------------------------------------------------------
+    def evaluate(self, isFirstGeneration):
+        # The initial population is costed in full. Afterwards the costs of the
+        # changed chromosomes have already been updated incrementally by mate
+        if isFirstGeneration:
+            if self.backend == "numpy":
+                self.calcCostArray(range(0, self.populationSize))
+            else:
+                for chromosomeID in range(0, self.populationSize):
+                    self.calcCost(chromosomeID)
+        elif self.verifyCosts:
+            self.checkCosts(self.changedIDs)
+        # Calculate the fitness of each changed chromosome
+        evaluatedIDs = range(0, self.populationSize) if isFirstGeneration else self.changedIDs
+        for chromosomeID in evaluatedIDs:
+            self.calcFitness(chromosomeID)
+        self.numOfEvaluations += len(evaluatedIDs)
+        # Find the minimum cost of the population
+        for chromosomeID in range(0, self.populationSize):
+            # If the minimum fitness has improved, record it
+            if self.cost[chromosomeID] < self.minCost:
+                self.minCost = self.cost[chromosomeID]
+                self.minCostID = chromosomeID
+                self.numTimesSameMin = 0
+                self.previousMin = self.minCost
+        # Check for stagnant growth
+        if self.minCost == self.previousMin:
+            self.numTimesSameMin += 1
+        if self.recorder is not None:
+            self.recorder.lap("calcCost")
+            self.recorder.endGeneration(self, self.numTimesSameMin)
+
+        # Stop early when the policy says more generations will not help, otherwise
+        # at the stagnation and generation limits
+        if self.stoppingPolicy is not None:
+            self.stopReason = self.stoppingPolicy.check(self)
+        if self.stopReason is None:
+            if self.generationCount >= self.maxGenerations:
+                self.stopReason = "maxGenerations"
+            elif self.numTimesSameMin >= self.maxStagnantGenerations:
+                self.stopReason = "stagnation"
+        return
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      immigrate
+    # Parameters:       genomes(list(list(int)))
+    #                       Use:    Valid genomes from another population, as lists of
+    #                               0s and 1s like getBestGenomes returns
+    # Returns:          N/A
+    # Description:      Replaces the least fit chromosomes with the genomes between 2
+    #                   generations. The replaced chromosomes are costed in full and
+    #                   added to changedIDs, so the next populate carries them into
+    #                   the other buffer. A better immigrant counts as an improvement.
+    #                   The elite (see findEliteIDs) is kept, so fewer genomes than
+    #                   given are taken when the rest of the population is smaller
+    #----------------------------------------------------------------------------------
+    def immigrate(self, genomes):
+        # The elite is never replaced, so minCostID stays valid and at most the
+        # non-elite chromosomes take immigrants
+        eliteIDs = self.findEliteIDs()
+        candidateIDs = [chromosomeID for chromosomeID in range(0, self.populationSize) if chromosomeID not in eliteIDs]
+        targetIDs = heapq.nlargest(min(len(genomes), len(candidateIDs)), candidateIDs, key=self.cost.__getitem__)
+        changedIDs = set(self.changedIDs)
+        for chromosomeID, genes in zip(targetIDs, genomes):
+            if self.backend == "numpy":
+                self.population[chromosomeID] = genes
+            elif self.backend == "packed":
+                self.population[chromosomeID] = packGenes(genes)
+            elif self.encoding == "steps":
+                self.population[chromosomeID] = genesToSteps(genes)
+            else:
+                self.population[chromosomeID] = list(genes)
+            self.calcCost(chromosomeID)
+            self.calcFitness(chromosomeID)
+            self.numOfEvaluations += 1
+            if chromosomeID not in changedIDs:
+                self.changedIDs.append(chromosomeID)
+                changedIDs.add(chromosomeID)
+            if self.cost[chromosomeID] < self.minCost:
+                self.minCost = self.cost[chromosomeID]
+                self.minCostID = chromosomeID
+                self.numTimesSameMin = 0
+                self.previousMin = self.minCost
+        return
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      getSettings
+    # Parameters:       N/A
+    # Returns:          A dictionary of the settings of the solver by the names of the
+    #                   parameters of __init__
+    # Description:      The settings that can be saved, i.e. all but the objects like
+    #                   the recorder, stoppingPolicy and warmStartStrategies. Used as
+    #                   the "settings" of a checkpoint and in the keys of resultKey
+    #----------------------------------------------------------------------------------
+    def getSettings(self):
+        return {
+            "populationSize": self.populationSize,
+            "mutationRate": self.mutationRate,
+            "mutationMode": self.mutationMode,
+            "crossRate": self.crossRate,
+            "maxStagnantGenerations": self.maxStagnantGenerations,
+            "maxGenerations": self.maxGenerations,
+            "backend": self.backend,
+            "selectionStrategy": self.selectionStrategy,
+            "tournamentSize": self.tournamentSize,
+            "eliteSize": self.eliteSize,
+            "genomeCacheSize": self.genomeCacheSize,
+            "crossoverMode": self.crossoverMode,
+            "verifyCosts": self.verifyCosts,
+            "warmStartFraction": self.warmStartFraction,
+            "maxJump": self.maxJump,
+            "encoding": self.encoding,
+        }
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      saveCheckpoint
+    # Parameters:       fileName(string)
+    #                       Use:    The checkpoint file, replaced if it exists
+    # Returns:          The seconds taken to save the checkpoint
+    # Description:      Saves everything the run needs to go on exactly where it
+    #                   stands, between 2 generations, in the format described at
+    #                   checkpointMagic. The file is written in one pass to a
+    #                   temporary file that then replaces the old checkpoint, so a
+    #                   crash while saving leaves the previous checkpoint intact. It
+    #                   costs O(populationSize * numOfGenes / 8) bytes and no loop
+    #                   over the genes in Python with the "numpy" and "packed"
+    #                   backends
+    #----------------------------------------------------------------------------------
+    def saveCheckpoint(self, fileName):
+        startTime = time.perf_counter()
+        numOfGenes = len(self.board)
+        bytesPerGenome = (numOfGenes + 7) // 8
+        rngVersion, rngWords, gaussNext = self.rng.getstate()
+        header = {
+            "formatVersion": 1,
+            "byteOrder": sys.byteorder,
+            "numOfGenes": numOfGenes,
+            "populationSize": self.populationSize,
+            "numOfChangedIDs": len(self.changedIDs),
+            "numOfRngWords": len(rngWords),
+            "settings": self.getSettings(),
+            "state": {
+                "minCost": int(self.minCost),
+                "minCostID": int(self.minCostID),
+                "generationCount": self.generationCount,
+                "numOfEvaluations": self.numOfEvaluations,
+                "numOfMutations": self.numOfMutations,
+                "previousMin": int(self.previousMin),
+                "numTimesSameMin": self.numTimesSameMin,
+                "stopReason": self.stopReason,
+                "crossoverCounters": self.crossoverCounters,
+                "rngVersion": rngVersion,
+                "gaussNext": gaussNext,
+                "stoppingPolicy": self.stoppingPolicy.getState() if self.stoppingPolicy is not None else None,
+            },
+        }
+
+        # Bit i of byte j of a genome is gene 8 * j + i
+        if self.backend == "numpy":
+            genes = np.packbits(self.population, axis=1, bitorder="little").tobytes()
+        else:
+            genomes = self.population if self.backend == "packed" else (packGenes(self.getGenes(chromosomeID)) for chromosomeID in range(0, self.populationSize))
+            genes = b"".join(genome.to_bytes(bytesPerGenome, "little") for genome in genomes)
+        headerBytes = json.dumps(header, separators=(",", ":")).encode()
+        sections = (
+            headerBytes,
+            array.array("q", self.board).tobytes(),
+            array.array("q", self.cost).tobytes(),
+            array.array("q", self.changedIDs).tobytes(),
+            array.array("I", rngWords).tobytes(),
+            genes,
+        )
+
+        temporaryFileName = fileName + ".tmp"
+        with open(temporaryFileName, "wb") as file:
+            file.write(checkpointMagic + len(headerBytes).to_bytes(8, "little"))
+            for section in sections:
+                file.write(section)
+                file.write(bytes(-len(section) % 8))
+        os.replace(temporaryFileName, fileName)
+        return time.perf_counter() - startTime
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      updateTiles
+    # Parameters:       changes(dictionary)
+    #                       Use:    The new costs of the changed tiles by their index
+    # Returns:          N/A
+    # Description:      Edits the game board between 2 generations and keeps the
+    #                   population. A changed tile moves the cost of exactly the
+    #                   chromosomes that visit it, so each cost gets one delta per
+    #                   changed tile it visits, in both population buffers, in
+    #                   O(populationSize * len(changes)) instead of a full costing.
+    #                   A "steps" chromosome is walked up to the last changed tile
+    #                   rather than turned back into genes.
+    #                   The prefix costs and genomeCache depend on the old tiles and
+    #                   are dropped. The run goes on with resume on the edited
+    #                   board: its generationCount is kept, and its stagnation and
+    #                   stoppingPolicy are reset. A run that stopped at
+    #                   maxGenerations stops again after one more generation unless
+    #                   the caller raises it, as resolveBoard does
+    #----------------------------------------------------------------------------------
+    def updateTiles(self, changes):
+        tileIDs = []
+        deltas = []
+        for tileID, tile in changes.items():
+            if tile != self.board[tileID]:
+                tileIDs.append(tileID)
+                deltas.append(tile - self.board[tileID])
+                self.board[tileID] = tile
+                if self.boardArray is not None:
+                    self.boardArray[tileID] = tile
+
+        buffers = [(self.population, self.cost)]
+        if self.parentPopulation is not None:
+            buffers.append((self.parentPopulation, self.parentCost))
+        for population, cost in buffers:
+            if not tileIDs:
+                break
+            if self.backend == "numpy":
+                # One column of the population per changed tile
+                costDeltas = population[:, tileIDs].astype(np.int64) @ np.asarray(deltas, dtype=np.int64)
+                cost[:] = (np.asarray(cost, dtype=np.int64) + costDeltas).tolist()
+            elif self.backend == "packed":
+                for tileID, delta in zip(tileIDs, deltas):
+                    for chromosomeID, genome in enumerate(population):
+                        if (genome >> tileID) & 1:
+                            cost[chromosomeID] += delta
+            elif self.encoding == "steps":
+                # Each path is walked only as far as the last changed tile
+                deltaByTile = dict(zip(tileIDs, deltas))
+                lastTileID = max(tileIDs)
+                for chromosomeID, steps in enumerate(population):
+                    for position in itertools.accumulate(steps, initial=0):
+                        if position > lastTileID:
+                            break
+                        if position in deltaByTile:
+                            cost[chromosomeID] += deltaByTile[position]
+            else:
+                for tileID, delta in zip(tileIDs, deltas):
+                    for chromosomeID, genome in enumerate(population):
+                        if genome[tileID] == 1:
+                            cost[chromosomeID] += delta
+
+        self.prefixKnown = [False] * self.populationSize
+        if self.parentPrefixKnown is not None:
+            self.parentPrefixKnown = [False] * self.populationSize
+        if self.genomeCache is not None:
+            self.genomeCache.clear()
+        for chromosomeID in range(0, self.populationSize):
+            self.calcFitness(chromosomeID)
+        self.numOfEvaluations += self.populationSize
+
+        self.minCostID = min(range(0, self.populationSize), key=self.cost.__getitem__)
+        self.minCost = self.cost[self.minCostID]
+        self.previousMin = self.minCost
+        self.numTimesSameMin = 0
+        self.stopReason = None
+        if self.stoppingPolicy is not None:
+            self.stoppingPolicy.start(self)
+        return
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      getGenes
+    # Parameters:       chromosomeID(int)
+    #                       Use:    The chromosome of population to read
+    # Returns:          The genes of the chromosome as a sequence of 0s and 1s,
+    #                   whatever the backend and encoding
+    #----------------------------------------------------------------------------------
+    def getGenes(self, chromosomeID):
+        if self.backend == "packed":
+            return unpackGenes(self.population[chromosomeID], len(self.board))
+        if self.encoding == "steps":
+            return stepsToGenes(self.population[chromosomeID], len(self.board))
+        return self.population[chromosomeID]
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      getPath
+    # Parameters:       N/A
+    # Returns:          The indices of the tiles occupied by the fittest chromosome,
+    #                   followed by -1 to signify the end of the path (see GA_path)
+    #----------------------------------------------------------------------------------
+    def getPath(self):
+        if self.encoding == "steps":
+            path = list(itertools.accumulate(self.population[self.minCostID], initial=0))
+        else:
+            genome = self.getGenes(self.minCostID)
+            path = [i for i in range(0, len(genome)) if genome[i] == 1]
+        path.append(-1)
+        return path
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# CLASS DESCRIPTION--------------------------------------------------------------------
+# Class Name:       GenerationRecorder
+# Description:      Collects one row of telemetry per generation of a GASolver run
+#                   and exports it as a CSV trace. The solver only calls into the
+#                   recorder when one is given, so a run without one pays a single
+#                   None check per phase. The solver calls startGeneration at the
+#                   start of a generation, lap after each of its phases and
+#                   endGeneration once the generation is costed, so any object with
+#                   these 3 methods can be passed as the recorder instead
+#--------------------------------------------------------------------------------------
+class GenerationRecorder:
+    __slots__ = (
+        "rows",                     # One dictionary per recorded generation
+        "clock",                    # The function returning the time in seconds
+        "generationStart",          # The time the current generation started at
+        "lastLap",                  # The time of the last call to lap
+        "phaseSeconds",             # The seconds spent in each phase so far in the
+                                    # current generation
+        "lastCounters",             # The solver's running totals at the end of the
+                                    # previous generation
+    )
+
+    # The phases timed by the solver, in order. "initialize" is only spent in the
+    # first generation and "calcCost" covers the costs, the fitnesses and the search
+    # for the minimum cost
+    phases = ("initialize", "findLeastFit", "findChanceOfMating", "selectParents", "swapPopulations",
+              "copyChromosome", "crossover", "mutate", "calcCost")
+
+    # The running totals of the solver that are recorded as per-generation counts
+    counters = ("crossovers", "clones", "wastedAttempts", "mutations", "evaluations", "cacheHits", "cacheMisses")
+
+    # The columns of the CSV trace
+    fieldNames = ("generation", "seconds") + phases + counters + ("cacheHitRate", "bestCost", "meanCost", "stagnantGenerations")
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      __init__
+    # Parameters:       clock(function)
+    #                       Use:    Returns the current time in seconds
+    # Returns:          N/A
+    #----------------------------------------------------------------------------------
+    def __init__(self, clock=time.perf_counter):
+        self.rows = []
+        self.clock = clock
+        self.generationStart = 0.0
+        self.lastLap = 0.0
+        self.phaseSeconds = {}
+        self.lastCounters = {}
+        return
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      startGeneration
+    # Parameters:       solver(GASolver)
+    #                       Use:    The solver starting a generation
+    # Returns:          N/A
+    #----------------------------------------------------------------------------------
+    def startGeneration(self, solver):
+        self.phaseSeconds = dict.fromkeys(GenerationRecorder.phases, 0.0)
+        self.generationStart = self.lastLap = self.clock()
+        return
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      lap
+    # Parameters:       phase(string)
+    #                       Use:    One of phases
+    # Returns:          N/A
+    # Description:      Adds the time since the previous lap to the phase
+    #----------------------------------------------------------------------------------
+    def lap(self, phase):
+        now = self.clock()
+        self.phaseSeconds[phase] += now - self.lastLap
+        self.lastLap = now
+        return
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      endGeneration
+    # Parameters:       solver(GASolver)
+    #                       Use:    The solver ending a generation
+    #                   numTimesSameMin(int)
+    #                       Use:    The stagnation counter of the solver
+    # Returns:          N/A
+    # Description:      Records the row of the generation. The counts are the changes
+    #                   of the solver's running totals during the generation, which
+    #                   are all reset by initialize
+    #----------------------------------------------------------------------------------
+    def endGeneration(self, solver, numTimesSameMin):
+        totals = {
+            "crossovers": solver.crossoverCounters["crossovers"],
+            "clones": solver.crossoverCounters["clones"],
+            "wastedAttempts": solver.crossoverCounters["wastedAttempts"],
+            "mutations": solver.numOfMutations,
+            "evaluations": solver.numOfEvaluations,
+            "cacheHits": solver.genomeCacheHits,
+            "cacheMisses": solver.genomeCacheMisses,
+        }
+        previous = self.lastCounters if solver.generationCount > 1 else dict.fromkeys(totals, 0)
+
+        row = {"generation": solver.generationCount, "seconds": self.clock() - self.generationStart}
+        row.update(self.phaseSeconds)
+        for counter in GenerationRecorder.counters:
+            row[counter] = totals[counter] - previous[counter]
+        numOfLookups = row["cacheHits"] + row["cacheMisses"]
+        row["cacheHitRate"] = row["cacheHits"] / numOfLookups if numOfLookups > 0 else 0.0
+        row["bestCost"] = solver.minCost
+        row["meanCost"] = sum(solver.cost) / solver.populationSize
+        row["stagnantGenerations"] = numTimesSameMin
+        self.rows.append(row)
+        self.lastCounters = totals
+        return
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      writeCSV
+    # Parameters:       fileName(string)
+    #                       Use:    The file the trace is written to
+    # Returns:          N/A
+    # Description:      Writes the recorded rows with a header of fieldNames
+    #----------------------------------------------------------------------------------
+    def writeCSV(self, fileName):
+        with open(fileName, "w", newline="") as file:
+            writer = csv.DictWriter(file, GenerationRecorder.fieldNames)
+            writer.writeheader()
+            writer.writerows(self.rows)
+        return
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# CLASS DESCRIPTION--------------------------------------------------------------------
+# Class Name:       StoppingPolicy
+# Description:      Extra stopping rules for GASolver, checked after every generation
+#                   on top of maxStagnantGenerations and maxGenerations. Every rule
+#                   is off unless configured, and the first one that fires ends the
+#                   run and becomes the solver's stopReason. The policy keeps the
+#                   state of one run at a time, which start resets
+#--------------------------------------------------------------------------------------
+class StoppingPolicy:
+    __slots__ = (
+        "maxSeconds",               # "wallClock": the run has taken this long
+        "maxEvaluations",           # "evaluations": the run has made this many
+                                    # fitness evaluations
+        "targetCost",               # "targetCost": a cost this low has been found
+        "minEntropy",               # "entropy": the findEntropy of the population
+                                    # has collapsed below this
+        "entropyInterval",          # The generations between 2 entropy checks, as
+                                    # each check is a pass over the population
+        "improvementWindow",        # "improvement": the best cost has improved by
+        "minRelativeImprovement",   # no more than minRelativeImprovement (relative
+                                    # to the older cost) over the last
+                                    # improvementWindow generations
+        "useLowerBound",            # "lowerBound": the best cost has reached
+                                    # lowerBoundCost, so it is optimal
+        "startTime",                # When the current run started
+        "lowerBound",               # The lowerBoundCost of the current board
+        "recentCosts",              # The best costs of the last generations
+    )
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      __init__
+    # Parameters:       See the slot descriptions above. None leaves a rule off
+    # Returns:          N/A
+    #----------------------------------------------------------------------------------
+    def __init__(self, maxSeconds=None, maxEvaluations=None, targetCost=None, minEntropy=None,
+                 entropyInterval=10, improvementWindow=None, minRelativeImprovement=0.0,
+                 useLowerBound=False):
+        self.maxSeconds = maxSeconds
+        self.maxEvaluations = maxEvaluations
+        self.targetCost = targetCost
+        self.minEntropy = minEntropy
+        self.entropyInterval = entropyInterval
+        self.improvementWindow = improvementWindow
+        self.minRelativeImprovement = minRelativeImprovement
+        self.useLowerBound = useLowerBound
+        self.startTime = 0.0
+        self.lowerBound = None
+        self.recentCosts = None
+        return
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      start
+    # Parameters:       solver(GASolver)
+    #                       Use:    The solver starting a run
+    # Returns:          N/A
+    #----------------------------------------------------------------------------------
+    def start(self, solver):
+        self.startTime = time.perf_counter()
+        self.lowerBound = lowerBoundCost(solver.board, solver.maxJump) if self.useLowerBound else None
+        self.recentCosts = None
+        if self.improvementWindow is not None:
+            self.recentCosts = collections.deque(maxlen=self.improvementWindow + 1)
+        return
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      check
+    # Parameters:       solver(GASolver)
+    #                       Use:    The solver that has just finished a generation
+    # Returns:          The name of the rule that stops the run, or None to go on
+    #----------------------------------------------------------------------------------
+    def check(self, solver):
+        if self.targetCost is not None and solver.minCost <= self.targetCost:
+            return "targetCost"
+        if self.lowerBound is not None and solver.minCost <= self.lowerBound:
+            return "lowerBound"
+        if self.maxEvaluations is not None and solver.numOfEvaluations >= self.maxEvaluations:
+            return "evaluations"
+        if self.maxSeconds is not None and time.perf_counter() - self.startTime >= self.maxSeconds:
+            return "wallClock"
+        if self.recentCosts is not None:
+            self.recentCosts.append(solver.minCost)
+            if len(self.recentCosts) == self.recentCosts.maxlen:
+                oldCost = self.recentCosts[0]
+                if oldCost - solver.minCost <= self.minRelativeImprovement * abs(oldCost):
+                    return "improvement"
+        if self.minEntropy is not None and solver.generationCount % self.entropyInterval == 0:
+            if solver.findEntropy() < self.minEntropy:
+                return "entropy"
+        return None
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      getState
+    # Parameters:       N/A
+    # Returns:          The state of the current run as a JSON-friendly dictionary,
+    #                   saved in the checkpoints of the solver
+    #----------------------------------------------------------------------------------
+    def getState(self):
+        return {
+            "elapsedSeconds": time.perf_counter() - self.startTime,
+            "recentCosts": [int(cost) for cost in self.recentCosts] if self.recentCosts is not None else None,
+        }
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      setState
+    # Parameters:       state(dictionary)
+    #                       Use:    A state returned by getState
+    # Returns:          N/A
+    # Description:      Continues a run restored from a checkpoint. To be called after
+    #                   start
+    #----------------------------------------------------------------------------------
+    def setState(self, state):
+        self.startTime -= state["elapsedSeconds"]
+        if self.recentCosts is not None and state["recentCosts"] is not None:
+            self.recentCosts.extend(state["recentCosts"])
+        return
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    lowerBoundCost
+# Parameters:       board(sequence(int))
+#                       Use:    The game board
+#                   maxJump(int)
+#                       Use:    The most tiles a single move may advance
+# Returns:          A cost that no path across the board can beat, found in O(n)
+# Description:      Every path visits the first and last tiles, and at least one tile
+#                   of every maxJump neighbouring tiles in between. Cutting the inner
+#                   tiles into blocks of maxJump without overlap, the path costs at
+#                   least the cheapest tile of each block. The minimum of every
+#                   window of maxJump tiles is found with a monotonic deque, so each
+#                   of the maxJump ways of cutting the blocks is tried and the
+#                   highest bound is kept
+#--------------------------------------------------------------------------------------
+def lowerBoundCost(board, maxJump=2):
+    if len(board) <= 2:
+        return sum(board)
+    inner = board[1:-1]
+
+    # windowMins[i] is the cheapest of inner[i:i + maxJump]
+    windowMins = []
+    window = collections.deque()    # The indices of the tiles of the window that no
+                                    # later tile undercuts, the cheapest first
+    for i, tile in enumerate(inner):
+        while window and inner[window[-1]] >= tile:
+            window.pop()
+        window.append(i)
+        if window[0] <= i - maxJump:
+            window.popleft()
+        if i >= maxJump - 1:
+            windowMins.append(inner[window[0]])
+    blockBound = max(sum(windowMins[offset::maxJump]) for offset in range(0, maxJump))
+    return board[0] + board[-1] + blockBound
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    loadCheckpoint
+# Parameters:       fileName(string)
+#                       Use:    A checkpoint saved by GASolver.saveCheckpoint
+#                   solverOptions(keyword arguments)
+#                       Use:    The options of GASolver that cannot be saved, i.e.
+#                               randomGenerator, recorder, stoppingPolicy,
+#                               checkpointFileName and checkpointInterval
+# Returns:          A GASolver holding the saved run, to be continued with resume
+# Description:      Restores the run so that it goes on bit for bit as if it had
+#                   never stopped, including the state of the random number
+#                   generator and of the stoppingPolicy, if one is given again. Only
+#                   the time taken by the run so far is carried over to the
+#                   wall-clock rule. The fitness is recalculated from the costs and
+#                   the prefix costs are recalculated when first needed. The file is
+#                   read through mmap, so only the genes are copied out of it
+#--------------------------------------------------------------------------------------
+def loadCheckpoint(fileName, **solverOptions):
+    with open(fileName, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as view:
+        if view[0:len(checkpointMagic)] != checkpointMagic:
+            raise ValueError("not a GA_JumpIt checkpoint: " + repr(fileName))
+        offset = len(checkpointMagic) + 8
+        headerLength = int.from_bytes(view[len(checkpointMagic):offset], "little")
+        header = json.loads(view[offset:offset + headerLength])
+        if header["formatVersion"] != 1:
+            raise ValueError("unsupported checkpoint format version: " + repr(header["formatVersion"]))
+        offset += headerLength + (-headerLength % 8)
+
+        sections = []
+        for typeCode, count in (("q", header["numOfGenes"]), ("q", header["populationSize"]), ("q", header["numOfChangedIDs"]), ("I", header["numOfRngWords"])):
+            values = array.array(typeCode)
+            values.frombytes(view[offset:offset + count * values.itemsize])
+            if header["byteOrder"] != sys.byteorder:
+                values.byteswap()
+            sections.append(values)
+            offset += count * values.itemsize
+            offset += -offset % 8
+        board, cost, changedIDs, rngWords = sections
+        numOfGenes = len(board)
+        bytesPerGenome = (numOfGenes + 7) // 8
+        genes = view[offset:offset + header["populationSize"] * bytesPerGenome]
+
+    state = header["state"]
+    solver = GASolver(board.tolist(), **header["settings"], **solverOptions)
+    solver.rng.setstate((state["rngVersion"], tuple(rngWords), state["gaussNext"]))
+
+    # Unpack the genes into the storage of the backend
+    genomes = (genes[i:i + bytesPerGenome] for i in range(0, len(genes), bytesPerGenome))
+    if solver.backend == "numpy":
+        packed = np.frombuffer(genes, dtype=np.uint8).reshape(solver.populationSize, bytesPerGenome)
+        solver.population = np.unpackbits(packed, axis=1, count=numOfGenes, bitorder="little")
+    elif solver.backend == "packed":
+        solver.population = [int.from_bytes(genome, "little") for genome in genomes]
+    else:
+        solver.population = [unpackGenes(int.from_bytes(genome, "little"), numOfGenes) for genome in genomes]
+        if solver.encoding == "steps":
+            solver.population = [genesToSteps(genes) for genes in solver.population]
+    solver.allocateBuffers()
+
+    solver.cost = cost.tolist()
+    solver.fitness = [0.0] * solver.populationSize
+    for chromosomeID in range(0, solver.populationSize):
+        solver.calcFitness(chromosomeID)
+    solver.changedIDs = changedIDs.tolist()
+    solver.minCost = state["minCost"]
+    solver.minCostID = state["minCostID"]
+    solver.generationCount = state["generationCount"]
+    solver.numOfEvaluations = state["numOfEvaluations"]
+    solver.numOfMutations = state["numOfMutations"]
+    solver.previousMin = state["previousMin"]
+    solver.numTimesSameMin = state["numTimesSameMin"]
+    solver.stopReason = state["stopReason"]
+    solver.crossoverCounters = state["crossoverCounters"]
+    if solver.stoppingPolicy is not None:
+        solver.stoppingPolicy.start(solver)
+        if state["stoppingPolicy"] is not None:
+            solver.stoppingPolicy.setState(state["stoppingPolicy"])
+    return solver
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    warmStartGreedy
+# Parameters:       solver(GASolver)
+#                       Use:    The solver whose initial population is being built
+#                   numOfGenomes(int)
+#                       Use:    How many genomes to build
+#                   noise(float)
+#                       Use:    The chance of taking another move at each tile, in
+#                               all genomes but the first
+# Returns:          A list of numOfGenomes genomes
+# Description:      Walks the board from the first tile, moving onto the cheapest of
+#                   the next maxJump tiles each time (the farthest one on a tie). The
+#                   first genome is the pure greedy path and the others are noisy
+#                   copies of it, so the seeds do not all collapse onto one chromosome
+#--------------------------------------------------------------------------------------
+def warmStartGreedy(solver, numOfGenomes, noise=0.1):
+    board = solver.board
+    lastCell = len(board) - 1
+    genomes = []
+    for genomeID in range(0, numOfGenomes):
+        genes = [0] * len(board)
+        genes[0] = 1
+        cell = 0
+        while cell < lastCell:
+            reach = min(solver.maxJump, lastCell - cell)
+            step = min(range(reach, 0, -1), key=lambda step: board[cell + step])
+            if reach > 1 and genomeID > 0 and solver.rng.random() < noise:
+                # Take one of the other moves, without a draw when there is only one
+                if reach == 2:
+                    step = 3 - step
+                else:
+                    otherStep = solver.rng.randrange(1, reach)
+                    step = otherStep if otherStep < step else otherStep + 1
+            cell += step
+            genes[cell] = 1
+        genomes.append(genes)
+    return genomes
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    warmStartWindowedDP
+# Parameters:       solver(GASolver)
+#                       Use:    The solver whose initial population is being built
+#                   numOfGenomes(int)
+#                       Use:    How many genomes to build
+#                   maxWindowSize(int)
+#                       Use:    The largest window solved by the DP
+# Returns:          A list of numOfGenomes genomes
+# Description:      Cuts the board into windows that share their end tiles, solves
+#                   each window exactly with DP_JumpItBits (DP_JumpItK when maxJump
+#                   is not 2) and joins the paths. Only the tiles where the windows
+#                   meet are forced onto the path, so the genomes are close to
+#                   optimal. Each genome draws its own window size and first cut,
+#                   and the windows are kept to at most a quarter of the board so
+#                   that the GA is still left with work to do
+#--------------------------------------------------------------------------------------
+def warmStartWindowedDP(solver, numOfGenomes, maxWindowSize=32):
+    board = solver.board
+    lastCell = len(board) - 1
+    windowLimit = max(2, min(maxWindowSize, len(board) // 4))
+    genomes = []
+    for genomeID in range(0, numOfGenomes):
+        genes = [0] * len(board)
+        genes[0] = 1
+        windowSize = solver.rng.randint(2, windowLimit)
+        start = 0
+        end = solver.rng.randint(1, windowSize)
+        while start < lastCell:
+            end = min(end, lastCell)
+            if solver.maxJump == 2:
+                minCost, bits, numOfTiles = DP_JumpItBits(reversed(board[start:end + 1]))
+                cells = pathFromBits(bits, numOfTiles)
+            else:
+                minCost, nextCell = DP_JumpItK(board[start:end + 1], solver.maxJump)
+                cells = tracePath(nextCell)
+            for cell in cells:
+                genes[start + cell] = 1
+            start = end
+            end = start + windowSize
+        genomes.append(genes)
+    return genomes
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    warmStartFromGenomes
+# Parameters:       genomes(list(list(int)))
+#                       Use:    The best genomes of a previous run, e.g. from
+#                               getBestGenomes
+# Returns:          A warm start strategy that hands out the genomes in turn
+# Description:      The previous run may have been on a similar board of another
+#                   length, so each genome is cut or extended with 1s to the length
+#                   of the board, its ends are set to 1 and its runs of maxJump 0s
+#                   repaired like initialize does
+#--------------------------------------------------------------------------------------
+def warmStartFromGenomes(genomes):
+    genomes = [[int(gene) for gene in genes] for genes in genomes]
+
+    def strategy(solver, numOfGenomes):
+        numOfGenes = len(solver.board)
+        fitted = []
+        for genomeID in range(0, numOfGenomes if genomes else 0):
+            genes = genomes[genomeID % len(genomes)][:numOfGenes]
+            genes += [1] * (numOfGenes - len(genes))
+            genes[0] = genes[-1] = 1
+            numOfZeros = 0
+            for i in range(1, numOfGenes):
+                numOfZeros = numOfZeros + 1 if genes[i] == 0 else 0
+                if numOfZeros == solver.maxJump:
+                    genes[i] = 1
+                    numOfZeros = 0
+            fitted.append(genes)
+        return fitted
+
+    return strategy
+
+# The built-in warm start strategies, by the names accepted by GASolver
+warmStarts = {"greedy": warmStartGreedy, "windowedDP": warmStartWindowedDP}
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    hasDouble0sArray
+# Parameters:       genes(numpy.ndarray)
+#                       Use:    A single genome (1-D) or a whole population (2-D) of
+#                               0/1 genes to be checked
+# Returns:          A boolean (or a boolean array with one entry per chromosome) that
+#                   is True where the genome contains repeating 0s
+# Description:      The vectorized equivalent of checkForDouble0s. A pair of
+#                   neighbouring genes is a double 0 when the OR of the 2 genes is 0,
+#                   so the whole genome is checked with one adjacent OR pass
+#--------------------------------------------------------------------------------------
+def hasDouble0sArray(genes):
+    return np.logical_not(genes[..., :-1] | genes[..., 1:]).any(axis=-1)
 
-populationSize = int()  # The desired size of the populations to be tested. Will be
-                        # based upon the length of the JumpIt game board
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
 
-mutationRate = float()  # The liklihood of a mutation occurring in the genome of an
-                        # entity in the population
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    hasDouble0sPacked
+# Parameters:       genome(int)
+#                       Use:    A packed genome, where bit i is gene i
+#                   numOfGenes(int)
+#                       Use:    The number of genes in the genome
+# Returns:          True if the genome contains repeating 0s,
+#                   False otherwise
+# Description:      The packed equivalent of checkForDouble0s for a whole genome. The
+#                   0s are the bits of ~genome within the genome, and a double 0 is a
+#                   0 whose next gene is also a 0
+#--------------------------------------------------------------------------------------
+def hasDouble0sPacked(genome, numOfGenes):
+    zeros = ~genome & ((1 << numOfGenes) - 1)
+    return zeros & (zeros >> 1) != 0
 
-crossRate = float()     # The liklihood of 2 entities successfully crossing their
-                        # genomes to create a new entity.
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
 
-fitness = dict()        # A dictionary to be defined as (chromosomeID, fitnessScore)
-                        # key-value pairs where the fitnessScore is defined by
-                        # 1 / GA_cost[chromosomeID]
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    hasZeroRunArray
+# Parameters:       genes(numpy.ndarray)
+#                       Use:    A single genome (1-D) or a whole population (2-D) of
+#                               0/1 genes to be checked
+#                   maxJump(int)
+#                       Use:    The length of the shortest run of 0s to be found
+# Returns:          A boolean (or a boolean array with one entry per chromosome) that
+#                   is True where the genome contains a run of maxJump 0s
+# Description:      hasDouble0sArray for any maxJump. A window of maxJump genes holds
+#                   no 1 when the running count of the 1s is the same at both of its
+#                   ends, so the whole genome is checked with one cumulative sum
+#--------------------------------------------------------------------------------------
+def hasZeroRunArray(genes, maxJump):
+    if maxJump == 2:
+        return hasDouble0sArray(genes)
+    numOfOnes = np.zeros(genes.shape[:-1] + (genes.shape[-1] + 1,), dtype=np.int64)
+    np.cumsum(genes, axis=-1, dtype=np.int64, out=numOfOnes[..., 1:])
+    return (numOfOnes[..., maxJump:] == numOfOnes[..., :-maxJump]).any(axis=-1)
 
-GA_min_cost = int()     # The minimum calculated cost determined by the GA
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
 
-GA_minCostID = int()    # The chromosomeID of the chromosome associated with the
-                        # minimum calculated cost
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    hasZeroRunPacked
+# Parameters:       genome(int)
+#                       Use:    A packed genome, where bit i is gene i
+#                   numOfGenes(int)
+#                       Use:    The number of genes in the genome
+#                   maxJump(int)
+#                       Use:    The length of the shortest run of 0s to be found
+# Returns:          True if the genome contains a run of maxJump 0s,
+#                   False otherwise
+# Description:      hasDouble0sPacked for any maxJump. While bit x of zeros marks a
+#                   run of length 0s starting at gene x, ANDing zeros with itself
+#                   shifted by up to length marks the runs of up to twice the length,
+#                   so the check takes about log2(maxJump) steps, and stops early
+#                   once no run is left
+#--------------------------------------------------------------------------------------
+def hasZeroRunPacked(genome, numOfGenes, maxJump):
+    if maxJump == 2:
+        return hasDouble0sPacked(genome, numOfGenes)
+    zeros = ~genome & ((1 << numOfGenes) - 1)
+    length = 1
+    while length < maxJump and zeros:
+        shift = min(length, maxJump - length)
+        zeros &= zeros >> shift
+        length += shift
+    return zeros != 0
 
-generationCount = int() # The number of iterations of the GA
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
 
-changedIDs = []         # The list of IDs that have changed since last iteration
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    findZeroRunPacked
+# Parameters:       genome(int)
+#                       Use:    A valid packed genome, where bit i is gene i
+#                   geneID(int)
+#                       Use:    One of the inner genes
+#                   maxJump(int)
+#                       Use:    The length of the runs of 0s being avoided
+# Returns:          The length of the run of 0s through the gene if it were a 0,
+#                   counting at most maxJump - 1 0s on either side of it
+# Description:      The packed equivalent of checkForZeroRun. The 0s next to the gene
+#                   are counted from the highest 1 below it and the lowest 1 above
+#                   it, within the maxJump - 1 bits on each side
 #--------------------------------------------------------------------------------------
+def findZeroRunPacked(genome, geneID, maxJump):
+    reach = maxJump - 1
+    first = max(geneID - reach, 0)
+    below = (genome >> first) & ((1 << (geneID - first)) - 1)
+    above = (genome >> (geneID + 1)) & ((1 << reach) - 1)
+    zerosBelow = geneID - first - below.bit_length()
+    zerosAbove = (above & -above).bit_length() - 1 if above else reach
+    return zerosBelow + 1 + zerosAbove
 
-#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
 
 # FUNCTION DESCRIPTION-----------------------------------------------------------------
-# Function Name:    checkForDouble0s
-# Parameters:       chromosomeID(int)
-#                       Use:    Used to grab the target chromosome from the population
-#                               for manipulation
-#                   precedingGeneID(int)
-#                       Use:    Used to find the gene point of reference within the
-#                               genome and for comparing the point of reference with
-#                               the current gene to check for repeating 0s
-# Returns:          True if there are repeating 0s, 
-#                   False otherwise
-# Description:      A helper function that checks for repeating 0s in a genome, given
-#                   the chromosomeID and point of reference geneID
+# Function Name:    findZeroRunsArray
+# Parameters:       genome(numpy.ndarray)
+#                       Use:    A valid 1-D genome of 0/1 genes
+#                   geneIDs(numpy.ndarray)
+#                       Use:    Some of the inner genes
+#                   maxJump(int)
+#                       Use:    The length of the runs of 0s being avoided
+# Returns:          For each of the genes, findZeroRunPacked on the array genome
+# Description:      Gathers the maxJump - 1 genes on either side of every gene, and
+#                   counts the 0s next to it as the leading 0s of the running sums
 #--------------------------------------------------------------------------------------
-def checkForDouble0s(chromosomeID, precedingGeneID):
-    if population[chromosomeID][precedingGeneID] == 0 and population[chromosomeID][precedingGeneID + 1] == 0:
-        return True
-    else:
-        return False
+def findZeroRunsArray(genome, geneIDs, maxJump):
+    offsets = np.arange(1, maxJump)
+    below = genome[np.maximum(geneIDs[:, None] - offsets, 0)]
+    above = genome[np.minimum(geneIDs[:, None] + offsets, len(genome) - 1)]
+    zerosBelow = np.count_nonzero(np.cumsum(below, axis=1) == 0, axis=1)
+    zerosAbove = np.count_nonzero(np.cumsum(above, axis=1) == 0, axis=1)
+    return zerosBelow + 1 + zerosAbove
 
-#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
 
 # FUNCTION DESCRIPTION-----------------------------------------------------------------
-# Function Name:    initialize
-# Parameters:       numOfGenes(int)
-#                       Use:    Represents the size of the game board, which is used
-#                               as the number of genes in each chromosome for the
-#                               current species
-# Returns:          N/A
-# Description:      The function that is called when starting a new game board. This
-#                   function initializes the global variables for use during the
-#                   GA, and created the initial population using random values of
-#                   0 and 1 for all genes except for the first and last, which must be
-#                   initialized to 1 for the JumpIt game logic to be upheld
+# Function Name:    findNearestOnes
+# Parameters:       genes(numpy.ndarray)
+#                       Use:    A valid 1-D genome of 0/1 genes
+# Returns:          A tuple of 2 arrays: lastOne[i] is the highest 1 at or below gene
+#                   i, and nextOne[i] the lowest 1 at or above it
+# Description:      Used to find the run of 0s created across a crossover point, which
+#                   spans from lastOne of one parent to nextOne of the other. The
+#                   genome is scanned with running maxima and minima. The list
+#                   backend finds the same 1s into its own buffers, see
+#                   findValidCrossPoints
 #--------------------------------------------------------------------------------------
-def initialize(numOfGenes):
-    # Give access to global variables
-    global GA_cost, GA_path, populationSize, population, fitness, mutationRate, crossRate
-
-    # Initialize the global variables
-    GA_cost = dict()                # See global declaration for description
-    GA_path = []                    # See global declaration for description
-    populationSize = 3 * numOfGenes # See global declaration for description
-    population = [[]]               # See global declaration for description
-    fitness = dict()                # See global declaration for description
-    mutationRate = 0.01             # See global declaration for description
-    crossRate = 0.85                # See global declaration for description
-    GA_min_cost = sys.maxsize       # See global declaration for description
-    GA_minCostID = int()            # See global declaration for description
-    generationCount = 1             # See global declaration for description
-    changedIDs = []                 # See global declaration for description
-
-    # Itratively generate the population
-    for i in range(0, populationSize):
-        population.append([])       # Add an entity to the population
-        # Iteratively generate the genes of the current entity
-        for ii in range(0, numOfGenes):
-            # Check for first and last gene
-            if ii == 0 or ii == numOfGenes - 1:
-                population[i].append(1)
-            # Otherwise
-            else:
-                population[i].append(rng.randint(0, 1))
-            # Ensure no repeating 0s
-            if ii > 0:
-                if checkForDouble0s(i, ii - 1):
-                    population[i][ii] = 1
-    population.pop()    # Removes unnecessary empty entity
-    return
+def findNearestOnes(genes):
+    numOfGenes = len(genes)
+    geneIndex = np.arange(numOfGenes)
+    lastOne = np.maximum.accumulate(np.where(genes == 1, geneIndex, 0))
+    nextOne = np.minimum.accumulate(np.where(genes == 1, geneIndex, numOfGenes)[::-1])[::-1]
+    return lastOne, nextOne
 
-#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
 
 # FUNCTION DESCRIPTION-----------------------------------------------------------------
-# Function Name:    mutate
-# Parameters:       chromosomeID(int)
-#                       Use:    Used to grab the target chromosome from the population
-#                               for manipulation
-# Returns:          N/A
-# Description:      Used to simulate biological mutation in the biological reproductive
-#                   cycle. Iterates through each of the genes in a selected chromosomal
-#                   genome and attempts to mutate them
+# Function Name:    costKernel
+# Parameters:       population(numpy.ndarray)
+#                       Use:    The 2-D uint8 population of the "numpy" backend
+#                   chromosomeIDs(numpy.ndarray)
+#                       Use:    The rows to be costed
+#                   board(numpy.ndarray)
+#                       Use:    The game board as int64s
+# Returns:          The costs of the rows as an int64 array
+# Description:      The kernel of calcCostArray, see compiledKernels
 #--------------------------------------------------------------------------------------
-def mutate(chromosomeID):
-    # Give access to global variables
-    global population, mutationRate
-
-    # Iteratively step through the selected entity's genome and attempt to mutate the
-    # genes therein, ignoring the first and last genes.
-    for i in range(1, len(population[chromosomeID]) - 1):
-        # If probability says to mutate, then attempt to mutate, otherwise do nothing
-        if rng.random() <= mutationRate:
-            if population[chromosomeID][i] == 0:
-                population[chromosomeID][i] = 1
-            else:
-                population[chromosomeID][i] = 0
-                # Check both the preceding and following genes to ensure no double 0s
-                if checkForDouble0s(chromosomeID, i - 1) or checkForDouble0s(chromosomeID, i):
-                    population[chromosomeID][i] = 1
-    return
+def costKernel(population, chromosomeIDs, board):
+    costs = np.zeros(chromosomeIDs.shape[0], dtype=np.int64)
+    for i in range(chromosomeIDs.shape[0]):
+        genome = population[chromosomeIDs[i]]
+        cost = 0
+        for geneID in range(genome.shape[0]):
+            if genome[geneID] == 1:
+                cost += board[geneID]
+        costs[i] = cost
+    return costs
 
-#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
-
-# FUNCTION DESCRIPTION-----------------------------------------------------------------
-# Function Name:    testCanCross
-# Parameters:       attemptedCrossPoint(int)
-#                       Use:    Used as the locus of the genetic crossover event
-#                   parent1ChromosomeID(int)
-#                       Use:    Used to grab the target chromosome of the first parent
-#                               from the population for manipulation
-#                   parent2ChromosomeID(int)
-#                       Use:    Used to grab the target chromosome of the second parent
-#                               from the population for manipulation
-#                   targetChromosomeIDs((int, int))
-#                       Use:    The tuples of chromosomalIDs used to grab the target
-#                               chromosomes of the 2 entities targeted for replacement
-#                               from amongst the population
-#
-# Returns:          True if successfully crossed the genomes of the parents, 
-#                   False otherwise
-# Description:      Serves as the biological cross-over equivalent. Returns boolean
-#                   representations of the results to ensure that it can be used in a
-#                   loop until a successful child is created.
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    mutateKernel
+# Parameters:       genome(numpy.ndarray)
+#                       Use:    The row of the population being mutated, in place
+#                   loci(numpy.ndarray)
+#                       Use:    The genes picked by findMutationLoci
+#                   board(numpy.ndarray)
+#                       Use:    The game board as int64s
+#                   maxJump(int)
+#                       Use:    See GASolver
+# Returns:          A tuple of the change in cost and the number of genes flipped
+# Description:      The kernel of mutateArray. Every picked gene is handled in order,
+#                   exactly like mutate does with checkForZeroRun
 #--------------------------------------------------------------------------------------
-def testCanCross(attemptedCrossPoint, parent1ChromosomeID, parent2ChromosomeID, targetChromosomeIDs):
-    # Give access to global variables
-    global population
-
-    # Initialize local children variables used to test the success of the crossover
-    # without losing the valid data in the existing population.
-    child1 = []
-    child2 = []
-
-    # Iteratively create the children based upon the parents genomes and the selected
-    # crossover point
-    for i in  range(0, len(population[parent1ChromosomeID])):
-        if i < attemptedCrossPoint:
-            child1.append(population[parent1ChromosomeID][i])
-            child2.append(population[parent2ChromosomeID][i])
+def mutateKernel(genome, loci, board, maxJump):
+    delta = 0
+    numOfMutations = 0
+    for i in loci:
+        if genome[i] == 0:
+            genome[i] = 1
+            delta += board[i]
+            numOfMutations += 1
         else:
-            child1.append(population[parent2ChromosomeID][i])
-            child2.append(population[parent1ChromosomeID][i])
+            first = i
+            while genome[first - 1] == 0:
+                first -= 1
+            last = i
+            while genome[last + 1] == 0:
+                last += 1
+            if last - first + 1 < maxJump:
+                genome[i] = 0
+                delta -= board[i]
+                numOfMutations += 1
+    return delta, numOfMutations
 
-    # Check the genomes of the children for double 0s
-    for i in range(0, len(child1) - 1):
-        # If a double 0 sequence is found, the crossover failed, so return False
-        if (child1[i] == 0 and child1[i+1] == 0) or (child2[i] == 0 and child2[i+1] == 0):
-            return False
-    # If no double 0 sequence was found, the cross succeeded, so change the genomes of
-    # the targeted chromosomes to represent the cross and return True
-    population[targetChromosomeIDs[0]] = child1
-    population[targetChromosomeIDs[1]] = child2
-    return True
-
-#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
-
-# FUNCTION DESCRIPTION-----------------------------------------------------------------
-# Function Name:    mate
-# Parameters:       parent1ChromosomeID(int)
-#                       Use:    Used to grab the target chromosome of the first parent
-#                               from the population for manipulation
-#                   parent2ChromosomeID(int)
-#                       Use:    Used to grab the target chromosome of the second parent
-#                               from the population for manipulation
-#                   targetChromosomeIDs((int, int))
-#                       Use:    The tuples of chromosomalIDs used to grab the target
-#                               chromosomes of the 2 entities targeted for replacement
-#                               from amongst the population 
-# Returns:          N/A
-# Description:      Mates the 2 parent chromosomes and replaces the chromosomes of the
-#                   selected less-fit entites with the result of the mating process
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    crossPointsKernel
+# Parameters:       genome1, genome2(numpy.ndarray)
+#                       Use:    The genomes of the parents
+#                   maxJump(int)
+#                       Use:    See GASolver
+# Returns:          The valid crossover points as an int64 array
+# Description:      The kernel of findValidCrossPoints, which compares the nearest
+#                   1s of the parents on both sides of every point
 #--------------------------------------------------------------------------------------
-def mate(parent1ChromosomeID, parent2ChromosomeID, targetChromosomeIDs):
-    # Give access to global variables
-    global crossRate, population, populationSize
-
-    # Reassign the values of the targeted, less-fit genomes to the values of the 
-    # more-fit parents. These values will be used if probability decides not to cross
-    # the genomes of the parents
-    population[targetChromosomeIDs[0]] = copy.deepcopy(population[parent1ChromosomeID])
-    population[targetChromosomeIDs[1]] = copy.deepcopy(population[parent2ChromosomeID])
-
-    # Generate a random float value between 0 and 1 and use it to decide whether or not
-    # to cross the genomes of the parents
-    rand = rng.random()
-    if rand <= crossRate:
-        canCross = False    # Assume you cannot cross the genomes until proven otherwise
-        crossAttempts = 0   # Attempts to cross
-        # Until the genomes are successfully crossed or the maximum number of attempts
-        # have been made, try to cross them
-        while not canCross and crossAttempts < populationSize:
-            # Randomly select a locus for the crossover point
-            selectedCrossPoint = rng.randint(1, len(population[parent1ChromosomeID]) - 2)
-            # Attempt the crossover
-            canCross = testCanCross(selectedCrossPoint, parent1ChromosomeID, parent2ChromosomeID, targetChromosomeIDs)
-    
-    # Attempt to mutate the new entities
-    mutate(targetChromosomeIDs[0])
-    mutate(targetChromosomeIDs[1])
-    return
+def crossPointsKernel(genome1, genome2, maxJump):
+    numOfGenes = genome1.shape[0]
+    nextOne1 = np.empty(numOfGenes, dtype=np.int64)
+    nextOne2 = np.empty(numOfGenes, dtype=np.int64)
+    one1 = one2 = numOfGenes
+    for i in range(numOfGenes - 1, -1, -1):
+        if genome1[i] == 1:
+            one1 = i
+        if genome2[i] == 1:
+            one2 = i
+        nextOne1[i] = one1
+        nextOne2[i] = one2
+
+    points = np.empty(max(numOfGenes - 2, 0), dtype=np.int64)
+    numOfPoints = 0
+    lastOne1 = lastOne2 = 0
+    for point in range(1, numOfGenes - 1):
+        if genome1[point - 1] == 1:
+            lastOne1 = point - 1
+        if genome2[point - 1] == 1:
+            lastOne2 = point - 1
+        if nextOne2[point] - lastOne1 <= maxJump and nextOne1[point] - lastOne2 <= maxJump:
+            points[numOfPoints] = point
+            numOfPoints += 1
+    return points[:numOfPoints]
 
-#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
 
 # FUNCTION DESCRIPTION-----------------------------------------------------------------
-# Function Name:    calcFitness
-# Parameters:       chromosomeID(int)
-#                       Use:    Used to grab the target chromosome from the population
-#                               for manipulation    
-# Returns:          N/A
-# Description:      A helper function that simply calculates the fitness of each
-#                   entity in the population and stores it in the global fitness
-#                   dictionary using the chromosomeID as the key and the calculated
-#                   fitness as the value
+# Function Name:    zeroRunKernel
+# Parameters:       genes(numpy.ndarray)
+#                       Use:    A 2-D array of genomes
+#                   maxJump(int)
+#                       Use:    The length of the shortest run of 0s to be found
+# Returns:          True if any of the genomes contains a run of maxJump 0s
+# Description:      The kernel of testCanCrossArray, which stops at the first run
 #--------------------------------------------------------------------------------------
-def calcFitness(chromosomeID):
-    # Give access to global variables
-    global fitness, GA_cost
-
-    # Calculate and store the fitness
-    fitness.update({chromosomeID : 1.0 / GA_cost[chromosomeID]})
-    return
+def zeroRunKernel(genes, maxJump):
+    for row in range(genes.shape[0]):
+        numOfZeros = 0
+        for geneID in range(genes.shape[1]):
+            if genes[row, geneID] == 0:
+                numOfZeros += 1
+                if numOfZeros == maxJump:
+                    return True
+            else:
+                numOfZeros = 0
+    return False
 
-#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
 
 # FUNCTION DESCRIPTION-----------------------------------------------------------------
-# Function Name:    calcCost
-# Parameters:       chromosomeID(int)
-#                       Use:    Used to grab the target chromosome from the population
-#                               for manipulation 
-#                   board(list(map(int, string.split())))
-#                       Use:    Represents the game board where each entry is a tile
-#                               with a cost represented by the value of the entry
-# Returns:          N/A
-# Description:      A helper funtion that Determines the cost associated with the 
-#                   genome of the entity identified in the population by the 
-#                   chromosomeID and stores it in the global GA_cost dictionary with
-#                   the key being the chromosomeID and the value being the cost
+# Function Name:    DP_JumpItKernel
+# Parameters:       board(numpy.ndarray)
+#                       Use:    A game board of at least 3 tiles as int64s
+# Returns:          The DP_cost and DP_path tables of the board as int64 arrays
+# Description:      The kernel of DP_JumpIt, with the same recurrence and tie rule
 #--------------------------------------------------------------------------------------
-def calcCost(chromosomeID, board):
-    # Give access to global variables
-    global population, GA_cost
+def DP_JumpItKernel(board):
+    n = board.shape[0]
+    cost = np.empty(n, dtype=np.int64)
+    path = np.empty(n, dtype=np.int64)
+    cost[n - 1] = board[n - 1]
+    path[n - 1] = -1
+    cost[n - 2] = board[n - 2] + board[n - 1]
+    path[n - 2] = n - 1
+    for i in range(n - 3, -1, -1):
+        if cost[i + 1] < cost[i + 2]:
+            cost[i] = board[i] + cost[i + 1]
+            path[i] = i + 1
+        else:
+            cost[i] = board[i] + cost[i + 2]
+            path[i] = i + 2
+    return cost, path
 
-    # Initialize the associated cost of the chromosome in the dictionary to 0
-    GA_cost.update({chromosomeID : 0})
+# The kernels by name, written as plain Python over numpy arrays. With numba
+# installed, compiledKernels holds them compiled by numba.njit (on their first call),
+# and the "numpy" backend and DP_JumpIt call those instead of their own code. It is
+# empty otherwise, so the pure-Python paths are kept
+kernels = {
+    "cost": costKernel,
+    "mutate": mutateKernel,
+    "crossPoints": crossPointsKernel,
+    "zeroRun": zeroRunKernel,
+    "DP_JumpIt": DP_JumpItKernel,
+}
+compiledKernels = {name: numba.njit(cache=True)(kernel) for name, kernel in kernels.items()} if numba is not None and np is not None else {}
+kernelBackend = "numba" if compiledKernels else "python"   # The kernels in use
 
-    # Iterate through the genes of the selected entity and calculate the cost based
-    # upon the cost of each visited tile
-    for geneID in range(0, len(population[chromosomeID])):
-        # If the tile is to be visited, add the cost of the tile to the genome cost
-        if population[chromosomeID][geneID] == 1:
-            GA_cost[chromosomeID] += board[geneID]
-    return
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
 
-#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+# The translations between genes and the binary digits of packed genomes, which keep
+# packGenes and unpackGenes out of Python loops
+geneDigits = bytes.maketrans(b"\x00\x01", b"01")
+geneValues = bytes.maketrans(b"01", b"\x00\x01")
 
 # FUNCTION DESCRIPTION-----------------------------------------------------------------
-# Function Name:    findLeastFit
-# Parameters:       N/A 
-# Returns:          leastFitIDs where leastFitIDs is defined as a list of 
-#                   chromosomalIDs representing the least fit entities of the current 
-#                   population in consideration
-# Description:      This function determines the chromosomalIDs of the least fit
-#                   entities of the population and returns it for use elsewhere
+# Function Name:    packGenes
+# Parameters:       genes(list(int))
+#                       Use:    A genome as a sequence of 0s and 1s
+# Returns:          The genome packed into an int, where bit i is gene i
 #--------------------------------------------------------------------------------------
-def findLeastFit():
-    # Give access to global variables
-    global GA_cost, changedIDs
+def packGenes(genes):
+    return int(bytes(reversed(genes)).translate(geneDigits) or b"0", 2)
 
-    # Initialize local variables
-    leastFitIDs = []                            # List to be returned
-    orderedCost = [GA_cost[k] for k in GA_cost] # Copy of the values of the cost dict
-    orderedCost.sort()                          # Now sorted
-    numOfLosers = int(len(orderedCost) / 2)     # How many entities to replace
-
-    # Make sure the number of entities to be replaced is even for easier logic
-    if numOfLosers % 2 != 0:
-        numOfLosers += 1
-
-    # Iterate through the orderedCost list and find the corresponding chromosomalIDs
-    # by comparing the costs to the costs found in the global GA_cost dictionary
-    for orderedCostIndex in range(numOfLosers, len(orderedCost)):
-        for unorderedCostIndex in GA_cost:
-            # If the costs match up
-            if GA_cost[unorderedCostIndex] == orderedCost[orderedCostIndex]:
-                # Add the chromosomalID to the list of leastFitIDs
-                leastFitIDs.append(unorderedCostIndex)
-    # Sort the determined list for easier logic and return the newly sorted list
-    leastFitIDs.sort()
-    changedIDs = leastFitIDs
-    return leastFitIDs
-
-#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
-
-# FUNCTION DESCRIPTION-----------------------------------------------------------------
-# Function Name:    findChanceOfMating
-# Parameters:       N/A
-# Returns:          chanceOfMating where chanceOfMating is a dictionary that is
-#                   defined by (chromosomeID, calculatedLiklihoodOfMating) key-value
-#                   pairs and represents the roulette wheel approach to reproduction
-# Description:      Calculates the liklihood of reproduction for each entity in the
-#                   population and returns this to be used elsewhere
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    unpackGenes
+# Parameters:       genome(int)
+#                       Use:    A packed genome, where bit i is gene i
+#                   numOfGenes(int)
+#                       Use:    The number of genes in the genome
+# Returns:          The genome as a list of 0s and 1s
 #--------------------------------------------------------------------------------------
-def findChanceOfMating():
-    # Give access to global variables
-    global fitness
+def unpackGenes(genome, numOfGenes):
+    return list(format(genome, "0%db" % numOfGenes).encode()[::-1].translate(geneValues)) if numOfGenes > 0 else []
 
-    # Initialize local variables
-    chanceOfMating = dict() # To be returned
-    totalFitness = 0        # Sum of the fitnesses of all entities in the population
-
-    # Iteratively calculate the totalFitness
-    for fitnessContribution in fitness:
-        totalFitness += fitness[fitnessContribution]
-
-    # Iteratively calculate the relative liklihood of each entity to reproduce, given
-    # the ratio of their fitness to the totalFitness and store this value in a
-    # number line between 0 and 1 based upon their ordering in the population
-    first = True    # Signifies the first iteration
-    for index in fitness:
-        # If on the first iteration, start the corresponding number line at 0
-        if first:
-            chanceOfMating.update({index : (0, fitness[index] / totalFitness)})
-            first = False
-        # Otherwise, start the corresponding number line at the end point of the
-        # previous entry
-        else:
-            chanceOfMating.update({index : (chanceOfMating[index - 1][1], (fitness[index] / totalFitness) + chanceOfMating[index - 1][1])})
-    return chanceOfMating
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    genesToSteps
+# Parameters:       genes(sequence(int))
+#                       Use:    A valid genome as a sequence of 0s and 1s
+# Returns:          The genome in the "steps" encoding, the tiles advanced by each
+#                   move between 2 genes of 1
+#--------------------------------------------------------------------------------------
+def genesToSteps(genes):
+    cells = [cell for cell in range(0, len(genes)) if genes[cell] == 1]
+    return [cell - previousCell for previousCell, cell in zip(cells, cells[1:])]
 
-#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
 
 # FUNCTION DESCRIPTION-----------------------------------------------------------------
-# Function Name:    populate
-# Parameters:       N/A
-# Returns:          N/A
-# Description:      Generates the next population of entities                   
+# Function Name:    stepsToGenes
+# Parameters:       steps(list(int))
+#                       Use:    A genome in the "steps" encoding
+#                   numOfGenes(int)
+#                       Use:    The number of tiles of the board
+# Returns:          The genome as a list of 0s and 1s, with a 1 on every tile a move
+#                   lands on and on the first tile
 #--------------------------------------------------------------------------------------
-def populate():
-    # Give access to global variables
-    global populationSize, generationCount, GA_minCostID, population, fitness, GA_cost
+def stepsToGenes(steps, numOfGenes):
+    genes = [0] * numOfGenes
+    for cell in itertools.accumulate(steps, initial=0):
+        genes[cell] = 1
+    return genes
 
-    # If you need to create a new population, then you need to increment the generation
-    generationCount += 1
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
 
-    # Initialize local variables
-    leastFitIDs = findLeastFit()            # The list of IDs of the least fit half of 
-                                            # the entities in the population
-
-    parents = []                            # The list of parents whose genomes will
-                                            # be passed on to the new entities
-
-    chanceOfMating = findChanceOfMating()   # The likilhood of each entity in the
-                                            # population to reproduce, placed on a
-                                            # number line based upon the ordering of
-                                            # the entities in the population
-
-    # Iteratively create the new population by modifying the least fit entities of the
-    # existing population to match the newly generated genomes. Use a step size of 2
-    # to replace 2 entities per iteration
-    for i in range(0, len(leastFitIDs), 2):
-        # While you don't have a full set of parents
-        while len(parents) != 2:
-            # Generate a random float between 0 and 1 to use as the random point on
-            # the number line
-            rand = rng.random()
-            # Iteratively check to see where the randomly generated float falls on the
-            # number line of liklihoods of mating found in the chanceOfMating dict
-            for key in chanceOfMating:
-                # If the randomly generated number falls in the current range
-                if rand >= chanceOfMating[key][0] and rand <= chanceOfMating[key][1]:
-                    # Add the current entity to the list of parents
-                    parents.append(key)
-                    # If both parents have been found
-                    if len(parents) == 2:
-                        # Mate them
-                        mate(parents[0], parents[1], (leastFitIDs[i], leastFitIDs[i+1]))
-    return
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    sumPackedTiles
+# Parameters:       genome(int)
+#                       Use:    A packed genome, where bit i is gene i
+#                   board(list(int))
+#                       Use:    The game board
+#                   numOfGenes(int)
+#                       Use:    How many of the first genes to include
+# Returns:          The cost of the tiles occupied by the first numOfGenes genes
+#--------------------------------------------------------------------------------------
+def sumPackedTiles(genome, board, numOfGenes):
+    genes = unpackGenes(genome & ((1 << numOfGenes) - 1), numOfGenes)
+    return sum(itertools.compress(board, genes))
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
 
-#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    findSetBit
+# Parameters:       mask(int)
+#                       Use:    A non-negative int with more than index bits set
+#                   index(int)
+#                       Use:    Which of the set bits to find, counting from 0 at the
+#                               least significant one
+# Returns:          The position of the set bit
+# Description:      Binary searches the position with popcounts of the low bits of
+#                   the mask, which takes O(log n) bitwise operations rather than a
+#                   walk over every bit
+#--------------------------------------------------------------------------------------
+def findSetBit(mask, index):
+    low = 0
+    high = mask.bit_length() - 1
+    while low < high:
+        middle = (low + high) // 2
+        if (mask & ((2 << middle) - 1)).bit_count() > index:
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
 
 # FUNCTION DESCRIPTION-----------------------------------------------------------------
 # Function Name:    GA_JumpIt
 # Parameters:       board(list(map(int, string.split())))
 #                       Use:    Represents the game board where each entry is a tile
 #                               with a cost represented by the value of the entry
-# Returns:          N/A
+#                   solverOptions(keyword arguments)
+#                       Use:    Passed on to GASolver. By default the solver shares
+#                               the seeded random module and uses populationBackend
+# Returns:          The GASolver used for the run
 # Description:      Performs the GA to determine the most optimal solution to the
-#                   JumpIt game, given a game board
+#                   JumpIt game, given a game board, and publishes the results in
+#                   GA_min_cost, GA_minCostID and generationCount
 #--------------------------------------------------------------------------------------
-def GA_JumpIt(board):
+def GA_JumpIt(board, **solverOptions):
     # Give access to global variables
-    global GA_min_cost, DP_min_cost, GA_cost, GA_minCostID, generationCount, populationSize, changedIDs
-
-    # Initialize global variables
-    initialize(len(board))
-    GA_min_cost = sys.maxsize   # Set initial minimum cost to the largest number
-                                # allowed to ensure it is always greater than the
-                                # calculated minimum upon completion of the first
-                                # iteration of the algorithm
-
-    previousMin = GA_min_cost
-    numTimesSameMin = 0
-    # Emulate a Do-While loop because python doesn't have one
-    forceDo = True
-    # Check for (forceDo||stagnant growth) && generationCount < maximumAllowedIterations
-    while (forceDo or numTimesSameMin < 7.5 * populationSize) and generationCount < 15 * populationSize:
-        # If not first iteration, evolve the population
-        if forceDo != True:
-                populate()
-        # Calculate the cost and fitness of each chromosome in the population
-        for chromosomeID in range(0, len(population)):
-            if chromosomeID in changedIDs or forceDo:
-                calcCost(chromosomeID, board)
-                calcFitness(chromosomeID)
-            # If the minimum fitness has improved, record it
-            if GA_cost[chromosomeID] < GA_min_cost:
-                GA_min_cost = GA_cost[chromosomeID]
-                GA_minCostID = chromosomeID
-                numTimesSameMin = 0
-                previousMin = GA_min_cost
-        # Check for stagnant growth
-        if GA_min_cost == previousMin:
-            numTimesSameMin += 1
-                
-        forceDo = False
-    return
+    global GA_min_cost, GA_minCostID, generationCount
 
-#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+    solverOptions.setdefault("randomGenerator", rng)
+    solverOptions.setdefault("backend", populationBackend)
+    solver = GASolver(board, **solverOptions)
+    GA_min_cost = solver.solve()
+    GA_minCostID = solver.minCostID
+    generationCount = solver.generationCount
+    return solver
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
 
 # FUNCTION DESCRIPTION-----------------------------------------------------------------
 # Function Name:    DP_JumpIt
@@ -498,6 +3125,12 @@ def DP_JumpIt(board):
     #return minimum total cost of playing game starting at cell 0
     
     n = len(board)
+    if compiledKernels and n > 2:
+        # The compiled kernel fills the same tables
+        cost, path = compiledKernels["DP_JumpIt"](np.asarray(board, dtype=np.int64))
+        DP_cost[0:n] = cost.tolist()
+        DP_path[0:n] = path.tolist()
+        return DP_cost[0]
     DP_cost[n - 1] = board[n - 1] #cost if starting at last cell
     DP_path[n - 1] = -1 # special marker indicating end of path "destination/last cell reached"
     DP_cost[n - 2] = board[n - 2] + board[n - 1] #cost if starting at cell before last cell
@@ -513,7 +3146,102 @@ def DP_JumpIt(board):
             DP_path[i] = i + 2 #so from cell i, one jumps over cell
     return DP_cost[0]
 
-#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    DP_JumpItUpdate
+# Parameters:       board(list(int))
+#                       Use:    The game board, after some of its tiles were changed
+#                   changedTiles(iterable(int))
+#                       Use:    The indices of the changed tiles
+#                   DP_cost(list(int)), DP_path(list(int))
+#                       Use:    The tables DP_JumpIt filled for the board before
+#                               the change, e.g. the "DP_cost" and "DP_path" of its
+#                               result from solveBoard. Updated in place
+# Returns:          The new minimum total cost of playing the game
+# Description:      Brings the DP_cost and DP_path tables of the board up to date
+#                   with its changed tiles. The entries past the last changed tile
+#                   do not depend on it and are kept. Below a changed tile, once
+#                   the costs of 2 neighbouring entries have both moved by the
+#                   same amount, every entry down to the next changed tile keeps
+#                   its path and moves by that amount too. Those entries are
+#                   shifted in one pass, or skipped when the amount is 0, so the
+#                   recurrence only runs on a few entries around each changed tile
+#--------------------------------------------------------------------------------------
+def DP_JumpItUpdate(board, changedTiles, DP_cost, DP_path):
+    n = len(board)
+    if len(DP_cost) != n or len(DP_path) != n:
+        raise ValueError("The DP tables have " + repr(len(DP_cost)) + " and " + repr(len(DP_path)) + " entries, not the " + repr(n) + " tiles of the board")
+    pending = sorted(set(changedTiles))     # The changed tiles not yet passed, the
+                                            # highest last
+    if not pending:
+        return DP_cost[0]
+    nextShift = 0           # How much DP_cost[i + 1] has moved
+    afterNextShift = 0      # How much DP_cost[i + 2] has moved
+    i = min(pending[-1], n - 1)
+    while i >= 0:
+        while pending and pending[-1] > i:
+            pending.pop()
+        if (not pending or pending[-1] < i) and nextShift == afterNextShift:
+            stop = pending[-1] if pending else -1
+            if nextShift != 0:
+                DP_cost[stop + 1:i + 1] = [cost + nextShift for cost in itertools.islice(DP_cost, stop + 1, i + 1)]
+            i = stop
+            continue
+
+        # The recurrence of DP_JumpIt
+        if i == n - 1:
+            cost, nextCell = board[i], -1
+        elif i == n - 2 or DP_cost[i + 1] < DP_cost[i + 2]:
+            cost, nextCell = board[i] + DP_cost[i + 1], i + 1
+        else:
+            cost, nextCell = board[i] + DP_cost[i + 2], i + 2
+        nextShift, afterNextShift = cost - DP_cost[i], nextShift
+        DP_cost[i] = cost
+        DP_path[i] = nextCell
+        i -= 1
+    return DP_cost[0]
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    DP_JumpItK
+# Parameters:       board(sequence(int))
+#                       Use:    The game board
+#                   maxJump(int)
+#                       Use:    The most tiles a single move may advance
+# Returns:          A tuple of the minimum total cost of playing the game and the path
+#                   table, where nextCell[i] is the tile moved to from tile i and -1
+#                   ends the path, like DP_path
+# Description:      The recurrence of DP_JumpIt for moves of up to maxJump tiles,
+#                   cost[i] = board[i] + min(cost[i + 1], ..., cost[i + maxJump]).
+#                   The candidates of each tile form a window that slides down the
+#                   board by one tile at a time, so their minimum is kept in a
+#                   monotonic deque. Each tile enters and leaves the deque once, so
+#                   the DP runs in O(n) whatever maxJump is. Ties go to the farther
+#                   tile, so maxJump = 2 finds the same path as DP_JumpIt
+#--------------------------------------------------------------------------------------
+def DP_JumpItK(board, maxJump):
+    n = len(board)
+    cost = [0] * n
+    nextCell = [0] * n
+    cost[n - 1] = board[n - 1]
+    nextCell[n - 1] = -1
+    window = collections.deque()    # The tiles of the window that no nearer tile
+                                    # undercuts, from the farthest and cheapest to
+                                    # the nearest
+    for i in range(n - 2, -1, -1):
+        # Tile i + 1 enters the window and tile i + maxJump + 1 leaves it
+        while window and cost[window[-1]] > cost[i + 1]:
+            window.pop()
+        window.append(i + 1)
+        if window[0] > i + maxJump:
+            window.popleft()
+        nextCell[i] = window[0]
+        cost[i] = board[i] + cost[window[0]]
+    return cost[0], nextCell
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
 
 # FUNCTION DESCRIPTION-----------------------------------------------------------------
 # Function Name:    displayPath
@@ -543,65 +3271,1187 @@ def displayPath(board, isGA):
     print("path showing contents of visited cells:", path_contents)
     return
 
-#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    DP_minCostStreaming
+# Parameters:       tiles(iterable(int))
+#                       Use:    The tile costs of a game board, e.g. a list, an array,
+#                               a generator over a file or readTilesReversed
+# Returns:          The minimum cost of the game board
+# Description:      The recurrence of DP_JumpIt only ever reads the 2 costs after the
+#                   tile being solved, so they are kept in 2 variables instead of a
+#                   table and the tiles are consumed one at a time with O(1) extra
+#                   memory. The cheapest path from the first to the last tile costs
+#                   the same as the cheapest path back, so the tiles can be streamed
+#                   in either order
+#--------------------------------------------------------------------------------------
+def DP_minCostStreaming(tiles):
+    tiles = iter(tiles)
+    nextCost = next(tiles, None)    # The cost of the game starting at the tile after
+                                    # the one being solved
+    if nextCost is None:
+        raise ValueError("the game board has no tiles")
+    afterNextCost = sys.maxsize     # The cost starting 2 tiles after it. No such tile
+                                    # exists yet, so it is never the cheaper one
+    for tile in tiles:
+        nextCost, afterNextCost = tile + min(nextCost, afterNextCost), nextCost
+    return nextCost
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    DP_JumpItBits
+# Parameters:       reversedTiles(iterable(int))
+#                       Use:    The tile costs of a game board from the last tile to
+#                               the first, e.g. reversed(board) or readTilesReversed
+# Returns:          A tuple of the minimum cost, the path as a bytearray bitset and the
+#                   number of tiles
+# Description:      DP_JumpIt with O(1) memory for the costs and 1 bit per tile for
+#                   the path instead of the DP_cost and DP_path lists. The bit of the
+#                   tile n - 1 - r is bit r % 8 of byte r // 8, and is set when the
+#                   path jumps over the next tile and clear when it steps onto it.
+#                   Ties are broken like DP_JumpIt, so pathFromBits retraces the same
+#                   path as DP_path
+#--------------------------------------------------------------------------------------
+def DP_JumpItBits(reversedTiles):
+    bits = bytearray()
+    nextCost = 0
+    afterNextCost = sys.maxsize
+    numOfTiles = 0
+    for tile in reversedTiles:
+        if numOfTiles & 7 == 0:
+            bits.append(0)
+        if afterNextCost <= nextCost:   # The same test as DP_JumpIt, negated
+            bits[numOfTiles >> 3] |= 1 << (numOfTiles & 7)
+            nextCost, afterNextCost = tile + afterNextCost, nextCost
+        else:
+            nextCost, afterNextCost = tile + nextCost, nextCost
+        if numOfTiles == 0:
+            afterNextCost = sys.maxsize # Nothing lies beyond the last tile
+        numOfTiles += 1
+    return nextCost, bits, numOfTiles
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    pathFromBits
+# Parameters:       bits(bytearray)
+#                       Use:    The path bitset returned by DP_JumpItBits
+#                   numOfTiles(int)
+#                       Use:    The number of tiles of the game board
+# Returns:          A generator of the indices of the visited tiles, from 0 to the last
+#                   tile
+#--------------------------------------------------------------------------------------
+def pathFromBits(bits, numOfTiles):
+    cell = 0
+    yield cell
+    while cell < numOfTiles - 1:
+        reversedCell = numOfTiles - 1 - cell
+        cell += 2 if (bits[reversedCell >> 3] >> (reversedCell & 7)) & 1 else 1
+        yield cell
+    return
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    DP_JumpItColumns
+# Parameters:       columns(numpy.ndarray)
+#                       Use:    A 2-D int64 array holding equal-length game boards
+#                               column by column: columns[i][b] is tile i of board b
+# Returns:          A tuple of the minimum costs of the boards and their decision bits
+#                   packed like DP_JumpItBits, one row per board
+# Description:      The vectorized recurrence of DP_JumpIt, used by DP_JumpItBatch.
+#                   Each step of the loop solves one column of every board
+#--------------------------------------------------------------------------------------
+def DP_JumpItColumns(columns):
+    numOfColumns, numOfBoards = columns.shape
+    # decisions[r] holds the jump decisions of the tiles r columns before the last
+    decisions = np.empty((numOfColumns, numOfBoards), dtype=bool)
+    nextCost = np.zeros(numOfBoards, dtype=np.int64)
+    afterNextCost = np.full(numOfBoards, np.iinfo(np.int64).max, dtype=np.int64)
+    for r in range(0, numOfColumns):
+        np.less_equal(afterNextCost, nextCost, out=decisions[r])
+        # The cheaper of the 2 costs is the one the decision picked
+        cost = np.minimum(afterNextCost, nextCost)
+        cost += columns[numOfColumns - 1 - r]
+        if r > 0:
+            afterNextCost = nextCost
+        nextCost = cost
+    return nextCost, np.packbits(decisions.T, axis=1, bitorder="little")
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    DP_JumpItBatch
+# Parameters:       boards(numpy.ndarray or list(sequence(int)))
+#                       Use:    A 2-D array with one game board per row, or a list of
+#                               game boards of any lengths
+#                   mask(numpy.ndarray)
+#                       Use:    For a 2-D array of boards of different lengths, True
+#                               for the tiles of each row that belong to its board.
+#                               Each board starts at the first column and is padded
+#                               at the end. None when every row is a whole board
+#                   blockSize(int)
+#                       Use:    The number of boards solved together
+# Returns:          A tuple of the minimum costs (1-D int64 array), the paths as packed
+#                   bits (2-D uint8 array, one row per board) and the numbers of tiles
+#                   (1-D int64 array)
+# Description:      Runs the recurrence of DP_JumpIt column by column for a block of
+#                   boards at once, so the Python loop runs once per column instead of
+#                   once per tile of every board. The blocks are small enough for the
+#                   transposed boards to stay in the CPU cache. Ragged batches are
+#                   solved one length at a time. Each row of the bits is in the format
+#                   of DP_JumpItBits, zero filled past the end of the board, and can
+#                   be retraced with pathFromBits
+#--------------------------------------------------------------------------------------
+def DP_JumpItBatch(boards, mask=None, blockSize=4096):
+    if np is None:
+        raise ImportError("DP_JumpItBatch requires numpy")
+
+    # Bring the boards into one 2-D array with their lengths
+    if not isinstance(boards, np.ndarray):
+        lengths = np.fromiter((len(board) for board in boards), dtype=np.int64, count=len(boards))
+        if len(boards) > 0 and lengths.min() == lengths.max():
+            boards = np.array(boards, dtype=np.int64)
+        else:
+            padded = np.zeros((len(boards), int(lengths.max()) if len(boards) > 0 else 0), dtype=np.int64)
+            mask = np.arange(padded.shape[1]) < lengths[:, None]
+            padded[mask] = np.fromiter(itertools.chain.from_iterable(boards), dtype=np.int64, count=int(lengths.sum()))
+            boards = padded
+    boards = np.asarray(boards, dtype=np.int64)
+    numOfBoards, numOfColumns = boards.shape
+    if mask is None:
+        lengths = np.full(numOfBoards, numOfColumns, dtype=np.int64)
+    else:
+        lengths = np.count_nonzero(mask, axis=1).astype(np.int64)
+    if numOfBoards > 0 and lengths.min() == 0:
+        raise ValueError("every game board needs at least 1 tile")
+
+    costs = np.empty(numOfBoards, dtype=np.int64)
+    bits = np.zeros((numOfBoards, (numOfColumns + 7) // 8), dtype=np.uint8)
+    if mask is None:
+        for blockStart in range(0, numOfBoards, blockSize):
+            block = boards[blockStart:blockStart + blockSize]
+            costs[blockStart:blockStart + blockSize], bits[blockStart:blockStart + blockSize] = DP_JumpItColumns(np.ascontiguousarray(block.T))
+        return costs, bits, lengths
+
+    # Solve the boards of each length together, without their padding
+    order = np.argsort(lengths, kind="stable")
+    groupStarts = np.flatnonzero(np.diff(lengths[order], prepend=-1))
+    for groupStart, groupEnd in zip(groupStarts, itertools.chain(groupStarts[1:], [numOfBoards])):
+        numOfTiles = int(lengths[order[groupStart]])
+        for blockStart in range(groupStart, groupEnd, blockSize):
+            boardIDs = order[blockStart:min(blockStart + blockSize, groupEnd)]
+            blockCosts, blockBits = DP_JumpItColumns(np.ascontiguousarray(boards[boardIDs, :numOfTiles].T))
+            costs[boardIDs] = blockCosts
+            bits[boardIDs, :blockBits.shape[1]] = blockBits
+    return costs, bits, lengths
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    readTilesReversed
+# Parameters:       fileName(string)
+#                       Use:    A file of game boards, one board per line
+#                   lineNumber(int)
+#                       Use:    The line of the game board to be read, from 0
+#                   chunkSize(int)
+#                       Use:    The number of bytes parsed at a time, which bounds
+#                               the memory used by the parsing
+# Returns:          A generator of the tile costs of the game board, from the last tile
+#                   to the first
+# Description:      Maps the file into memory and parses the line backwards one chunk
+#                   at a time, so a board of hundreds of millions of tiles can be fed
+#                   to DP_JumpItBits without holding the board in memory. A number cut
+#                   in 2 by the start of a chunk is carried over to the next chunk
+#--------------------------------------------------------------------------------------
+def readTilesReversed(fileName, lineNumber=0, chunkSize=1 << 16):
+    with open(fileName, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            raise IndexError("line " + str(lineNumber) + " is past the end of " + fileName)
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mappedFile:
+            # Find the bounds of the line
+            start = 0
+            for i in range(0, lineNumber):
+                start = mappedFile.find(b"\n", start) + 1
+                if start == 0 or start == len(mappedFile):
+                    raise IndexError("line " + str(lineNumber) + " is past the end of " + fileName)
+            end = mappedFile.find(b"\n", start)
+            if end == -1:
+                end = len(mappedFile)
+
+            carry = b""     # The start of a number cut by the previous chunk
+            position = end
+            while position > start:
+                chunkStart = max(start, position - chunkSize)
+                chunk = mappedFile[chunkStart:position]
+                tokens = (chunk + carry).split()
+                carry = b""
+                if chunkStart > start and tokens and not chunk[:1].isspace():
+                    carry = tokens.pop(0)
+                position = chunkStart
+                yield from map(int, reversed(tokens))
+    return
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    hashBoard
+# Parameters:       board(sequence(int))
+#                       Use:    The game board to be hashed, of any of the board types
+#                               yielded by readBoards
+#                   parameters(keyword arguments)
+#                       Use:    The settings the result depends on, e.g. the seed and
+#                               the population backend of the GA
+# Returns:          A hex string identifying the board and the parameters
+# Description:      Hashes the tiles as 64-bit ints, so the same board gets the same
+#                   key whatever its type, followed by the parameters in a canonical
+#                   JSON form
+#--------------------------------------------------------------------------------------
+def hashBoard(board, **parameters):
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(array.array("q", board.tolist() if hasattr(board, "tolist") else board).tobytes())
+    digest.update(json.dumps(parameters, sort_keys=True).encode())
+    return digest.hexdigest()
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    resultKey
+# Parameters:       board(sequence(int))
+#                       Use:    The game board solved by solveBoard
+#                   seed(int), backend(string)
+#                       Use:    See solveBoard
+# Returns:          The key of the result of solveBoard in a ResultCache
+# Description:      Hashes the board with the seed, the settings of the GASolver
+#                   solveBoard would use (see GASolver.getSettings) and
+#                   resultFormatVersion, so changing a default of the GA never
+#                   returns a result cached by a run with the old one
+#--------------------------------------------------------------------------------------
+def resultKey(board, seed=None, backend="list"):
+    settings = findDefaultSettings(backend, len(board))
+    return hashBoard(board, formatVersion=resultFormatVersion, seed=seed, settings=settings)
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    findDefaultSettings
+# Parameters:       backend(string)
+#                       Use:    The population backend, see populationBackend
+#                   numOfTiles(int)
+#                       Use:    The length of the board, which the default population
+#                               size and stopping rules depend on
+# Returns:          The GASolver.getSettings of a solver with the default options,
+#                   not to be modified
+# Description:      Only the backend and the length of the board change the defaults,
+#                   so the settings are worked out once per pair rather than by a new
+#                   GASolver for every key of resultKey
+#--------------------------------------------------------------------------------------
+@functools.lru_cache(maxsize=256)
+def findDefaultSettings(backend, numOfTiles):
+    return GASolver([0] * numOfTiles, backend=backend).getSettings()
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    findBoardSeed
+# Parameters:       board(sequence(int))
+#                       Use:    The game board to be solved
+#                   baseSeed(int)
+#                       Use:    See solveBoards
+# Returns:          The seed of the GA of the board
+# Description:      The seed comes from the content of the board, so the result of a
+#                   board depends neither on where it is in the file nor on the
+#                   boards solved before it, and a board seen again gets the same
+#                   seed and so the same key in a ResultCache
+#--------------------------------------------------------------------------------------
+def findBoardSeed(board, baseSeed):
+    return int(hashBoard(board), 16) ^ baseSeed
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# CLASS DESCRIPTION--------------------------------------------------------------------
+# Class Name:       ResultCache
+# Description:      Remembers the results of solveBoard by the key of resultKey. The
+#                   most recently used results are kept in memory up to maxEntries,
+#                   and the least recently used one is evicted beyond that. An
+#                   optional sqlite file keeps the results across restarts, up to
+#                   maxDiskEntries. Results found on disk are promoted to memory. Use
+#                   as a context manager, or call close when done so the last writes
+#                   reach the disk
+#--------------------------------------------------------------------------------------
+class ResultCache:
+    __slots__ = (
+        "maxEntries",               # The size bound of the memory tier
+        "entries",                  # The memory tier, from least to most recently
+                                    # used
+        "connection",               # The sqlite connection of the disk tier, or None
+        "maxDiskEntries",           # The size bound of the disk tier, None for no
+                                    # bound
+        "numOfDiskEntries",         # The number of results in the disk tier
+        "numOfUncommitted",         # Writes to the disk tier not yet committed
+        "counters",                 # Running totals of the lookups, see
+                                    # resetCounters
+    )
+
+    commitInterval = 256    # Writes to the disk tier are committed in batches of this
+                            # many, as committing every write would sync the file each
+                            # time
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      __init__
+    # Parameters:       maxEntries(int)
+    #                       Use:    How many results the memory tier holds
+    #                   fileName(string)
+    #                       Use:    The sqlite file of the disk tier, None for a cache
+    #                               held in memory only
+    #                   maxDiskEntries(int)
+    #                       Use:    How many results the disk tier holds, None for no
+    #                               bound
+    # Returns:          N/A
+    #----------------------------------------------------------------------------------
+    def __init__(self, maxEntries=1024, fileName=None, maxDiskEntries=None):
+        self.maxEntries = maxEntries
+        self.entries = collections.OrderedDict()
+        self.maxDiskEntries = maxDiskEntries
+        self.numOfDiskEntries = 0
+        self.numOfUncommitted = 0
+        self.connection = None
+        if fileName is not None:
+            self.connection = sqlite3.connect(fileName)
+            self.connection.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, result TEXT NOT NULL, lastUsed REAL NOT NULL)")
+            self.connection.execute("CREATE INDEX IF NOT EXISTS resultsByLastUsed ON results (lastUsed)")
+            self.numOfDiskEntries = self.connection.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        self.resetCounters()
+        return
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      resetCounters
+    # Parameters:       N/A
+    # Returns:          N/A
+    # Description:      Zeroes the running totals of the cache: "hits" found in
+    #                   memory, "diskHits" found on disk, "misses" found in neither,
+    #                   and the "evictions" and "diskEvictions" of each tier
+    #----------------------------------------------------------------------------------
+    def resetCounters(self):
+        self.counters = {"hits": 0, "diskHits": 0, "misses": 0, "evictions": 0, "diskEvictions": 0}
+        return
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      get
+    # Parameters:       key(string)
+    #                       Use:    The key of the result, from resultKey
+    # Returns:          The cached result, or None on a miss
+    #----------------------------------------------------------------------------------
+    def get(self, key):
+        result = self.entries.get(key)
+        if result is not None:
+            self.entries.move_to_end(key)
+            self.counters["hits"] += 1
+            return result
+
+        if self.connection is not None:
+            row = self.connection.execute("SELECT result FROM results WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                self.connection.execute("UPDATE results SET lastUsed = ? WHERE key = ?", (time.time(), key))
+                self.countWrite()
+                result = json.loads(row[0])
+                self.remember(key, result)
+                self.counters["diskHits"] += 1
+                return result
+
+        self.counters["misses"] += 1
+        return None
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      put
+    # Parameters:       key(string)
+    #                       Use:    The key of the result, from resultKey
+    #                   result(dictionary)
+    #                       Use:    The result of solveBoard to be cached
+    # Returns:          N/A
+    #----------------------------------------------------------------------------------
+    def put(self, key, result):
+        self.remember(key, result)
+        if self.connection is None:
+            return
+
+        isNew = self.connection.execute("SELECT 1 FROM results WHERE key = ?", (key,)).fetchone() is None
+        self.connection.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?)", (key, json.dumps(result, separators=(",", ":")), time.time()))
+        if isNew:
+            self.numOfDiskEntries += 1
+        if self.maxDiskEntries is not None and self.numOfDiskEntries > self.maxDiskEntries:
+            numOfEvicted = self.numOfDiskEntries - self.maxDiskEntries
+            self.connection.execute("DELETE FROM results WHERE key IN (SELECT key FROM results ORDER BY lastUsed LIMIT ?)", (numOfEvicted,))
+            self.numOfDiskEntries -= numOfEvicted
+            self.counters["diskEvictions"] += numOfEvicted
+        self.countWrite()
+        return
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      remember
+    # Parameters:       key(string), result(dictionary)
+    #                       Use:    See put
+    # Returns:          N/A
+    # Description:      Stores the result in the memory tier as the most recently
+    #                   used one, evicting the least recently used ones beyond
+    #                   maxEntries
+    #----------------------------------------------------------------------------------
+    def remember(self, key, result):
+        self.entries[key] = result
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.maxEntries:
+            self.entries.popitem(last=False)
+            self.counters["evictions"] += 1
+        return
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      countWrite
+    # Parameters:       N/A
+    # Returns:          N/A
+    # Description:      Commits the writes to the disk tier once commitInterval of
+    #                   them are pending
+    #----------------------------------------------------------------------------------
+    def countWrite(self):
+        self.numOfUncommitted += 1
+        if self.numOfUncommitted >= ResultCache.commitInterval:
+            self.connection.commit()
+            self.numOfUncommitted = 0
+        return
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      close
+    # Parameters:       N/A
+    # Returns:          N/A
+    # Description:      Commits the pending writes and closes the disk tier. The memory
+    #                   tier stays usable
+    #----------------------------------------------------------------------------------
+    def close(self):
+        if self.connection is not None:
+            self.connection.commit()
+            self.connection.close()
+            self.connection = None
+        return
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
+        return False
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    solveBoard
+# Parameters:       board(list(int))
+#                       Use:    The game board to be solved by both the DP and the GA
+#                   seed(int)
+#                       Use:    Seeds the GASolver's own random number generator. When
+#                               None, the GA shares the seeded random module like the
+#                               original serial driver did
+#                   backend(string)
+#                       Use:    The population backend, see populationBackend
+#                   cache(ResultCache)
+#                       Use:    When given, a result cached for the same board, seed
+#                               and solver settings is returned instead of solving
+#                               the board again, and new results are added to it.
+#                               Ignored when seed is None, as the result then depends
+#                               on the state of the shared random module
+# Returns:          A dictionary with the DP and GA results of the board, with the
+#                   DP_cost and DP_path tables that resolveBoard goes on from
+# Description:      Solves one game board. Defined at module level so it can be sent
+#                   to the worker processes of the batch mode of driver. The board
+#                   can be any of the board types yielded by readBoards
+#--------------------------------------------------------------------------------------
+def solveBoard(board, seed=None, backend="list", cache=None):
+    # Give access to global variables
+    global DP_cost, DP_path
+
+    # Compact boards from readBoards are solved as lists of Python ints
+    if hasattr(board, "tolist"):
+        board = board.tolist()
+
+    if seed is None:
+        cache = None
+    if cache is not None:
+        key = resultKey(board, seed, backend)
+        result = cache.get(key)
+        if result is not None:
+            return result
+
+    DP_cost = [0] * len(board)
+    DP_path = DP_cost[:]
+    DP_min_cost = DP_JumpIt(board)  # Calculate the minimum using the DP approach
+
+    if seed is None:
+        solver = GA_JumpIt(board, backend=backend)
+    else:
+        solver = GASolver(board, backend=backend, seed=seed)
+        solver.solve()
+
+    result = {
+        "DP_min_cost": DP_min_cost,
+        "DP_cost": DP_cost,
+        "DP_path": DP_path,
+        "GA_min_cost": solver.minCost,
+        "GA_path": solver.getPath(),
+        "generationCount": solver.generationCount,
+    }
+    if cache is not None:
+        cache.put(key, result)
+    return result
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    resolveBoard
+# Parameters:       board(list(int))
+#                       Use:    A game board solved by DP_JumpIt and by the solver
+#                   changes(dictionary)
+#                       Use:    The new costs of the changed tiles by their index
+#                   solver(GASolver)
+#                       Use:    The GA of the board, e.g. as returned by GA_JumpIt
+#                   result(dictionary)
+#                       Use:    The last result of the board, from solveBoard or
+#                               resolveBoard. Its DP tables are copied and updated,
+#                               so a result held by a ResultCache is left as it is.
+#                               When None, or when its tables do not match the
+#                               board, the board is solved again by DP_JumpIt
+#                   maxExtraGenerations(float)
+#                       Use:    How many more generations the GA may run, by
+#                               default populationSize, a fifteenth of the
+#                               default budget of a full run
+#                   maxExtraStagnantGenerations(float)
+#                       Use:    The maxStagnantGenerations of the continuation, by
+#                               default half of maxExtraGenerations. The solver's
+#                               own is used when it is lower
+# Returns:          A dictionary with the DP and GA results of the edited board, like
+#                   solveBoard
+# Description:      Re-solves a board edited in place: the tiles are changed in the
+#                   board, the DP tables of result are updated with DP_JumpItUpdate
+#                   and the GA goes on from its current population with
+#                   updateTiles. The GA keeps its generationCount and gets the
+#                   short budget of maxExtraGenerations, as most of its population
+#                   still fits the edited board. The solver's own maxGenerations
+#                   and maxStagnantGenerations are put back afterwards. A solver
+#                   with a maxJump other than 2 has its board solved again with
+#                   DP_JumpItK instead, and its result has no "DP_cost" table
+#--------------------------------------------------------------------------------------
+def resolveBoard(board, changes, solver, result=None, maxExtraGenerations=None, maxExtraStagnantGenerations=None):
+    # Give access to global variables
+    global DP_cost, DP_path
+
+    for tileID, tile in changes.items():
+        board[tileID] = tile
+    if solver.maxJump != 2:
+        DP_min_cost, pathTable = DP_JumpItK(board, solver.maxJump)
+        costTable = None
+    elif result is not None and len(result.get("DP_cost") or ()) == len(board) and len(result["DP_path"]) == len(board):
+        costTable = list(result["DP_cost"])
+        pathTable = list(result["DP_path"])
+        DP_min_cost = DP_JumpItUpdate(board, changes.keys(), costTable, pathTable)
+    else:
+        DP_cost = [0] * len(board)
+        DP_path = DP_cost[:]
+        DP_min_cost = DP_JumpIt(board)
+        costTable, pathTable = DP_cost, DP_path
+
+    if maxExtraGenerations is None:
+        maxExtraGenerations = solver.populationSize
+    if maxExtraStagnantGenerations is None:
+        maxExtraStagnantGenerations = maxExtraGenerations / 2
+
+    solver.updateTiles(changes)
+    maxGenerations, maxStagnantGenerations = solver.maxGenerations, solver.maxStagnantGenerations
+    solver.maxGenerations = solver.generationCount + maxExtraGenerations
+    solver.maxStagnantGenerations = min(maxStagnantGenerations, maxExtraStagnantGenerations)
+    try:
+        solver.resume()
+    finally:
+        solver.maxGenerations, solver.maxStagnantGenerations = maxGenerations, maxStagnantGenerations
+    return {
+        "DP_min_cost": DP_min_cost,
+        "DP_cost": costTable,
+        "DP_path": pathTable,
+        "GA_min_cost": solver.minCost,
+        "GA_path": solver.getPath(),
+        "generationCount": solver.generationCount,
+    }
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    readBoards
+# Parameters:       fileName(string)
+#                       Use:    Specifies the file to be read, which holds one game
+#                               board per line as whitespace separated tile costs
+#                   boardType(string)
+#                       Use:    "array" yields each board as a compact array("q"),
+#                               "numpy" as a 1-D int64 numpy array and "list" as the
+#                               list of ints the original driver built
+#                   useMmap(bool)
+#                       Use:    Parses the file from a read-only memory map instead of
+#                               through a file buffer, so that the OS pages very large
+#                               files in and out as they are read
+# Returns:          A generator of the game boards of the file, in file order
+# Description:      Reads and parses one line at a time, so the memory in use is
+#                   bounded by the longest line plus the boards the caller still holds
+#                   rather than by the size of the file. Blank lines are skipped
+#--------------------------------------------------------------------------------------
+def readBoards(fileName, boardType="array", useMmap=False):
+    if boardType not in ("array", "numpy", "list"):
+        raise ValueError("unknown board type: " + repr(boardType))
+    if boardType == "numpy" and np is None:
+        raise ImportError("the \"numpy\" board type requires numpy")
+
+    with open(fileName, "rb") as file:
+        if not useMmap:
+            yield from parseBoards(file, boardType)
+        elif os.fstat(file.fileno()).st_size > 0:   # An empty file cannot be mapped
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mappedFile:
+                yield from parseBoards(iter(mappedFile.readline, b""), boardType)
+    return
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    parseBoards
+# Parameters:       lines(iterable(bytes))
+#                       Use:    The lines of a board file
+#                   boardType(string)
+#                       Use:    See readBoards
+# Returns:          A generator of the game boards of the lines
+# Description:      Parses each line straight into the requested board type. The
+#                   "numpy" boards are parsed by numpy in C without building a Python
+#                   int per tile
+#--------------------------------------------------------------------------------------
+def parseBoards(lines, boardType):
+    for line in lines:
+        if line.isspace() or not line:
+            continue
+        if boardType == "numpy":
+            yield np.fromstring(line, dtype=np.int64, sep=" ")
+        elif boardType == "array":
+            yield array.array("q", map(int, line.split()))
+        else:
+            yield list(map(int, line.split()))
+    return
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    solveBoardChunk
+# Parameters:       boards(list)
+#                       Use:    The game boards to be solved
+#                   seeds(list(int))
+#                       Use:    The seed of each board
+#                   backend(string)
+#                       Use:    The population backend, see populationBackend
+# Returns:          The list of the results of solveBoard, one per board
+# Description:      The unit of work sent to a worker process by solveBoards, so that
+#                   small boards are not sent one at a time
+#--------------------------------------------------------------------------------------
+def solveBoardChunk(boards, seeds, backend="list"):
+    return [solveBoard(board, seed, backend) for board, seed in zip(boards, seeds)]
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    solveBoards
+# Parameters:       boards(iterable)
+#                       Use:    The game boards to be solved, e.g. from readBoards
+#                   numWorkers(int)
+#                       Use:    When None, the boards are solved one at a time in this
+#                               process. Otherwise the boards are solved by a pool of
+#                               numWorkers processes
+#                   baseSeed(int)
+#                       Use:    Used to derive the seed of each board from its
+#                               content with findBoardSeed, so the results do not
+#                               depend on the number of workers, on the order in which
+#                               they finish or on the cache hits, and a board seen
+#                               again gets the same cache key
+#                   backend(string)
+#                       Use:    The population backend, see populationBackend
+#                   chunkSize(int)
+#                       Use:    The number of boards sent to a worker at a time
+#                   cache(ResultCache)
+#                       Use:    See solveBoard. With numWorkers, the cache is looked
+#                               up in this process and only the misses are sent to the
+#                               workers. A board repeated while it is still being
+#                               solved is sent once and counted as a hit
+# Returns:          A generator of (board, result) pairs in the order of the boards
+# Description:      Solves the boards lazily. At most 2 chunks per worker are in
+#                   flight at once, so a file of millions of boards is never read
+#                   into memory as a whole, unlike ProcessPoolExecutor.map which
+#                   submits its whole input up front
+#--------------------------------------------------------------------------------------
+def solveBoards(boards, numWorkers=None, baseSeed=999, backend="list", chunkSize=16, cache=None):
+    if numWorkers is None:
+        for board in boards:
+            yield board, solveBoard(board, findBoardSeed(board, baseSeed), backend, cache)
+        return
+
+    boards = iter(boards)
+    pending = collections.deque()   # The chunks in flight in the order of the boards
+    inFlight = {}                   # [result, numOfWaiting] by the key of each board
+                                    # sent to a worker, where the result is None until
+                                    # it is back and numOfWaiting counts the repeats
+                                    # of the board waiting for it
+    with concurrent.futures.ProcessPoolExecutor(max_workers=numWorkers) as pool:
+        while True:
+            while len(pending) < 2 * numWorkers:
+                chunk = list(itertools.islice(boards, chunkSize))
+                if not chunk:
+                    break
+                seeds = [findBoardSeed(board, baseSeed) for board in chunk]
+
+                # Only the boards missing from the cache are sent to a worker. A
+                # repeat of a board already sent waits for its result instead
+                results = [None] * len(chunk)
+                keys = None
+                waitIDs = []
+                if cache is not None:
+                    keys = [resultKey(board, seed, backend) for board, seed in zip(chunk, seeds)]
+                    for i, key in enumerate(keys):
+                        if key in inFlight:
+                            inFlight[key][1] += 1
+                            waitIDs.append(i)
+                            continue
+                        results[i] = cache.get(key)
+                        if results[i] is None:
+                            inFlight[key] = [None, 0]
+                waiting = set(waitIDs)
+                missIDs = [i for i in range(0, len(chunk)) if results[i] is None and i not in waiting]
+                future = None
+                if missIDs:
+                    future = pool.submit(solveBoardChunk, [chunk[i] for i in missIDs], [seeds[i] for i in missIDs], backend)
+                pending.append((chunk, results, keys, missIDs, waitIDs, future))
+            if not pending:
+                break
+
+            # The board a repeat waits for is in the same chunk or an earlier one, so
+            # its result is always back by the time the repeat is yielded
+            chunk, results, keys, missIDs, waitIDs, future = pending.popleft()
+            if future is not None:
+                for i, result in zip(missIDs, future.result()):
+                    results[i] = result
+                    if cache is not None:
+                        cache.put(keys[i], result)
+                        entry = inFlight[keys[i]]
+                        entry[0] = result
+                        if entry[1] == 0:
+                            del inFlight[keys[i]]
+            for i in waitIDs:
+                entry = inFlight[keys[i]]
+                results[i] = entry[0]
+                cache.counters["hits"] += 1
+                entry[1] -= 1
+                if entry[1] == 0:
+                    del inFlight[keys[i]]
+            yield from zip(chunk, results)
+    return
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    runIslandEpoch
+# Parameters:       solver(GASolver)
+#                       Use:    The GA of one island, already started with begin
+#                   immigrants(list(list(int)))
+#                       Use:    The genomes migrating into the island
+#                   numOfGenerations(int)
+#                       Use:    The generations to evolve before the next migration
+#                   numOfMigrants(int)
+#                       Use:    How many of its best genomes the island sends out
+# Returns:          A dictionary with the minimum cost of the island, whether it has
+#                   stopped and its emigrants
+# Description:      One epoch of the island model. An island that has stopped keeps
+#                   its population and still sends out its best genomes
+#--------------------------------------------------------------------------------------
+def runIslandEpoch(solver, immigrants, numOfGenerations, numOfMigrants):
+    if immigrants:
+        solver.immigrate(immigrants)
+    for generation in range(0, numOfGenerations):
+        if solver.stopReason is not None:
+            break
+        solver.evolve()
+    return {
+        "minCost": solver.minCost,
+        "stopped": solver.stopReason is not None,
+        "migrants": solver.getBestGenomes(numOfMigrants),
+    }
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    summarizeIsland
+# Parameters:       solver(GASolver)
+#                       Use:    The GA of one island
+# Returns:          A dictionary with the results of the island
+#--------------------------------------------------------------------------------------
+def summarizeIsland(solver):
+    return {
+        "minCost": solver.minCost,
+        "path": solver.getPath(),
+        "generationCount": solver.generationCount,
+        "numOfEvaluations": solver.numOfEvaluations,
+        "stopReason": solver.stopReason,
+    }
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    islandWorker
+# Parameters:       connection(multiprocessing.connection.Connection)
+#                       Use:    The pipe to the process running solveIslands
+#                   board(list(int))
+#                       Use:    The game board
+#                   seed(int)
+#                       Use:    Seeds the GASolver of the island
+#                   solverOptions(dictionary)
+#                       Use:    Passed on to GASolver
+# Returns:          N/A
+# Description:      The body of an island process. Each message is the arguments of
+#                   runIslandEpoch except the solver, and is answered with its result.
+#                   None ends the island, which answers with summarizeIsland
+#--------------------------------------------------------------------------------------
+def islandWorker(connection, board, seed, solverOptions):
+    solver = GASolver(board, seed=seed, **solverOptions)
+    solver.begin()
+    while True:
+        message = connection.recv()
+        if message is None:
+            break
+        connection.send(runIslandEpoch(solver, *message))
+    connection.send(summarizeIsland(solver))
+    connection.close()
+    return
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    solveIslands
+# Parameters:       board(list(int))
+#                       Use:    The game board to be solved
+#                   numOfIslands(int)
+#                       Use:    The number of sub-populations, each evolved by its own
+#                               GASolver. Defaults to the number of CPUs
+#                   migrationInterval(int)
+#                       Use:    The generations between 2 migrations
+#                   numOfMigrants(int)
+#                       Use:    How many of its best genomes each island sends to each
+#                               of its neighbours at a migration
+#                   topology(string)
+#                       Use:    "ring" sends the migrants of island i to island i + 1,
+#                               "full" sends them to every other island
+#                   seed(int)
+#                       Use:    Seeds the seeds of the islands
+#                   useProcesses(bool)
+#                       Use:    Runs every island in its own process. When False, the
+#                               islands take turns in this process, with the same
+#                               results
+#                   solverOptions(keyword arguments)
+#                       Use:    Passed on to the GASolver of every island
+# Returns:          A dictionary with the best cost and path of all of the islands,
+#                   the most generations and the total evaluations of any island, and
+#                   the results of each island under "islands"
+# Description:      The island model GA. The islands evolve migrationInterval
+#                   generations at a time, then this process routes the emigrants of
+#                   every island to its neighbours, which replace their least fit
+#                   chromosomes with them. The migrations are synchronous, so a run
+#                   only depends on its seed, and the model ends once every island has
+#                   met its own stopping rules
+#--------------------------------------------------------------------------------------
+def solveIslands(board, numOfIslands=None, migrationInterval=50, numOfMigrants=2, topology="ring",
+                 seed=None, useProcesses=True, **solverOptions):
+    if topology not in ("ring", "full"):
+        raise ValueError("unknown island topology: " + repr(topology))
+    if hasattr(board, "tolist"):
+        board = board.tolist()
+    if numOfIslands is None:
+        numOfIslands = os.cpu_count() or 1
+    seedGenerator = rng.Random(seed)
+    seeds = [seedGenerator.randrange(1 << 63) for _ in range(0, numOfIslands)]
+
+    connections = []
+    processes = []
+    solvers = []
+    try:
+        if useProcesses:
+            for islandID in range(0, numOfIslands):
+                connection, workerConnection = multiprocessing.Pipe()
+                process = multiprocessing.Process(target=islandWorker, args=(workerConnection, board, seeds[islandID], solverOptions), daemon=True)
+                process.start()
+                workerConnection.close()
+                connections.append(connection)
+                processes.append(process)
+        else:
+            for islandID in range(0, numOfIslands):
+                solver = GASolver(board, seed=seeds[islandID], **solverOptions)
+                solver.begin()
+                solvers.append(solver)
+
+        # Evolve and migrate until every island has stopped
+        immigrants = [[] for _ in range(0, numOfIslands)]
+        while True:
+            if useProcesses:
+                for islandID in range(0, numOfIslands):
+                    connections[islandID].send((immigrants[islandID], migrationInterval, numOfMigrants))
+                replies = [connection.recv() for connection in connections]
+            else:
+                replies = [runIslandEpoch(solvers[islandID], immigrants[islandID], migrationInterval, numOfMigrants) for islandID in range(0, numOfIslands)]
+            if all(reply["stopped"] for reply in replies):
+                break
+
+            immigrants = [[] for _ in range(0, numOfIslands)]
+            for islandID, reply in enumerate(replies):
+                if topology == "ring":
+                    neighbourIDs = [(islandID + 1) % numOfIslands]
+                else:
+                    neighbourIDs = [neighbourID for neighbourID in range(0, numOfIslands) if neighbourID != islandID]
+                for neighbourID in neighbourIDs:
+                    if neighbourID != islandID:
+                        immigrants[neighbourID].extend(reply["migrants"])
+
+        if useProcesses:
+            for connection in connections:
+                connection.send(None)
+            islands = [connection.recv() for connection in connections]
+        else:
+            islands = [summarizeIsland(solver) for solver in solvers]
+    finally:
+        for connection in connections:
+            connection.close()
+        for process in processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+
+    best = min(islands, key=lambda island: island["minCost"])
+    return {
+        "GA_min_cost": best["minCost"],
+        "GA_path": best["path"],
+        "generationCount": max(island["generationCount"] for island in islands),
+        "numOfEvaluations": sum(island["numOfEvaluations"] for island in islands),
+        "islands": islands,
+    }
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    tracePath
+# Parameters:       nextCell(list(int))
+#                       Use:    A path table like DP_path, where nextCell[i] is the
+#                               tile moved to from tile i and -1 ends the path
+# Returns:          The indices of the tiles visited from tile 0, in order
+#--------------------------------------------------------------------------------------
+def tracePath(nextCell):
+    path = [0]
+    while nextCell[path[-1]] != -1:
+        path.append(nextCell[path[-1]])
+    return path
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# CLASS DESCRIPTION--------------------------------------------------------------------
+# Class Name:       ResultWriter
+# Description:      Writes one record per solved board to a JSON Lines or CSV file
+#                   through a large write buffer, in place of the text driver prints
+#                   for every board. Paths are written as the indices of the visited
+#                   tiles, separated by spaces in the CSV format. Use as a context
+#                   manager, or call close when done
+#--------------------------------------------------------------------------------------
+class ResultWriter:
+    __slots__ = (
+        "file",                     # The output file
+        "outputFormat",             # "jsonl" or "csv"
+        "includePaths",             # Whether the DP and GA paths are written
+        "csvWriter",                # The csv.writer of the "csv" format
+    )
+
+    fieldNames = ("boardID", "numOfTiles", "DP_min_cost", "GA_min_cost", "correct", "generationCount", "DP_path", "GA_path")
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      __init__
+    # Parameters:       fileName(string)
+    #                       Use:    The file to be written
+    #                   outputFormat(string)
+    #                       Use:    "jsonl" or "csv". When None, "csv" is used for
+    #                               file names ending in .csv and "jsonl" otherwise
+    #                   includePaths(bool)
+    #                       Use:    Whether the paths are written. They are as long as
+    #                               the boards, so leave them out for huge boards
+    #                   bufferSize(int)
+    #                       Use:    The size in bytes of the write buffer
+    # Returns:          N/A
+    #----------------------------------------------------------------------------------
+    def __init__(self, fileName, outputFormat=None, includePaths=True, bufferSize=1 << 20):
+        if outputFormat is None:
+            outputFormat = "csv" if fileName.lower().endswith(".csv") else "jsonl"
+        if outputFormat not in ("jsonl", "csv"):
+            raise ValueError("unknown output format: " + repr(outputFormat))
+
+        self.file = open(fileName, "w", buffering=bufferSize, newline="")
+        self.outputFormat = outputFormat
+        self.includePaths = includePaths
+        self.csvWriter = None
+        if outputFormat == "csv":
+            fieldNames = ResultWriter.fieldNames if includePaths else ResultWriter.fieldNames[:-2]
+            self.csvWriter = csv.writer(self.file)
+            self.csvWriter.writerow(fieldNames)
+        return
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      write
+    # Parameters:       boardID(int)
+    #                       Use:    The position of the board in its input file
+    #                   board(sequence(int))
+    #                       Use:    The game board that was solved
+    #                   result(dictionary)
+    #                       Use:    The result of solveBoard for the board
+    # Returns:          N/A
+    #----------------------------------------------------------------------------------
+    def write(self, boardID, board, result):
+        record = [
+            boardID,
+            len(board),
+            result["DP_min_cost"],
+            result["GA_min_cost"],
+            result["DP_min_cost"] == result["GA_min_cost"],
+            result["generationCount"],
+        ]
+        if self.includePaths:
+            record.append(tracePath(result["DP_path"]))
+            record.append(result["GA_path"][:-1])   # Without the -1 end marker
+
+        if self.csvWriter is not None:
+            if self.includePaths:
+                record[-2] = " ".join(map(str, record[-2]))
+                record[-1] = " ".join(map(str, record[-1]))
+            self.csvWriter.writerow(record)
+        else:
+            self.file.write(json.dumps(dict(zip(ResultWriter.fieldNames, record)), separators=(",", ":")))
+            self.file.write("\n")
+        return
+
+    #/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+    # METHOD DESCRIPTION---------------------------------------------------------------
+    # Method Name:      close
+    # Parameters:       N/A
+    # Returns:          N/A
+    # Description:      Flushes the write buffer and closes the file
+    #----------------------------------------------------------------------------------
+    def close(self):
+        self.file.close()
+        return
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close()
+        return False
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
 
 # FUNCTION DESCRIPTION-----------------------------------------------------------------
 # Function Name:    driver
 # Parameters:       filename(string)
 #                       Use:    Specifies the file to be opened and interpreted as
 #                               game boards for the JumpIt game
+#                   numWorkers(int)
+#                       Use:    When None, the boards are solved one at a time in this
+#                               process. Otherwise the boards are solved by a pool of
+#                               numWorkers processes
+#                   baseSeed(int)
+#                       Use:    Used to derive the seed of each board from its
+#                               content, so the output does not depend on the number
+#                               of workers or on the order in which the workers
+#                               finish, see solveBoards
+#                   outputFileName(string)
+#                       Use:    When None, the results of every board are printed as
+#                               before. Otherwise they are written to this file by a
+#                               ResultWriter and only the overall accuracy is printed
+#                   useMmap(bool)
+#                       Use:    Reads the file through a memory map, see readBoards
+#                   cache(ResultCache)
+#                       Use:    Reuses the results of boards solved before, see
+#                               solveBoards
 # Returns:          N/A
 # Description:      Some code provided by Dr. Jamil Saquer of Missouri State University
 #                   namely the code for file handling and performing actions per line
 #                   in the file. Modified slightly by me to include GA code interaction
-#                   and calculation/display of GA statistics
+#                   and calculation/display of GA statistics. The boards are streamed
+#                   from the file and solved as they are read
 #--------------------------------------------------------------------------------------
-def driver(fileName):
+def driver(fileName, numWorkers=None, baseSeed=999, outputFileName=None, useMmap=False, cache=None):
     # Give access to global variables
-    global DP_cost, GA_cost, DP_path, GA_path, DP_min_cost, GA_min_cost, population, generationCount
+    global DP_path, GA_path
 
     # Initialize local variables
     numCorrect = 0  # For use when calculating GA accuracy
     total = 0       # For use when calculating GA accuracy
 
-    # File Handling
-    file = open(fileName, "r")
-    # For each game board in the file, do stuff
-    for line in file:
-        lyst = line.split() # tokenize input line, it also removes EOL marker
-        lyst = list(map(int, lyst))
-        DP_cost = [0] * len(lyst)
-        DP_path = DP_cost[:]
-        DP_min_cost = DP_JumpIt(lyst)   # Calculate the minimum using the DP approach
+    # Results are produced lazily and in input order in both modes, so they can be
+    # written while the remaining boards are still being read and solved
+    boards = readBoards(fileName, "array", useMmap)
+    results = solveBoards(boards, numWorkers, baseSeed, populationBackend, cache=cache)
+
+    if outputFileName is not None:
+        with ResultWriter(outputFileName) as writer:
+            for boardID, (lyst, result) in enumerate(results):
+                writer.write(boardID, lyst, result)
+                if result["DP_min_cost"] == result["GA_min_cost"]:
+                    numCorrect += 1
+                total += 1
+        print("GA Overall Accuracy: ", (numCorrect / total) * 100, end = "%")
+        print()
+        return
+
+    # For each game board in the file, display the results
+    for lyst, result in results:
+        lyst = list(lyst)
+        DP_path = result["DP_path"]
         print()
         print("=====================================================================================")
         print("game board:", lyst)
         print("___________________________")
         print("DP Solution")
-        print("Minimum Cost: ", DP_min_cost)
+        print("Minimum Cost: ", result["DP_min_cost"])
         displayPath(lyst, False)
         print("___________________________")
 
-        # My implementation of this function starts largely from here
-        generationCount = 1     # Reset generation counter
-        GA_JumpIt(lyst)         # Perform the GA
-
         # Update the data for accuracy calculation
-        if DP_min_cost == GA_min_cost:
+        if result["DP_min_cost"] == result["GA_min_cost"]:
             numCorrect += 1
         total += 1
 
-        # Update the path taken by the GA, based upon the most fit chromosome
-        for i in range(0, len(population[GA_minCostID])):
-            if population[GA_minCostID][i] == 1:
-                GA_path.append(i)
-        # Add a value that signifies the end of the path
-        GA_path.append(-1)
-
         # Display information
+        GA_path = result["GA_path"]
         print("GA Solution")
-        print("Generations Iterated: ", generationCount)
-        print("Minimum Cost (fitness): ", GA_min_cost)
+        print("Generations Iterated: ", result["generationCount"])
+        print("Minimum Cost (fitness): ", result["GA_min_cost"])
         displayPath(lyst, True)
         print("___________________________")
     print()
@@ -612,7 +4462,7 @@ def driver(fileName):
     print()
     return
 
-#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
 
 # FUNCTION DESCRIPTION-----------------------------------------------------------------
 # Function Name:    main
@@ -625,7 +4475,14 @@ def main():
     # representation of game boards for a JumpIt game. This is where you define the
     # file to be used.
     fileName = "input2.txt"
-    driver(fileName)
+    # The number of worker processes used to solve the boards in parallel. None
+    # solves them one at a time. Each board is seeded from its content, so the output
+    # is the same on every run and for any number of workers. It is not the output
+    # of the original program, as the GA has changed since, e.g. in how ties between
+    # the least fit entities are broken
+    numWorkers = None
+    driver(fileName, numWorkers)
     return
 
-main()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
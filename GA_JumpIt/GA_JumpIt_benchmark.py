@@ -0,0 +1,849 @@
+#!/usr/bin/env python3
+
+# INFORMATION--------------------------------------------------------------------------
+# DEVELOPER:        Anthony Harris
+# SLATE:            Anthony999
+# PURPOSE:          Benchmarks for the GA defined in GA_JumpIt.py and the DP solutions
+#                   it is compared against
+#--------------------------------------------------------------------------------------
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# IMPORTS------------------------------------------------------------------------------
+import sys
+import os
+import platform
+import argparse
+import json
+import time
+import random as rng
+import tracemalloc
+import tempfile
+import pickle
+import subprocess
+
+import GA_JumpIt
+import jumpIt_DP_solution_with_path as DPModule
+#--------------------------------------------------------------------------------------
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    randomBoard
+# Parameters:       numOfTiles(int)
+#                       Use:    The length of the board
+#                   seed(int)
+#                       Use:    Seeds the generator of the tile costs
+#                   maxCost(int)
+#                       Use:    The largest cost of a tile
+# Returns:          A game board whose first tile costs 0, like the boards of the
+#                   input files, and whose other tiles cost 1 to maxCost
+#--------------------------------------------------------------------------------------
+def randomBoard(numOfTiles, seed=0, maxCost=100):
+    generator = rng.Random(seed)
+    return [0] + [generator.randint(1, maxCost) for _ in range(numOfTiles - 1)]
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    measureAllocations
+# Parameters:       board(list(int))
+#                       Use:    The game board to evolve a population for
+#                   numOfGenerations(int)
+#                       Use:    The number of steady-state generations measured
+#                   solverOptions(keyword arguments)
+#                       Use:    Passed on to GA_JumpIt.GASolver
+# Returns:          A dictionary with the memory allocated by the measured generations
+# Description:      Runs 2 warm-up generations, which allocate the double buffers of
+#                   the population, then measures the following generations twice.
+#                   "netBlocks" is the change in the number of memory blocks held by
+#                   the interpreter over the untraced generations, so it counts the
+#                   objects a generation keeps. It moves by a few blocks either way
+#                   as costs cross the small ints CPython keeps cached. "peakBytes"
+#                   is the largest amount of memory in use at once during a traced
+#                   generation on top of what was in use when it started. Both are
+#                   reported next to the size of one genome and of the whole
+#                   population, which a generation that copied chromosomes would
+#                   have to allocate
+#--------------------------------------------------------------------------------------
+def measureAllocations(board, numOfGenerations=10, **solverOptions):
+    solver = GA_JumpIt.GASolver(board, **solverOptions)
+    solver.initialize()
+    for chromosomeID in range(0, solver.populationSize):
+        solver.calcCost(chromosomeID)
+        solver.calcFitness(chromosomeID)
+
+    def generation():
+        solver.populate()
+        for chromosomeID in solver.changedIDs:
+            solver.calcFitness(chromosomeID)
+
+    for i in range(0, 2):
+        generation()
+
+    startBlocks = sys.getallocatedblocks()
+    for i in range(0, numOfGenerations):
+        generation()
+    netBlocks = sys.getallocatedblocks() - startBlocks
+
+    tracemalloc.start()
+    try:
+        peakBytes = 0
+        for i in range(0, numOfGenerations):
+            tracemalloc.reset_peak()
+            currentBytes = tracemalloc.get_traced_memory()[0]
+            generation()
+            peakBytes = max(peakBytes, tracemalloc.get_traced_memory()[1] - currentBytes)
+    finally:
+        tracemalloc.stop()
+
+    if solver.backend == "numpy":
+        genomeBytes = solver.population[0].nbytes
+    else:
+        genomeBytes = sys.getsizeof(solver.population[0])
+    return {
+        "numOfTiles": len(board),
+        "backend": solver.backend,
+        "generations": numOfGenerations,
+        "netBlocks": netBlocks,
+        "peakBytes": peakBytes,
+        "genomeBytes": genomeBytes,
+        "populationBytes": genomeBytes * solver.populationSize,
+    }
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    checkAllocations
+# Parameters:       numOfTiles(int)
+#                       Use:    The length of the smaller of the 2 random boards
+#                   solverOptions(keyword arguments)
+#                       Use:    Passed on to measureAllocations
+# Returns:          A dictionary with the measurements of a board of numOfTiles and
+#                   one 4 times as long, the "growthBytes" of the peak between them
+#                   and whether the generations are "allocationFree"
+# Description:      A generation always makes a few short-lived ints and floats, so
+#                   its peak is never 0. What it must not allocate is anything that
+#                   grows with the board, like a copy of a genome, a list of the
+#                   crossover points or a table of prefix costs. The smallest of
+#                   those, one byte per gene, would grow the peak by 3 * numOfTiles
+#                   bytes between the 2 boards, so the generations only count as
+#                   allocation-free when it grows by less than numOfTiles bytes
+#--------------------------------------------------------------------------------------
+def checkAllocations(numOfTiles=400, **solverOptions):
+    small = measureAllocations(randomBoard(numOfTiles), seed=0, **solverOptions)
+    large = measureAllocations(randomBoard(4 * numOfTiles), seed=0, **solverOptions)
+    growthBytes = large["peakBytes"] - small["peakBytes"]
+    return {"small": small, "large": large, "growthBytes": growthBytes, "allocationFree": growthBytes < numOfTiles}
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    timeCall
+# Parameters:       function(callable)
+#                       Use:    The call to be measured, made without arguments
+#                   repeats(int)
+#                       Use:    The number of timed calls. The fastest one is kept,
+#                               which filters out noise on calls that take microseconds
+#                   measureMemory(bool)
+#                       Use:    Whether the call is made once more under tracemalloc
+# Returns:          A tuple of the value returned by the call, the seconds taken by
+#                   the call and its peak traced memory in bytes (None when not
+#                   measured)
+# Description:      The timed calls are made without tracing, as tracemalloc slows
+#                   every allocation down, so the memory is measured by a separate
+#                   call. The call must be deterministic for both to measure the same
+#                   work
+#--------------------------------------------------------------------------------------
+def timeCall(function, repeats=1, measureMemory=True):
+    seconds = float("inf")
+    for i in range(0, repeats):
+        start = time.perf_counter()
+        value = function()
+        seconds = min(seconds, time.perf_counter() - start)
+
+    peakBytes = None
+    if measureMemory:
+        tracemalloc.start()
+        try:
+            function()
+            peakBytes = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return value, seconds, peakBytes
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    runDP
+# Parameters:       board(list(int))
+#                       Use:    The game board to be solved
+# Returns:          The minimum cost of the board found by GA_JumpIt.DP_JumpIt
+# Description:      Allocates the global tables DP_JumpIt works in, like solveBoard
+#--------------------------------------------------------------------------------------
+def runDP(board):
+    GA_JumpIt.DP_cost = [0] * len(board)
+    GA_JumpIt.DP_path = GA_JumpIt.DP_cost[:]
+    return GA_JumpIt.DP_JumpIt(board)
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    runDPModule
+# Parameters:       board(list(int))
+#                       Use:    The game board to be solved
+# Returns:          The minimum cost of the board found by the jumpIt function of
+#                   jumpIt_DP_solution_with_path.py
+# Description:      Allocates the global tables jumpIt works in, like the main of its
+#                   module
+#--------------------------------------------------------------------------------------
+def runDPModule(board):
+    DPModule.cost = [0] * len(board)
+    DPModule.path = DPModule.cost[:]
+    return DPModule.jumpIt(board)
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    benchmarkBoard
+# Parameters:       board(list(int))
+#                       Use:    The game board to be solved
+#                   runGA(bool)
+#                       Use:    Whether the GA is run. When False only the DPs are
+#                               run
+#                   backend(string)
+#                       Use:    The population backend of the GA
+#                   seed(int)
+#                       Use:    Seeds the GASolver
+#                   populationCap(int), generationCap(int)
+#                       Use:    Upper bounds on the population size and on the
+#                               maximum number of generations of the GA, which
+#                               otherwise grow with the length of the board
+#                   measureMemory(bool)
+#                       Use:    Whether the peak memory of each solver is measured
+# Returns:          A dictionary with the measurements of the DPs and of the GA.
+#                   "optimalityGap" is how far the GA's cost is above the optimal
+#                   cost, relative to the optimal cost
+#--------------------------------------------------------------------------------------
+def benchmarkBoard(board, runGA=True, backend="list", seed=0, populationCap=100, generationCap=100, measureMemory=True):
+    result = {"numOfTiles": len(board)}
+
+    dpCost, seconds, peakBytes = timeCall(lambda: runDP(board), 5, measureMemory)
+    result["DP"] = {"seconds": seconds, "peakBytes": peakBytes, "minCost": dpCost}
+    moduleCost, seconds, peakBytes = timeCall(lambda: runDPModule(board), 5, measureMemory)
+    result["DP_module"] = {"seconds": seconds, "peakBytes": peakBytes, "minCost": moduleCost}
+    streamingCost, seconds, peakBytes = timeCall(lambda: GA_JumpIt.DP_minCostStreaming(board), 5, measureMemory)
+    result["DP_streaming"] = {"seconds": seconds, "peakBytes": peakBytes, "minCost": streamingCost}
+    bitsCost, seconds, peakBytes = timeCall(lambda: GA_JumpIt.DP_JumpItBits(reversed(board))[0], 5, measureMemory)
+    result["DP_bits"] = {"seconds": seconds, "peakBytes": peakBytes, "minCost": bitsCost}
+
+    result["GA"] = None
+    if not runGA:
+        return result
+
+    populationSize = min(3 * len(board), populationCap)
+    maxGenerations = min(15 * populationSize, generationCap)
+
+    def solve():
+        solver = GA_JumpIt.GASolver(board, populationSize=populationSize, maxGenerations=maxGenerations, backend=backend, seed=seed)
+        solver.solve()
+        return solver
+
+    solver, seconds, peakBytes = timeCall(solve, 1, measureMemory)
+    result["GA"] = {
+        "backend": backend,
+        "populationSize": populationSize,
+        "maxGenerations": maxGenerations,
+        "seconds": seconds,
+        "peakBytes": peakBytes,
+        "generations": solver.generationCount,
+        "evaluations": solver.numOfEvaluations,
+        "evaluationsPerSecond": solver.numOfEvaluations / seconds,
+        "secondsPerGeneration": seconds / solver.generationCount,
+        "hitGenerationLimit": solver.generationCount >= maxGenerations,
+        "minCost": solver.minCost,
+        "optimalityGap": (solver.minCost - dpCost) / dpCost if dpCost else 0.0,
+        "timeRelativeToDP": seconds / result["DP"]["seconds"],
+    }
+    return result
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    runSuite
+# Parameters:       sizes(list(int))
+#                       Use:    The lengths of the random boards to be benchmarked
+#                   gaMaxTiles(int)
+#                       Use:    The GA is only run on boards of up to this length,
+#                               the DPs are run on all of them
+#                   seed(int)
+#                       Use:    Seeds the boards and the GA
+#                   benchmarkOptions(keyword arguments)
+#                       Use:    Passed on to benchmarkBoard
+# Returns:          A dictionary describing the run and holding the results of each
+#                   board size, ready to be written as JSON
+#--------------------------------------------------------------------------------------
+def runSuite(sizes, gaMaxTiles=10000, seed=0, **benchmarkOptions):
+    results = []
+    for numOfTiles in sizes:
+        print("benchmarking %d tiles" % numOfTiles, file=sys.stderr)
+        board = randomBoard(numOfTiles, seed)
+        results.append(benchmarkBoard(board, numOfTiles <= gaMaxTiles, seed=seed, **benchmarkOptions))
+    return {
+        "python": platform.python_implementation() + " " + platform.python_version(),
+        "machine": platform.machine(),
+        "numpy": GA_JumpIt.np.__version__ if GA_JumpIt.np is not None else None,
+        "seed": seed,
+        "gaMaxTiles": gaMaxTiles,
+        "options": benchmarkOptions,
+        "results": results,
+    }
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    compareWarmStarts
+# Parameters:       sizes(list(int))
+#                       Use:    The lengths of the random boards
+#                   numOfBoards(int)
+#                       Use:    The number of boards of each length
+#                   warmStartFraction(float)
+#                       Use:    The fraction of the initial population that is seeded
+#                   backend(string)
+#                       Use:    The population backend of the GA
+# Returns:          A list of dictionaries, one per board length and warm start
+# Description:      Solves the same boards with the same seeds starting from the
+#                   random initializer and from each warm start. "convergedAt" is
+#                   the generation of the last improvement of the best cost, taken
+#                   from a GenerationRecorder, and "optimal" is the fraction of the
+#                   boards solved to the DP's cost
+#--------------------------------------------------------------------------------------
+def compareWarmStarts(sizes, numOfBoards=5, warmStartFraction=0.2, backend="list"):
+    warmStarts = {"random": [], "greedy": ["greedy"], "windowedDP": ["windowedDP"], "greedy+windowedDP": ["greedy", "windowedDP"]}
+    results = []
+    for numOfTiles in sizes:
+        boards = [randomBoard(numOfTiles, seed) for seed in range(0, numOfBoards)]
+        optimalCosts = [GA_JumpIt.DP_minCostStreaming(board) for board in boards]
+        for name, strategies in warmStarts.items():
+            convergedAt = 0
+            generations = 0
+            numOptimal = 0
+            for seed, (board, optimalCost) in enumerate(zip(boards, optimalCosts)):
+                recorder = GA_JumpIt.GenerationRecorder()
+                solver = GA_JumpIt.GASolver(board, backend=backend, seed=seed, recorder=recorder,
+                                            warmStartStrategies=strategies, warmStartFraction=warmStartFraction)
+                solver.solve()
+                convergedAt += min(row["generation"] for row in recorder.rows if row["bestCost"] == solver.minCost)
+                generations += solver.generationCount
+                numOptimal += solver.minCost == optimalCost
+            results.append({
+                "numOfTiles": numOfTiles,
+                "warmStart": name,
+                "convergedAt": convergedAt / numOfBoards,
+                "generations": generations / numOfBoards,
+                "optimal": numOptimal / numOfBoards,
+            })
+    return results
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    compareIslands
+# Parameters:       sizes(list(int))
+#                       Use:    The lengths of the random boards
+#                   numOfBoards(int)
+#                       Use:    The number of boards of each length
+#                   maxSeconds(float)
+#                       Use:    The wall-clock budget of every run
+#                   numOfIslands(int)
+#                       Use:    The islands of solveIslands, defaults to the number of
+#                               CPUs
+#                   backend(string)
+#                       Use:    The population backend of the GA
+# Returns:          A list of dictionaries, one per board length and mode
+# Description:      Solves the same boards with a single GASolver and with
+#                   solveIslands in both topologies, every run stopped by the same
+#                   wall-clock StoppingPolicy. "gap" is the mean relative distance of
+#                   the best cost from the DP's cost
+#--------------------------------------------------------------------------------------
+def compareIslands(sizes, numOfBoards=3, maxSeconds=2.0, numOfIslands=None, backend="list"):
+    results = []
+    for numOfTiles in sizes:
+        boards = [randomBoard(numOfTiles, seed) for seed in range(0, numOfBoards)]
+        optimalCosts = [GA_JumpIt.DP_minCostStreaming(board) for board in boards]
+        for mode in ("single", "ring", "full"):
+            gap = 0.0
+            numOptimal = 0
+            for seed, (board, optimalCost) in enumerate(zip(boards, optimalCosts)):
+                policy = GA_JumpIt.StoppingPolicy(maxSeconds=maxSeconds, targetCost=optimalCost)
+                if mode == "single":
+                    solver = GA_JumpIt.GASolver(board, backend=backend, seed=seed, stoppingPolicy=policy)
+                    minCost = solver.solve()
+                else:
+                    minCost = GA_JumpIt.solveIslands(board, numOfIslands, topology=mode, seed=seed,
+                                                     backend=backend, stoppingPolicy=policy)["GA_min_cost"]
+                gap += (minCost - optimalCost) / optimalCost
+                numOptimal += minCost == optimalCost
+            results.append({
+                "numOfTiles": numOfTiles,
+                "mode": mode,
+                "gap": gap / numOfBoards,
+                "optimal": numOptimal / numOfBoards,
+            })
+    return results
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    benchmarkCheckpoints
+# Parameters:       sizes(list(int))
+#                       Use:    The lengths of the random boards
+#                   numOfGenerations(int)
+#                       Use:    The generations run before the checkpoint
+#                   backend(string)
+#                       Use:    The population backend of the GA
+# Returns:          A list of dictionaries, one per board length
+# Description:      Saves and loads a checkpoint of a GA run on each board with the
+#                   default population of 3 times its length. "pickleBytes" is the
+#                   size of a pickle of the population, cost and fitness lists, for
+#                   comparison with "fileBytes"
+#--------------------------------------------------------------------------------------
+def benchmarkCheckpoints(sizes, numOfGenerations=5, backend="list"):
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        fileName = os.path.join(directory, "checkpoint.bin")
+        for numOfTiles in sizes:
+            solver = GA_JumpIt.GASolver(randomBoard(numOfTiles), backend=backend, seed=0)
+            solver.begin()
+            for generation in range(0, numOfGenerations):
+                solver.evolve()
+            population = [list(map(int, solver.getGenes(chromosomeID))) for chromosomeID in range(0, solver.populationSize)]
+            pickleBytes = len(pickle.dumps((population, solver.cost, solver.fitness)))
+            saveSeconds = min(solver.saveCheckpoint(fileName) for i in range(0, 3))
+            loadSeconds = timeCall(lambda: GA_JumpIt.loadCheckpoint(fileName), repeats=3, measureMemory=False)[1]
+            results.append({
+                "numOfTiles": numOfTiles,
+                "populationSize": solver.populationSize,
+                "backend": backend,
+                "fileBytes": os.path.getsize(fileName),
+                "pickleBytes": pickleBytes,
+                "saveSeconds": saveSeconds,
+                "loadSeconds": loadSeconds,
+            })
+    return results
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# CLASS DESCRIPTION--------------------------------------------------------------------
+# Class Name:       CountingRandom
+# Description:      A random.Random that counts its calls to random(), the draw used
+#                   by the mutations of the GA
+#--------------------------------------------------------------------------------------
+class CountingRandom(rng.Random):
+    def __init__(self, seed=None):
+        self.numOfDraws = 0
+        super().__init__(seed)
+        return
+
+    def random(self):
+        self.numOfDraws += 1
+        return super().random()
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    compareMutationModes
+# Parameters:       sizes(list(int))
+#                       Use:    The lengths of the random boards
+#                   numOfGenerations(int)
+#                       Use:    The generations run on each board
+#                   mutationRate(float)
+#                       Use:    The mutation rate of the GA
+#                   backend(string)
+#                       Use:    The population backend of the GA
+# Returns:          A list of dictionaries, one per board length and mutation mode
+# Description:      Runs the GA for a fixed number of generations with each of the
+#                   mutationModes of GASolver. The per-generation figures leave out
+#                   the initial population, and "mutateSeconds" is the "mutate" phase
+#                   of a GenerationRecorder
+#--------------------------------------------------------------------------------------
+def compareMutationModes(sizes, numOfGenerations=50, mutationRate=0.01, backend="list"):
+    results = []
+    for numOfTiles in sizes:
+        board = randomBoard(numOfTiles)
+        for mode in ("perGene", "skip"):
+            randomGenerator = CountingRandom(0)
+            recorder = GA_JumpIt.GenerationRecorder()
+            solver = GA_JumpIt.GASolver(board, backend=backend, randomGenerator=randomGenerator, recorder=recorder,
+                                        mutationRate=mutationRate, mutationMode=mode)
+            solver.begin()
+            numOfInitialDraws = randomGenerator.numOfDraws
+            for generation in range(0, numOfGenerations):
+                solver.evolve()
+            rows = recorder.rows[1:]
+            results.append({
+                "numOfTiles": numOfTiles,
+                "populationSize": solver.populationSize,
+                "mutationMode": mode,
+                "drawsPerGeneration": (randomGenerator.numOfDraws - numOfInitialDraws) / numOfGenerations,
+                "mutationsPerGeneration": sum(row["mutations"] for row in rows) / numOfGenerations,
+                "mutateSeconds": sum(row["mutate"] for row in rows) / numOfGenerations,
+                "generationSeconds": sum(row["seconds"] for row in rows) / numOfGenerations,
+                "bestCost": solver.minCost,
+            })
+    return results
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    benchmarkResolve
+# Parameters:       sizes(list(int))
+#                       Use:    The lengths of the random boards
+#                   editSizes(list(int))
+#                       Use:    The numbers of tiles changed by each edit
+#                   backend(string)
+#                       Use:    The population backend of the GA
+#                   populationCap(int)
+#                       Use:    The largest population of the GA
+# Returns:          A list of dictionaries, one per board length and edit size
+# Description:      Times the update of the DP tables by DP_JumpItUpdate against
+#                   DP_JumpIt on the whole board, and the update of the population
+#                   costs by GASolver.updateTiles against the costing of a new
+#                   population by begin. The edits are spread over the whole board
+#--------------------------------------------------------------------------------------
+def benchmarkResolve(sizes, editSizes=(1, 10, 100), backend="list", populationCap=300):
+    results = []
+    editRandom = rng.Random(0)
+    for numOfTiles in sizes:
+        board = randomBoard(numOfTiles)
+        populationSize = min(3 * numOfTiles, populationCap)
+        solver = GA_JumpIt.GASolver(board, backend=backend, seed=0, populationSize=populationSize)
+        scratchSeconds = timeCall(solver.begin, measureMemory=False)[1]
+        fullDPSeconds = timeCall(lambda: runDP(board), measureMemory=False)[1]
+        for editSize in editSizes:
+            changes = {editRandom.randrange(numOfTiles): editRandom.randint(1, 100) for _ in range(0, editSize)}
+            for tileID, tile in changes.items():
+                board[tileID] = tile
+            start = time.perf_counter()
+            GA_JumpIt.DP_JumpItUpdate(board, changes.keys(), GA_JumpIt.DP_cost, GA_JumpIt.DP_path)
+            updateDPSeconds = time.perf_counter() - start
+            start = time.perf_counter()
+            solver.updateTiles(changes)
+            updateGASeconds = time.perf_counter() - start
+            results.append({
+                "numOfTiles": numOfTiles,
+                "editSize": len(changes),
+                "fullDPSeconds": fullDPSeconds,
+                "updateDPSeconds": updateDPSeconds,
+                "newPopulationSeconds": scratchSeconds,
+                "updateTilesSeconds": updateGASeconds,
+            })
+    return results
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    runDPNaive
+# Parameters:       board(list(int))
+#                       Use:    The game board to be solved
+#                   maxJump(int)
+#                       Use:    The most tiles a single move may advance
+# Returns:          The minimum cost of the board, found by scanning all maxJump
+#                   candidates of every tile in O(n * maxJump)
+# Description:      The reference compareMaxJumps checks and times
+#                   GA_JumpIt.DP_JumpItK against
+#--------------------------------------------------------------------------------------
+def runDPNaive(board, maxJump):
+    n = len(board)
+    cost = [0] * n
+    cost[n - 1] = board[n - 1]
+    for i in range(n - 2, -1, -1):
+        cost[i] = board[i] + min(cost[i + 1:i + maxJump + 1])
+    return cost[0]
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    compareMaxJumps
+# Parameters:       sizes(list(int))
+#                       Use:    The lengths of the random boards
+#                   maxJumps(list(int))
+#                       Use:    The maximum jumps to be compared
+#                   numOfGenerations(int)
+#                       Use:    The generations run by the GA on each board
+#                   backend(string)
+#                       Use:    The population backend of the GA
+#                   populationCap(int)
+#                       Use:    The largest population of the GA
+#                   naiveLimit(int)
+#                       Use:    runDPNaive is skipped once numOfTiles * maxJump is
+#                               larger than this
+# Returns:          A list of dictionaries, one per board length and maximum jump
+# Description:      Times GA_JumpIt.DP_JumpItK against runDPNaive, whose costs must
+#                   match, and the generations of the GA with the maxJump of the
+#                   board, which should all take about as long whatever maxJump is.
+#                   The per-generation figures leave out the initial population
+#--------------------------------------------------------------------------------------
+def compareMaxJumps(sizes, maxJumps=(2, 4, 16, 64, 256), numOfGenerations=20, backend="list", populationCap=100, naiveLimit=10 ** 7):
+    results = []
+    for numOfTiles in sizes:
+        board = randomBoard(numOfTiles)
+        for maxJump in maxJumps:
+            (dpCost, path), dpSeconds = timeCall(lambda: GA_JumpIt.DP_JumpItK(board, maxJump), 3, False)[:2]
+            naiveSeconds = None
+            if numOfTiles * maxJump <= naiveLimit:
+                naiveCost, naiveSeconds = timeCall(lambda: runDPNaive(board, maxJump), 1, False)[:2]
+                if naiveCost != dpCost:
+                    raise RuntimeError("DP_JumpItK disagrees with runDPNaive on %d tiles with maxJump %d" % (numOfTiles, maxJump))
+
+            recorder = GA_JumpIt.GenerationRecorder()
+            solver = GA_JumpIt.GASolver(board, backend=backend, seed=0, recorder=recorder, maxJump=maxJump,
+                                        populationSize=min(3 * numOfTiles, populationCap))
+            solver.begin()
+            for generation in range(0, numOfGenerations):
+                solver.evolve()
+            rows = recorder.rows[1:]
+            results.append({
+                "numOfTiles": numOfTiles,
+                "maxJump": maxJump,
+                "dpSeconds": dpSeconds,
+                "naiveDPSeconds": naiveSeconds,
+                "generationSeconds": sum(row["seconds"] for row in rows) / len(rows),
+                "dpMinCost": dpCost,
+                "gaMinCost": solver.minCost,
+            })
+    return results
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    compareEncodings
+# Parameters:       sizes(list(int))
+#                       Use:    The lengths of the random boards
+#                   numOfGenerations(int)
+#                       Use:    The generations run on each board
+#                   populationCap(int)
+#                       Use:    The largest population of the GA
+# Returns:          A list of dictionaries, one per board length and configuration
+# Description:      Runs the GA for a fixed number of generations with the binary
+#                   encoding in both crossoverModes and with the "steps" encoding,
+#                   from the same seed. Throughput is the time per generation and of
+#                   its "crossover" and "mutate" phases, leaving out the initial
+#                   population. Convergence is the best cost after every tenth of
+#                   the generations, and the final gap to the optimal cost
+#--------------------------------------------------------------------------------------
+def compareEncodings(sizes, numOfGenerations=200, populationCap=300):
+    results = []
+    for numOfTiles in sizes:
+        board = randomBoard(numOfTiles)
+        optimalCost = runDP(board)
+        for encoding, crossoverMode in (("binary", "direct"), ("binary", "retry"), ("steps", "direct")):
+            recorder = GA_JumpIt.GenerationRecorder()
+            solver = GA_JumpIt.GASolver(board, seed=0, recorder=recorder, encoding=encoding, crossoverMode=crossoverMode,
+                                        populationSize=min(3 * numOfTiles, populationCap))
+            solver.begin()
+            for generation in range(0, numOfGenerations):
+                solver.evolve()
+            rows = recorder.rows[1:]
+            results.append({
+                "numOfTiles": numOfTiles,
+                "encoding": encoding,
+                "crossoverMode": crossoverMode if encoding == "binary" else None,
+                "generationSeconds": sum(row["seconds"] for row in rows) / len(rows),
+                "crossoverSeconds": sum(row["crossover"] for row in rows) / len(rows),
+                "mutateSeconds": sum(row["mutate"] for row in rows) / len(rows),
+                "wastedAttempts": sum(row["wastedAttempts"] for row in rows),
+                "bestCosts": [row["bestCost"] for row in rows[numOfGenerations // 10 - 1::max(1, numOfGenerations // 10)]],
+                "optimalityGap": (solver.minCost - optimalCost) / optimalCost if optimalCost else 0.0,
+            })
+    return results
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    runKernelConformance
+# Parameters:       sizes(list(int))
+#                       Use:    The lengths of the random boards
+#                   numOfGenerations(int)
+#                       Use:    The generations run by the GA on each board
+#                   maxJumps(list(int))
+#                       Use:    The maximum jumps the GA is run with
+# Returns:          A dictionary with the GA_JumpIt.kernelBackend of this process and
+#                   the results of every run
+# Description:      The runs compareKernels makes in each of its processes: the DP of
+#                   every board, and the GA with the "numpy" backend (the one the
+#                   kernels are used by) in both crossoverModes from a fixed seed
+#--------------------------------------------------------------------------------------
+def runKernelConformance(sizes, numOfGenerations=50, maxJumps=(2, 3)):
+    runs = []
+    for numOfTiles in sizes:
+        board = randomBoard(numOfTiles)
+        dpCost, dpSeconds = timeCall(lambda: runDP(board), 3, False)[:2]
+        runs.append({"numOfTiles": numOfTiles, "solver": "DP_JumpIt", "minCost": dpCost, "path": GA_JumpIt.DP_path[:], "seconds": dpSeconds})
+        for maxJump in maxJumps:
+            for crossoverMode in ("direct", "retry"):
+                solver = GA_JumpIt.GASolver(board, backend="numpy", seed=0, maxJump=maxJump, crossoverMode=crossoverMode,
+                                            populationSize=min(3 * numOfTiles, 100), maxGenerations=numOfGenerations)
+                seconds = timeCall(solver.solve, 1, False)[1]
+                runs.append({
+                    "numOfTiles": numOfTiles,
+                    "solver": "GASolver",
+                    "maxJump": maxJump,
+                    "crossoverMode": crossoverMode,
+                    "minCost": solver.minCost,
+                    "path": solver.getPath(),
+                    "numOfEvaluations": solver.numOfEvaluations,
+                    "numOfMutations": solver.numOfMutations,
+                    "seconds": seconds,
+                })
+    return {"kernelBackend": GA_JumpIt.kernelBackend, "runs": runs}
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    compareKernels
+# Parameters:       sizes(list(int))
+#                       Use:    The lengths of the random boards
+#                   numOfGenerations(int)
+#                       Use:    The generations run by the GA on each board
+# Returns:          A dictionary with the import time, kernel backend and runs of
+#                   each setting of GA_JUMPIT_KERNELS, or with the reason it
+#                   "skipped" the runs
+# Description:      Times the kernels against the pure-Python paths. The kernels are
+#                   picked when GA_JumpIt is imported, so runKernelConformance is run
+#                   in a new process with the pure-Python paths and in one with the
+#                   default kernels, whose costs and paths must match. Without numba
+#                   both processes use the pure-Python paths, which the
+#                   "kernelBackend" of each setting shows. test_kernels.py checks the
+#                   kernels whether or not numba is installed. Without numpy there
+#                   are no kernels to time, so the runs are skipped
+#--------------------------------------------------------------------------------------
+def compareKernels(sizes, numOfGenerations=50):
+    if GA_JumpIt.np is None:
+        return {"skipped": "the kernels require numpy"}
+
+    directory = os.path.dirname(os.path.abspath(__file__))
+    report = {}
+    for setting in ("python", "default"):
+        environment = dict(os.environ)
+        environment.pop("GA_JUMPIT_KERNELS", None)
+        if setting == "python":
+            environment["GA_JUMPIT_KERNELS"] = "python"
+        importSeconds = min(timeCall(lambda: subprocess.run([sys.executable, "-c", "import GA_JumpIt"], cwd=directory, env=environment, check=True), 1, False)[1]
+                            for repeat in range(0, 5))
+        command = [sys.executable, os.path.abspath(__file__), "--kernel-run", "--sizes"] + [str(size) for size in sizes]
+        output = subprocess.run(command, cwd=directory, env=environment, check=True, capture_output=True, text=True).stdout
+        report[setting] = dict(json.loads(output), importSeconds=importSeconds)
+
+    for pythonRun, defaultRun in zip(report["python"]["runs"], report["default"]["runs"]):
+        if {key: value for key, value in pythonRun.items() if key != "seconds"} != {key: value for key, value in defaultRun.items() if key != "seconds"}:
+            raise RuntimeError("the %s kernels disagree with the pure-Python paths on %d tiles" % (report["default"]["kernelBackend"], pythonRun["numOfTiles"]))
+    return report
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    printAllocations
+# Parameters:       N/A
+# Returns:          N/A
+# Description:      Runs the allocation benchmark for a few board sizes and backends,
+#                   then checkAllocations for every backend. Raises RuntimeError when
+#                   the generations of the default "list" backend are not
+#                   allocation-free
+#--------------------------------------------------------------------------------------
+def printAllocations():
+    backends = ["list", "packed"]
+    if GA_JumpIt.np is not None:
+        backends.append("numpy")
+
+    print("tiles   backend  peak bytes/gen  net blocks  genome bytes  population bytes")
+    for numOfTiles in (100, 400):
+        for backend in backends:
+            result = measureAllocations(randomBoard(numOfTiles), backend=backend, seed=0)
+            print("%-7d %-8s %14d  %10d  %12d  %16d" % (numOfTiles, backend, result["peakBytes"], result["netBlocks"], result["genomeBytes"], result["populationBytes"]))
+
+    print()
+    print("backend  peak growth 400 -> 1600 tiles  allocation-free")
+    isDefaultFree = True
+    for backend in backends:
+        report = checkAllocations(400, backend=backend)
+        print("%-8s %29d  %s" % (backend, report["growthBytes"], "yes" if report["allocationFree"] else "no"))
+        if backend == "list":
+            isDefaultFree = report["allocationFree"]
+    if not isDefaultFree:
+        raise RuntimeError("the generations of the \"list\" backend allocate memory that grows with the board")
+    return
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    main
+# Parameters:       argv(list(string))
+#                       Use:    The command line arguments, sys.argv[1:] when None
+# Returns:          N/A
+# Description:      Runs the GA vs DP suite, or the warm start comparison with
+#                   --warm-start, and writes its results as JSON to the output file
+#                   (or to stdout). Prints the allocation table with --allocations
+#--------------------------------------------------------------------------------------
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks the GA against the DP on random boards")
+    parser.add_argument("--allocations", action="store_true", help="print the per-generation allocation table instead")
+    parser.add_argument("--warm-start", action="store_true", help="compare the warm start strategies against the random initializer instead")
+    parser.add_argument("--islands", action="store_true", help="compare solveIslands against a single population under the same wall-clock budget instead")
+    parser.add_argument("--checkpoint", action="store_true", help="time the checkpoints of the GA instead")
+    parser.add_argument("--mutation", action="store_true", help="compare the mutation modes of the GA instead")
+    parser.add_argument("--resolve", action="store_true", help="time the incremental re-solve of edited boards instead")
+    parser.add_argument("--max-jump", action="store_true", help="time the DP and the GA for several maximum jumps instead")
+    parser.add_argument("--encoding", action="store_true", help="compare the throughput and convergence of the chromosome encodings instead")
+    parser.add_argument("--kernels", action="store_true", help="check that the compiled kernels give the same costs and paths as the pure-Python paths, and time both, instead")
+    parser.add_argument("--kernel-run", action="store_true", help="make the runs of --kernels in this process only")
+    parser.add_argument("--max-seconds", type=float, default=2.0, help="the wall-clock budget of every run of --islands")
+    parser.add_argument("--sizes", type=int, nargs="+", help="board lengths (10 to 100000 for the suite, 30 and 100 for --warm-start, 200 and 1000 for --islands, 100 to 3000 for --checkpoint and --mutation, 1000 to 100000 for --resolve, 1000 and 10000 for --max-jump, 100 and 1000 for --encoding and --kernels)")
+    parser.add_argument("--ga-max-tiles", type=int, default=10000, help="only the DPs are run on longer boards")
+    parser.add_argument("--backend", default="list", choices=["list", "numpy", "packed"])
+    parser.add_argument("--population-cap", type=int, default=100)
+    parser.add_argument("--generation-cap", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--no-memory", action="store_true", help="skip the traced runs that measure peak memory")
+    parser.add_argument("--output", default="-", help="the JSON file to write, - for stdout")
+    arguments = parser.parse_args(argv)
+
+    if arguments.allocations:
+        printAllocations()
+        return
+
+    if arguments.kernel_run:
+        report = runKernelConformance(arguments.sizes or [100, 1000])
+    elif arguments.kernels:
+        report = compareKernels(arguments.sizes or [100, 1000])
+    elif arguments.warm_start:
+        report = compareWarmStarts(arguments.sizes or [30, 100], backend=arguments.backend)
+    elif arguments.encoding:
+        report = compareEncodings(arguments.sizes or [100, 1000], populationCap=arguments.population_cap)
+    elif arguments.max_jump:
+        report = compareMaxJumps(arguments.sizes or [1000, 10000], backend=arguments.backend, populationCap=arguments.population_cap)
+    elif arguments.resolve:
+        report = benchmarkResolve(arguments.sizes or [1000, 10000, 100000], backend=arguments.backend, populationCap=arguments.population_cap)
+    elif arguments.mutation:
+        report = compareMutationModes(arguments.sizes or [100, 1000, 3000], backend=arguments.backend)
+    elif arguments.checkpoint:
+        report = benchmarkCheckpoints(arguments.sizes or [100, 1000, 3000], backend=arguments.backend)
+    elif arguments.islands:
+        report = compareIslands(arguments.sizes or [200, 1000], maxSeconds=arguments.max_seconds, backend=arguments.backend)
+    else:
+        report = runSuite(arguments.sizes or [10, 100, 1000, 10000, 100000], arguments.ga_max_tiles, arguments.seed,
+                          backend=arguments.backend,
+                          populationCap=arguments.population_cap,
+                          generationCap=arguments.generation_cap,
+                          measureMemory=not arguments.no_memory)
+    if arguments.output == "-":
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        with open(arguments.output, "w") as file:
+            json.dump(report, file, indent=2)
+            file.write("\n")
+    return
+
+if __name__ == "__main__":
+    main()
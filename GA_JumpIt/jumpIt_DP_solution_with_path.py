@@ -44,18 +44,18 @@ def displayPath(board):
 
     
 def main():
-    f = open("input1.txt", "r") #input.txt
     global cost, path
-    for line in f:
-        lyst = line.split() # tokenize input line, it also removes EOL marker
-        lyst = list(map(int, lyst))
-        cost = [0] * len(lyst) #create the cache table
-        path = cost[:] # create a table for path that is identical to path
-        min_cost = jumpIt(lyst)
-        print("game board:", lyst)
-        print("cost: ", min_cost)
-        displayPath(lyst)
-        print("___________________________")
+    with open("input1.txt", "r") as f: #input.txt
+        for line in f:
+            lyst = line.split() # tokenize input line, it also removes EOL marker
+            lyst = list(map(int, lyst))
+            cost = [0] * len(lyst) #create the cache table
+            path = cost[:] # create a table for path that is identical to path
+            min_cost = jumpIt(lyst)
+            print("game board:", lyst)
+            print("cost: ", min_cost)
+            displayPath(lyst)
+            print("___________________________")
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+
+# INFORMATION--------------------------------------------------------------------------
+# PURPOSE:          The conformance test of the kernels of GA_JumpIt. The DP and the
+#                   "numpy" backend GA are run from fixed seeds with the pure-Python
+#                   paths, with the uncompiled kernels forced into compiledKernels,
+#                   and with the numba-compiled kernels when numba is installed. The
+#                   costs and paths of every run must match
+#--------------------------------------------------------------------------------------
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# IMPORTS------------------------------------------------------------------------------
+import random
+import unittest
+import unittest.mock
+
+import GA_JumpIt
+#--------------------------------------------------------------------------------------
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    runConformance
+# Parameters:       kernels(dictionary)
+#                       Use:    Put in compiledKernels for the runs, empty for the
+#                               pure-Python paths
+# Returns:          A list with the DP result of every board and the GA result of
+#                   every board, maxJump, crossoverMode and mutationMode
+#--------------------------------------------------------------------------------------
+def runConformance(kernels):
+    randomGenerator = random.Random(0)
+    runs = []
+    with unittest.mock.patch.dict(GA_JumpIt.compiledKernels, kernels, clear=True):
+        for numOfTiles in (3, 10, 60, 200):
+            board = [0] + [randomGenerator.randint(1, 100) for tileID in range(1, numOfTiles)]
+            GA_JumpIt.DP_cost = [0] * numOfTiles
+            GA_JumpIt.DP_path = [0] * numOfTiles
+            runs.append(("DP_JumpIt", numOfTiles, GA_JumpIt.DP_JumpIt(board), GA_JumpIt.DP_path[:]))
+            for maxJump in (2, 3, 5):
+                for crossoverMode in ("direct", "retry"):
+                    for mutationMode in ("perGene", "skip"):
+                        solver = GA_JumpIt.GASolver(board, backend="numpy", seed=0, maxJump=maxJump,
+                                                    crossoverMode=crossoverMode, mutationMode=mutationMode,
+                                                    mutationRate=0.05, populationSize=min(3 * numOfTiles, 60),
+                                                    maxGenerations=40, verifyCosts=True)
+                        solver.solve()
+                        runs.append(("GASolver", numOfTiles, maxJump, crossoverMode, mutationMode, solver.minCost,
+                                     solver.getPath(), solver.cost, solver.numOfEvaluations, solver.numOfMutations))
+    return runs
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# CLASS DESCRIPTION--------------------------------------------------------------------
+# Class Name:       KernelConformanceTest
+# Description:      Compares the runs of runConformance with each set of kernels to
+#                   the runs with the pure-Python paths
+#--------------------------------------------------------------------------------------
+@unittest.skipIf(GA_JumpIt.np is None, "the kernels require numpy")
+class KernelConformanceTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.fallbackRuns = runConformance({})
+        return
+
+    def testUncompiledKernels(self):
+        self.assertEqual(runConformance(GA_JumpIt.kernels), self.fallbackRuns)
+        return
+
+    @unittest.skipIf(GA_JumpIt.numba is None, "numba is not installed")
+    def testCompiledKernels(self):
+        self.assertEqual(runConformance(dict(GA_JumpIt.compiledKernels)), self.fallbackRuns)
+        return
+
+if __name__ == "__main__":
+    unittest.main()
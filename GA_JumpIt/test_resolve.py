@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+
+# INFORMATION--------------------------------------------------------------------------
+# PURPOSE:          The regression test of the incremental re-solving of GA_JumpIt.
+#                   Random boards are edited again and again, and the DP tables kept
+#                   up to date by DP_JumpItUpdate and resolveBoard must match the
+#                   tables of a full DP_JumpIt of the edited board. The GA of
+#                   resolveBoard must go on within its maxExtraGenerations
+#--------------------------------------------------------------------------------------
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# IMPORTS------------------------------------------------------------------------------
+import copy
+import random
+import unittest
+
+import GA_JumpIt
+#--------------------------------------------------------------------------------------
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    solveFully
+# Parameters:       board(list(int))
+#                       Use:    The game board to be solved
+# Returns:          A tuple of the minimum cost and the DP_cost and DP_path tables of
+#                   the board, from DP_JumpIt on new tables
+#--------------------------------------------------------------------------------------
+def solveFully(board):
+    GA_JumpIt.DP_cost = [0] * len(board)
+    GA_JumpIt.DP_path = [0] * len(board)
+    return GA_JumpIt.DP_JumpIt(board), GA_JumpIt.DP_cost, GA_JumpIt.DP_path
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# FUNCTION DESCRIPTION-----------------------------------------------------------------
+# Function Name:    randomChanges
+# Parameters:       randomGenerator(random.Random), board(list(int)), numOfChanges(int)
+#                       Use:    Draw numOfChanges new tiles of the board, which may
+#                               repeat an index or keep the cost of a tile
+# Returns:          A dictionary of the new costs of the changed tiles by their index
+#--------------------------------------------------------------------------------------
+def randomChanges(randomGenerator, board, numOfChanges):
+    changes = {}
+    for changeID in range(0, numOfChanges):
+        tileID = randomGenerator.randrange(0, len(board))
+        changes[tileID] = 0 if tileID == 0 else randomGenerator.randint(1, 100)
+    return changes
+
+#/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\/\
+
+# CLASS DESCRIPTION--------------------------------------------------------------------
+# Class Name:       ResolveTest
+# Description:      Compares the incremental updates to full solves of the edited
+#                   boards
+#--------------------------------------------------------------------------------------
+class ResolveTest(unittest.TestCase):
+    def testUpdateMatchesFullSolve(self):
+        randomGenerator = random.Random(0)
+        for numOfTiles in (2, 3, 10, 60, 500):
+            board = [0] + [randomGenerator.randint(1, 100) for tileID in range(1, numOfTiles)]
+            minCost, DP_cost, DP_path = solveFully(board)
+            DP_cost, DP_path = DP_cost[:], DP_path[:]
+            for editID in range(0, 40):
+                changes = randomChanges(randomGenerator, board, randomGenerator.choice((1, 2, 5, 20)))
+                for tileID, tile in changes.items():
+                    board[tileID] = tile
+                minCost = GA_JumpIt.DP_JumpItUpdate(board, changes.keys(), DP_cost, DP_path)
+                self.assertEqual((minCost, DP_cost, DP_path), solveFully(board))
+        return
+
+    def testTablesMustMatchBoard(self):
+        board = [0, 5, 3, 7]
+        with self.assertRaises(ValueError):
+            GA_JumpIt.DP_JumpItUpdate(board, [1], [0] * 3, [0] * 3)
+
+        # resolveBoard solves the board again instead
+        solver = GA_JumpIt.GASolver(board, seed=0, populationSize=4, maxGenerations=10)
+        solver.solve()
+        result = GA_JumpIt.resolveBoard(board, {1: 1}, solver, {"DP_cost": [0] * 3, "DP_path": [0] * 3})
+        self.assertEqual((result["DP_min_cost"], result["DP_cost"], result["DP_path"]), solveFully(board))
+        return
+
+    def testResolveFromCachedResult(self):
+        randomGenerator = random.Random(1)
+        board = [0] + [randomGenerator.randint(1, 100) for tileID in range(1, 40)]
+        originalBoard = board[:]
+        cache = GA_JumpIt.ResultCache()
+        GA_JumpIt.solveBoard(board, seed=3, cache=cache)
+
+        # Another board in between leaves the global tables stale, and the cache hit
+        # does not fill them
+        GA_JumpIt.solveBoard([0] + board[1:20], seed=3)
+        result = GA_JumpIt.solveBoard(board, seed=3, cache=cache)
+        self.assertEqual(cache.counters["hits"], 1)
+        cachedResult = copy.deepcopy(result)
+
+        solver = GA_JumpIt.GASolver(board, seed=3, populationSize=20, maxGenerations=60)
+        solver.solve()
+        for editID in range(0, 10):
+            changes = randomChanges(randomGenerator, board, 3)
+            generationCount = solver.generationCount
+            result = GA_JumpIt.resolveBoard(board, changes, solver, result, maxExtraGenerations=8)
+            self.assertTrue(generationCount < solver.generationCount <= generationCount + 8)
+            self.assertEqual(solver.maxGenerations, 60)
+            minCost, DP_cost, DP_path = solveFully(board)
+            self.assertEqual((result["DP_min_cost"], result["DP_cost"], result["DP_path"]), (minCost, DP_cost, DP_path))
+            self.assertEqual(solver.board, board)
+
+        # The edits did not reach the cached result of the original board
+        self.assertEqual(cache.get(GA_JumpIt.resultKey(originalBoard, 3)), cachedResult)
+        return
+
+if __name__ == "__main__":
+    unittest.main()